@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+'''Benchmark of the time taken to import dsviz.
+
+Each scenario runs in a fresh interpreter, and the best of several runs is
+reported. The eager scenario imports everything that importing dsviz used to
+import: every data structure, the drawers, Pillow and the fonts.
+
+Usage:
+    python -m benchmarks.import_benchmark [runs]
+'''
+
+
+import os
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+SCENARIOS = [
+    ('import dsviz', 'import dsviz'),
+    ('one data structure', 'import dsviz; dsviz.SinglyLinkedList'),
+    ('eager', 'import dsviz; from dsviz import *; import dsviz.drawers; '
+              'import dsviz.util.drawer_utils as util; util.get_font(); util.get_font(True)'),
+]
+
+
+def run(code, runs):
+    '''Returns the least time in seconds taken by a fresh interpreter to run
+    the code, less the time taken by an empty interpreter.'''
+    def best(source):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.check_call([sys.executable, '-c', source], cwd=ROOT)
+            times.append(time.perf_counter() - start)
+        return min(times)
+    return best(code) - best('pass')
+
+
+def main(runs=10):
+    results = [(name, run(code, runs)) for name, code in SCENARIOS]
+    eager = results[-1][1]
+    print('{:<20} {:>10} {:>10}'.format('scenario', 'ms', 'saved'))
+    for name, seconds in results:
+        print('{:<20} {:>10.1f} {:>9.0f}%'.format(name, seconds * 1000, 100 * (1 - seconds / eager)))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
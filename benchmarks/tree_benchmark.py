@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+'''Benchmark of the red-black tree against the AVL tree on mixed workloads.
+
+Each workload is a random sequence of inserts, deletes and searches in the
+given proportions. The script reports the time taken by each tree and the
+number of rotations it performed.
+
+Usage:
+    python -m benchmarks.tree_benchmark [operations]
+'''
+
+
+import random
+import sys
+import time
+
+from dsviz import AVLTree, RedBlackTree
+
+
+WORKLOADS = [
+    ('write heavy', 0.45, 0.45),
+    ('balanced', 0.25, 0.25),
+    ('read heavy', 0.05, 0.05),
+]
+
+
+def make_operations(count, inserts, deletes, seed=0):
+    '''Returns a list of (operation, value) pairs for a workload.'''
+    rng = random.Random(seed)
+    operations = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < inserts:
+            operation = 'insert'
+        elif roll < inserts + deletes:
+            operation = 'delete'
+        else:
+            operation = 'search'
+        operations.append((operation, rng.randint(0, count)))
+    return operations
+
+
+def count_rotations(tree):
+    '''Wraps the rotations of a tree so that they are counted.'''
+    counts = [0]
+    for name in ['_rotate_left', '_rotate_right']:
+        rotate = getattr(tree, name)
+        def counted(node, rotate=rotate):
+            counts[0] += 1
+            return rotate(node)
+        setattr(tree, name, counted)
+    return counts
+
+
+def run(tree_type, operations):
+    '''Runs the operations on a new tree of the given type.
+
+    Returns:
+        A 2-tuple of the seconds taken and the number of rotations.
+    '''
+    tree = tree_type('benchmark', int, None)
+    rotations = count_rotations(tree)
+    methods = {name: getattr(tree, name) for name in ['insert', 'delete', 'search']}
+    start = time.perf_counter()
+    for operation, value in operations:
+        methods[operation](value)
+    return time.perf_counter() - start, rotations[0]
+
+
+def main(count=100000):
+    print('{:<12} {:<14} {:>10} {:>10}'.format('workload', 'tree', 'seconds', 'rotations'))
+    for name, inserts, deletes in WORKLOADS:
+        operations = make_operations(count, inserts, deletes)
+        for tree_type in [AVLTree, RedBlackTree]:
+            seconds, rotations = run(tree_type, operations)
+            print('{:<12} {:<14} {:>10.3f} {:>10}'.format(name, tree_type.__name__, seconds, rotations))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1,4 +1,18 @@
 import os
 PROJECT_ROOT = os.path.realpath(os.path.dirname(__file__))
 
-from dsviz.data_structures import *
+import dsviz.data_structures as _data_structures
+
+__all__ = ['PROJECT_ROOT'] + _data_structures.__all__
+
+
+def __getattr__(name):
+    '''Imports a data structure when it is first accessed as dsviz.<name>.'''
+    if name in _data_structures.MODULES:
+        return getattr(_data_structures, name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    '''Lists the data structures along with the module's own attributes.'''
+    return sorted(set(globals()) | set(__all__))
@@ -2,30 +2,79 @@
 
 
 import abc
+import contextlib
 import six
 
 
 @six.add_metaclass(abc.ABCMeta)
 class DataStructure(object):
-    '''The base class for all dsviz data structures.'''
+    '''The base class for all dsviz data structures.
 
-    def __init__(self, name, data_type, max_size):
+    Mutators check the type of every item and the max size limit. Bulk
+    operations run these checks once per batch. A trusted data structure skips
+    them entirely, which is meant for hot loops over data that is known to be
+    valid.
+    '''
+
+    def __init__(self, name, data_type, max_size, size_limit=None):
         '''Constructor for a data structure.
 
         Args:
             name: An identifier for the data structure.
             data_type: The type of data that the data structure will store.
-            max_size: The upper limit for the size of the data structure.
+            max_size: The upper limit for the size of the data structure. If
+                None, the data structure is unbounded and may grow without
+                limit.
+            size_limit: An optional cap for max_size. It is also the number of
+                items that will be drawn when rendering an unbounded data
+                structure.
 
         Raises:
             IndexError: If the max size paramater is non-positive.
         '''
-        if max_size < 1:
-            raise IndexError('Max size parameter must be non-positive.')
+        if max_size is not None:
+            if max_size < 1:
+                raise IndexError('Max size parameter must be non-positive.')
+            if size_limit is not None:
+                max_size = min(max_size, size_limit)
 
         self.name = name
         self.data_type = data_type
         self.max_size = max_size
+        self.render_limit = size_limit
+        self.trusted = False
+
+    def is_unbounded(self):
+        '''Returns true if the data structure has no upper limit for its size.'''
+        return self.max_size is None
+
+    @contextlib.contextmanager
+    def unchecked(self):
+        '''A context manager that makes the data structure trusted while it is
+        active. Items of invalid type or beyond the max size limit are then not
+        detected, so the caller must guarantee that they do not occur.
+        '''
+        trusted = self.trusted
+        self.trusted = True
+        try:
+            yield self
+        finally:
+            self.trusted = trusted
+
+    def _check_types(self, items, action='inserted'):
+        '''Helper method that checks the types of a batch of items at once.
+
+        Raises:
+            TypeError: If the type of an item is not supported by the data
+                structure.
+        '''
+        if not self.trusted and not set(map(type, items)) <= {self.data_type}:
+            raise TypeError('The item being {} is of invalid type.'.format(action))
+
+    def _has_room(self, count):
+        '''Helper method that returns true if count more items fit within the
+        max size limit.'''
+        return self.trusted or self.max_size is None or len(self) + count <= self.max_size
 
     @abc.abstractmethod
     def render(self, path, description=''):
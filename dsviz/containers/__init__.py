@@ -0,0 +1,4 @@
+from dsviz.containers.array_tree import ArrayTree, ArrayTreeNode
+from dsviz.containers.node_index import NodeIndex
+from dsviz.containers.ring_buffer import RingBuffer
+from dsviz.containers.sprite_cache import SpriteCache
@@ -0,0 +1,483 @@
+'''Binary search tree stored in parallel arrays.'''
+
+
+from array import array
+
+import dsviz.containers.typed_storage as storage
+import dsviz.util.tree_utils as tree_utils
+
+
+NIL = -1
+
+
+class ArrayTreeNode(object):
+    '''A read-only view of a node of an array tree. It offers the same getters
+    as a binary search tree node, so that array trees can be walked like node
+    based trees.'''
+
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        '''Constructor for an array tree node view.
+
+        Args:
+            tree: The array tree holding the node.
+            index: The index of the node in the tree's arrays.
+        '''
+        self.tree = tree
+        self.index = index
+
+    def _view(self, index):
+        '''Helper method that returns a view of another node of the tree.'''
+        if index == NIL:
+            return None
+        return ArrayTreeNode(self.tree, index)
+
+    def get_data(self):
+        '''Getter for the node's data.'''
+        return self.tree.keys[self.index]
+
+    def get_left(self):
+        '''Getter for the node's left child.'''
+        return self._view(self.tree.left[self.index])
+
+    def get_right(self):
+        '''Getter for the node's right child.'''
+        return self._view(self.tree.right[self.index])
+
+    def get_height(self):
+        '''Getter for the node's height.'''
+        return self.tree.heights[self.index]
+
+    def get_size(self):
+        '''Getter for the node's subtree size.'''
+        return self.tree.sizes[self.index]
+
+    def __eq__(self, other):
+        '''Returns true if both views refer to the same node.'''
+        return (isinstance(other, ArrayTreeNode)
+                and self.tree is other.tree and self.index == other.index)
+
+    def __hash__(self):
+        '''Returns a hash of the node's position.'''
+        return hash((id(self.tree), self.index))
+
+    def __str__(self):
+        '''Returns a string representing the node's data.'''
+        return str(self.get_data())
+
+
+class ArrayTree(object):
+    '''A binary search tree whose nodes are stored in parallel arrays. Node i
+    has the key keys[i], the children left[i] and right[i], the height
+    heights[i] and the subtree size sizes[i]. Missing children are NIL. The
+    slots of deleted nodes are chained through the left array and reused by
+    later inserts.
+
+    Array trees are copied by copying their arrays, and pickle as a handful of
+    flat buffers.
+    '''
+
+    def __init__(self, data_type, balanced=True):
+        '''Constructor for an array tree.
+
+        Args:
+            data_type: The type of data that the tree will store. Numeric keys
+                are stored in a typed array.
+            balanced: A boolean that if true will keep the tree AVL balanced.
+        '''
+        self.data_type = data_type
+        self.balanced = balanced
+        self.keys = storage.new_storage(data_type)
+        self.left = array('i')
+        self.right = array('i')
+        self.heights = array('i')
+        self.sizes = array('i')
+        self.root = NIL
+        self.size = 0
+        self._free = NIL
+
+    def load(self, keys):
+        '''Replaces the contents of the tree with a perfectly balanced tree of
+        the given keys.
+
+        Args:
+            keys: A list of keys in sorted order.
+        '''
+        root, left, right, heights, sizes = tree_utils.balanced_layout(len(keys))
+        self.keys = storage.new_storage(self.data_type)
+        try:
+            self.keys.extend(keys)
+        except OverflowError:
+            self.keys = list(keys)
+        self.left = array('i', left)
+        self.right = array('i', right)
+        self.heights = array('i', heights)
+        self.sizes = array('i', sizes)
+        self.root = root
+        self.size = len(keys)
+        self._free = NIL
+
+    def _new_node(self, key):
+        '''Helper method that stores a key in a free slot and returns its
+        index.'''
+        index = self._free
+        if index == NIL:
+            index = len(self.left)
+            try:
+                self.keys.append(key)
+            except OverflowError:
+                self.keys = list(self.keys)
+                self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.heights.append(1)
+            self.sizes.append(1)
+            return index
+
+        self._free = self.left[index]
+        try:
+            self.keys[index] = key
+        except OverflowError:
+            self.keys = list(self.keys)
+            self.keys[index] = key
+        self.left[index] = NIL
+        self.right[index] = NIL
+        self.heights[index] = 1
+        self.sizes[index] = 1
+        return index
+
+    def _free_node(self, index):
+        '''Helper method that returns the slot of a node to the free chain.'''
+        if not storage.is_compact(self.keys):
+            self.keys[index] = None
+        self.left[index] = self._free
+        self.right[index] = NIL
+        self._free = index
+
+    def _height(self, index):
+        '''Helper method for returning the height of a node.'''
+        if index == NIL:
+            return 0
+        return self.heights[index]
+
+    def _size(self, index):
+        '''Helper method for returning the subtree size of a node.'''
+        if index == NIL:
+            return 0
+        return self.sizes[index]
+
+    def _update_height(self, index):
+        '''Helper method that recomputes the height of a node from its
+        children.'''
+        left_height = self._height(self.left[index])
+        right_height = self._height(self.right[index])
+        self.heights[index] = 1 + (left_height if left_height > right_height else right_height)
+
+    def _update(self, index):
+        '''Helper method that recomputes the height and subtree size of a node
+        from its children.'''
+        self._update_height(index)
+        self.sizes[index] = 1 + self._size(self.left[index]) + self._size(self.right[index])
+
+    def _rotate_left(self, z):
+        '''Helper method for rotating a subtree left.'''
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def _rotate_right(self, z):
+        '''Helper method for rotating a subtree right.'''
+        y = self.left[z]
+        self.left[z] = self.right[y]
+        self.right[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def _balance(self, index):
+        '''Helper method that restores the AVL property of a subtree.
+
+        Returns:
+            The index of the new root of the subtree.
+        '''
+        left, right = self.left, self.right
+        balance = self._height(left[index]) - self._height(right[index])
+        if balance > 1:
+            child = left[index]
+            if self._height(left[child]) < self._height(right[child]):
+                left[index] = self._rotate_left(child)
+            return self._rotate_right(index)
+        if balance < -1:
+            child = right[index]
+            if self._height(right[child]) < self._height(left[child]):
+                right[index] = self._rotate_right(child)
+            return self._rotate_left(index)
+        self._update_height(index)
+        return index
+
+    def _replace_child(self, parent, old, new):
+        '''Helper method that replaces a child of a node, or the root if the
+        node is NIL.'''
+        if parent == NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _rebalance(self, path):
+        '''Helper method that rebalances the nodes on a path from the root,
+        bottom-up. It stops once a subtree keeps both its root and height.'''
+        for depth in range(len(path) - 1, -1, -1):
+            index = path[depth]
+            old_height = self.heights[index]
+            new_root = self._balance(index)
+            if new_root != index:
+                parent = path[depth - 1] if depth > 0 else NIL
+                self._replace_child(parent, index, new_root)
+            elif self.heights[index] == old_height:
+                break
+
+    def insert(self, key):
+        '''Inserts a key to the tree. Duplicate keys are inserted to the right.
+
+        Args:
+            key: The key to be inserted.
+        '''
+        keys, left, right, sizes = self.keys, self.left, self.right, self.sizes
+        path = []
+        index = self.root
+        while index != NIL:
+            path.append(index)
+            sizes[index] += 1
+            index = left[index] if key < keys[index] else right[index]
+
+        new_index = self._new_node(key)
+        if not path:
+            self.root = new_index
+        elif key < self.keys[path[-1]]:
+            self.left[path[-1]] = new_index
+        else:
+            self.right[path[-1]] = new_index
+        self.size += 1
+
+        if self.balanced:
+            self._rebalance(path)
+
+    def delete(self, key):
+        '''Deletes a key from the tree.
+
+        Args:
+            key: The key to be deleted.
+
+        Returns:
+            A boolean representing whether or not the key was found.
+        '''
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        index = self.root
+        while index != NIL and keys[index] != key:
+            path.append(index)
+            index = left[index] if key < keys[index] else right[index]
+        if index == NIL:
+            return False
+
+        ## Replace the key of a node with two children by its successor's key,
+        ## then remove the successor instead
+        if left[index] != NIL and right[index] != NIL:
+            path.append(index)
+            successor = right[index]
+            while left[successor] != NIL:
+                path.append(successor)
+                successor = left[successor]
+            self.keys[index] = self.keys[successor]
+            index = successor
+
+        sizes = self.sizes
+        for ancestor in path:
+            sizes[ancestor] -= 1
+
+        child = left[index] if left[index] != NIL else right[index]
+        self._replace_child(path[-1] if path else NIL, index, child)
+        self._free_node(index)
+        self.size -= 1
+
+        if self.balanced:
+            self._rebalance(path)
+        return True
+
+    def search(self, key):
+        '''Returns true if the key is in the tree.
+
+        Args:
+            key: The key being searched for.
+        '''
+        keys, left, right = self.keys, self.left, self.right
+        index = self.root
+        while index != NIL:
+            node_key = keys[index]
+            if node_key == key:
+                return True
+            index = left[index] if key < node_key else right[index]
+        return False
+
+    def select(self, rank):
+        '''Returns the key with the given rank, the number of keys before it in
+        sorted order.
+
+        Args:
+            rank: The rank of the key, between 0 and the size of the tree.
+
+        Raises:
+            IndexError: If the rank is out of range.
+        '''
+        if not 0 <= rank < self.size:
+            raise IndexError('The rank is out of range.')
+        keys, left, right = self.keys, self.left, self.right
+        index = self.root
+        while True:
+            left_size = self._size(left[index])
+            if rank < left_size:
+                index = left[index]
+            elif rank == left_size:
+                return keys[index]
+            else:
+                rank -= left_size + 1
+                index = right[index]
+
+    def rank(self, key):
+        '''Returns the number of keys in the tree that are less than a key.
+
+        Args:
+            key: The key being ranked. It does not need to be in the tree.
+        '''
+        keys, left, right = self.keys, self.left, self.right
+        rank = 0
+        index = self.root
+        while index != NIL:
+            if keys[index] < key:
+                rank += self._size(left[index]) + 1
+                index = right[index]
+            else:
+                index = left[index]
+        return rank
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        '''A generator that yields the keys of the tree between two bounds in
+        order, in O(height + k) for k yielded keys.
+
+        Args:
+            minimum: The lower bound, or None for no lower bound.
+            maximum: The upper bound, or None for no upper bound.
+            inclusive: A pair of booleans that if true will include keys equal
+                to the lower and upper bound respectively.
+            reverse: A boolean that if true will yield the keys in descending
+                order.
+        '''
+        keys = self.keys
+        low_inclusive, high_inclusive = inclusive
+
+        def above_minimum(key):
+            return minimum is None or minimum < key or (low_inclusive and minimum == key)
+
+        def below_maximum(key):
+            return maximum is None or key < maximum or (high_inclusive and key == maximum)
+
+        if reverse:
+            first, second = self.right, self.left
+            after_start, before_stop = below_maximum, above_minimum
+        else:
+            first, second = self.left, self.right
+            after_start, before_stop = above_minimum, below_maximum
+        stack = []
+        index = self.root
+        while stack or index != NIL:
+            while index != NIL:
+                if after_start(keys[index]):
+                    stack.append(index)
+                    index = first[index]
+                else:
+                    index = second[index]
+            if not stack:
+                return
+            index = stack.pop()
+            if not before_stop(keys[index]):
+                return
+            yield keys[index]
+            index = second[index]
+
+    def floor(self, key):
+        '''Returns the greatest key that is less than or equal to a key, or
+        None if there is no such key.'''
+        keys, left, right = self.keys, self.left, self.right
+        result = None
+        index = self.root
+        while index != NIL:
+            node_key = keys[index]
+            if node_key == key:
+                return node_key
+            if node_key < key:
+                result = node_key
+                index = right[index]
+            else:
+                index = left[index]
+        return result
+
+    def ceiling(self, key):
+        '''Returns the least key that is greater than or equal to a key, or
+        None if there is no such key.'''
+        keys, left, right = self.keys, self.left, self.right
+        result = None
+        index = self.root
+        while index != NIL:
+            node_key = keys[index]
+            if node_key == key:
+                return node_key
+            if key < node_key:
+                result = node_key
+                index = left[index]
+            else:
+                index = right[index]
+        return result
+
+    def get_root(self):
+        '''Returns a view of the root of the tree, or None if it is empty.'''
+        if self.root == NIL:
+            return None
+        return ArrayTreeNode(self, self.root)
+
+    def copy(self):
+        '''Returns a snapshot of the tree that shares no storage with it.'''
+        tree = ArrayTree.__new__(ArrayTree)
+        tree.data_type = self.data_type
+        tree.balanced = self.balanced
+        tree.keys = self.keys[:]
+        tree.left = self.left[:]
+        tree.right = self.right[:]
+        tree.heights = self.heights[:]
+        tree.sizes = self.sizes[:]
+        tree.root = self.root
+        tree.size = self.size
+        tree._free = self._free
+        return tree
+
+    def __len__(self):
+        '''Returns the number of keys in the tree.'''
+        return self.size
+
+    def __iter__(self):
+        '''Yields the keys of the tree in order.'''
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        index = self.root
+        while stack or index != NIL:
+            while index != NIL:
+                stack.append(index)
+                index = left[index]
+            index = stack.pop()
+            yield keys[index]
+            index = right[index]
@@ -0,0 +1,44 @@
+'''Hash index from values to the nodes holding them.'''
+
+
+class NodeIndex(object):
+    '''A hash index that maps each value to the nodes holding it, so that
+    nodes can be found by value in O(1) on average. The nodes of a value are
+    kept in a dict used as an insertion ordered set.'''
+
+    def __init__(self):
+        '''Constructor for a node index.'''
+        self._nodes = {}
+
+    def add(self, node):
+        '''Adds a node to the index under its current data.'''
+        nodes = self._nodes.get(node.data)
+        if nodes is None:
+            self._nodes[node.data] = {node: None}
+        else:
+            nodes[node] = None
+
+    def remove(self, node):
+        '''Removes a node from the index. It must still hold the data it was
+        indexed under.'''
+        nodes = self._nodes[node.data]
+        del nodes[node]
+        if not nodes:
+            del self._nodes[node.data]
+
+    def get(self, value):
+        '''Returns the nodes holding a value, or an empty tuple if there are
+        none.'''
+        return self._nodes.get(value, ())
+
+    def clear(self):
+        '''Removes every node from the index.'''
+        self._nodes.clear()
+
+    def __contains__(self, value):
+        '''Returns true if a node holds the value.'''
+        return value in self._nodes
+
+    def __len__(self):
+        '''Returns the number of distinct values in the index.'''
+        return len(self._nodes)
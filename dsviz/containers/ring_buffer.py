@@ -0,0 +1,209 @@
+'''Circular buffer container.'''
+
+
+import dsviz.containers.typed_storage as storage
+
+
+class RingBuffer(object):
+    '''A circular buffer that supports constant time insertion and removal at
+    both of its ends.'''
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, capacity=None, data_type=None):
+        '''Constructor for a ring buffer.
+
+        Args:
+            capacity: An optional argument to fix the number of slots in the
+                buffer. If None, the buffer doubles its slots whenever it is
+                full.
+            data_type: An optional argument for the type of data that the
+                buffer will store. Numeric data is stored in a typed array.
+        '''
+        self.capacity = capacity
+        self.data_type = data_type
+        self._slots = self._new_slots(capacity or self.INITIAL_CAPACITY)
+        self._head = 0
+        self._tail = 0
+        self._size = 0
+
+    def _new_slots(self, count):
+        '''Helper method that allocates the storage for the buffer.'''
+        return storage.new_storage(self.data_type, count)
+
+    def _use_list_storage(self):
+        '''Helper method that moves the slots of the buffer to a list, for
+        items that do not fit in the typed array.'''
+        self.data_type = None
+        self._slots = list(self._slots)
+
+    def _store(self, index, item):
+        '''Helper method that stores an item in a slot of the buffer.'''
+        try:
+            self._slots[index] = item
+        except OverflowError:
+            self._use_list_storage()
+            self._slots[index] = item
+
+    def _clear(self, index):
+        '''Helper method that releases the item in a slot of the buffer.'''
+        if not storage.is_compact(self._slots):
+            self._slots[index] = None
+
+    def _relocate(self, count):
+        '''Helper method that moves the items of the buffer to the start of a
+        new set of slots.'''
+        slots = self._new_slots(count)
+        for i, item in enumerate(self):
+            slots[i] = item
+        self._slots = slots
+        self._head = 0
+        self._tail = self._size % count
+
+    def _grow(self):
+        '''Helper method that doubles the number of slots in the buffer.
+
+        Raises:
+            IndexError: If the buffer has a fixed capacity.
+        '''
+        if self.capacity is not None:
+            raise IndexError('The ring buffer is full.')
+
+        self._relocate(len(self._slots) * 2)
+
+    def push_back(self, item):
+        '''Inserts an item at the back of the buffer.
+
+        Args:
+            item: The item to be inserted.
+
+        Raises:
+            IndexError: If the buffer has a fixed capacity and is full.
+        '''
+        if self._size == len(self._slots):
+            self._grow()
+
+        self._store(self._tail, item)
+        self._tail = (self._tail + 1) % len(self._slots)
+        self._size += 1
+
+    def push_front(self, item):
+        '''Inserts an item at the front of the buffer.
+
+        Args:
+            item: The item to be inserted.
+
+        Raises:
+            IndexError: If the buffer has a fixed capacity and is full.
+        '''
+        if self._size == len(self._slots):
+            self._grow()
+
+        index = (self._head - 1) % len(self._slots)
+        self._store(index, item)
+        self._head = index
+        self._size += 1
+
+    def pop_front(self):
+        '''Removes the item at the front of the buffer.
+
+        Returns:
+            The item at the front of the buffer.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        '''
+        if self._size == 0:
+            raise IndexError('The ring buffer is empty.')
+
+        item = self._slots[self._head]
+        self._clear(self._head)
+        self._head = (self._head + 1) % len(self._slots)
+        self._size -= 1
+        return item
+
+    def pop_back(self):
+        '''Removes the item at the back of the buffer.
+
+        Returns:
+            The item at the back of the buffer.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        '''
+        if self._size == 0:
+            raise IndexError('The ring buffer is empty.')
+
+        self._tail = (self._tail - 1) % len(self._slots)
+        item = self._slots[self._tail]
+        self._clear(self._tail)
+        self._size -= 1
+        return item
+
+    def peek_front(self):
+        '''Returns the item at the front of the buffer without removing it.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        '''
+        if self._size == 0:
+            raise IndexError('The ring buffer is empty.')
+
+        return self._slots[self._head]
+
+    def peek_back(self):
+        '''Returns the item at the back of the buffer without removing it.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        '''
+        if self._size == 0:
+            raise IndexError('The ring buffer is empty.')
+
+        return self._slots[(self._tail - 1) % len(self._slots)]
+
+    def export(self):
+        '''Exports the items of the buffer from front to back. The items are
+        only copied if they wrap around the end of the slots.
+
+        Returns:
+            A memoryview of the buffer's typed array.
+
+        Raises:
+            TypeError: If the buffer does not store its items in a typed array.
+        '''
+        if not storage.is_compact(self._slots):
+            raise TypeError('The data is not stored in a compact buffer.')
+        if self._head + self._size > len(self._slots):
+            self._relocate(len(self._slots))
+
+        return storage.export(self._slots)[self._head:self._head + self._size]
+
+    def __getitem__(self, index):
+        '''Returns the item at the given logical index of the buffer.
+
+        Args:
+            index: The position of the item counted from the front. Negative
+                indices count from the back.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        '''
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError('Index is out of bounds.')
+
+        return self._slots[(self._head + index) % len(self._slots)]
+
+    def __len__(self):
+        '''Returns the number of items in the buffer.'''
+        return self._size
+
+    def __iter__(self):
+        '''Yields the items of the buffer from front to back.'''
+        slots = self._slots
+        count = len(slots)
+        head = self._head
+        for i in range(self._size):
+            yield slots[(head + i) % count]
@@ -0,0 +1,72 @@
+'''Bounded cache of pre-rendered image tiles.'''
+
+
+import collections
+
+
+class SpriteCache(object):
+    '''A cache of pre-rendered tiles, or sprites, keyed by what they depict.
+    Drawers paste cached tiles instead of drawing the same shapes again, and
+    the least recently used tiles are evicted once the cache is full. Hits,
+    misses and evictions are counted.'''
+
+    def __init__(self, max_size=1024):
+        '''Constructor for a sprite cache.
+
+        Args:
+            max_size: The maximum number of tiles kept.
+
+        Raises:
+            ValueError: If the max size is less than 1.
+        '''
+        if max_size < 1:
+            raise ValueError('The max size of the cache must be at least 1.')
+
+        self.max_size = max_size
+        self._tiles = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, render):
+        '''Returns the tile for a key, rendering and caching it on a miss.
+
+        Args:
+            key: A hashable description of the tile, such as a tuple of its
+                shape, size, colors and text.
+            render: A function that takes no arguments and returns the tile.
+        '''
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return tile
+
+        self.misses += 1
+        tile = self._tiles[key] = render()
+        if len(self._tiles) > self.max_size:
+            self._tiles.popitem(last=False)
+            self.evictions += 1
+        return tile
+
+    def hit_rate(self):
+        '''Returns the fraction of lookups that were hits, or 0 if there were
+        none.'''
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self):
+        '''Resets the hit, miss and eviction counters.'''
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self):
+        '''Removes every tile from the cache.'''
+        self._tiles.clear()
+
+    def __contains__(self, key):
+        '''Returns true if a tile is cached for the key.'''
+        return key in self._tiles
+
+    def __len__(self):
+        '''Returns the number of cached tiles.'''
+        return len(self._tiles)
@@ -0,0 +1,68 @@
+'''Compact typed storage for numeric data.'''
+
+
+from array import array
+
+
+## Typecodes of the array buffers used for each numeric data type. Booleans
+## are left out since a list of bools only holds references to two shared
+## objects, and an array would have to rebuild a bool on every read.
+TYPECODES = {
+    int: 'q',
+    float: 'd',
+}
+
+
+def typecode_for(data_type):
+    '''Returns the array typecode for a data type.
+
+    Args:
+        data_type: The type of data being stored.
+
+    Returns:
+        The typecode of the array buffer for the data type, or None if the data
+            type cannot be stored compactly.
+    '''
+    return TYPECODES.get(data_type)
+
+
+def new_storage(data_type, count=0):
+    '''Creates a container for items of the given data type. Numeric data is
+    stored unboxed in an array buffer, other data in a list.
+
+    Args:
+        data_type: The type of data being stored.
+        count: The number of zero-filled slots to preallocate.
+
+    Returns:
+        An array if the data type can be stored compactly, otherwise a list.
+    '''
+    typecode = typecode_for(data_type)
+    if typecode is None:
+        return [None] * count
+    return array(typecode, [0]) * count
+
+
+def is_compact(storage):
+    '''Returns true if the container stores its items in a typed buffer.'''
+    return isinstance(storage, array)
+
+
+def export(storage):
+    '''Exports the contents of a compact container without copying them.
+
+    While the returned view is held, the container cannot change its size.
+
+    Args:
+        storage: The container to be exported.
+
+    Returns:
+        A memoryview of the container's typed buffer.
+
+    Raises:
+        TypeError: If the container does not store its items in a typed
+            buffer.
+    '''
+    if not is_compact(storage):
+        raise TypeError('The data is not stored in a compact buffer.')
+    return memoryview(storage)
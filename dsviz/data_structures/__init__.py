@@ -1,40 +1,38 @@
-try:
-    from dsviz.data_structures.array_stack import ArrayStack
-except ImportError as e:
-    print(e)
-    print('Failed to import ArrayStack')
-
-try:
-    from dsviz.data_structures.avl_tree import AVLTree
-except ImportError as e:
-    print('Failed to import AVLTree')
-
-try:
-    from dsviz.data_structures.binary_heap import BinaryHeap
-except ImportError as e:
-    print('Failed to import BinaryHeap')
-
-try:
-    from dsviz.data_structures.binary_search_tree import BinarySearchTree
-except ImportError as e:
-    print('Failed to import BinarySearchTree')
-
-try:
-    from dsviz.data_structures.double_ended_queue import DoubleEndedQueue
-except ImportError as e:
-    print('Failed to import DoubleEndedQueue')
-
-try:
-    from dsviz.data_structures.doubly_linked_list import DoublyLinkedList
-except ImportError as e:
-    print('Failed to import DoublyLinkedList')
-
-try:
-    from dsviz.data_structures.single_ended_queue import SingleEndedQueue
-except ImportError as e:
-    print('Failed to import SingleEndedQueue')
-
-try:
-    from dsviz.data_structures.singly_linked_list import SinglyLinkedList
-except ImportError as e:
-    print('Failed to import SinglyLinkedList')
+'''The dsviz data structures. Each data structure is imported the first time
+it is accessed, so that importing the package stays cheap.'''
+
+
+import importlib
+
+
+## The module of each data structure
+MODULES = {
+    'ArrayStack': 'array_stack',
+    'AVLTree': 'avl_tree',
+    'BinaryHeap': 'binary_heap',
+    'BinarySearchTree': 'binary_search_tree',
+    'BTree': 'btree',
+    'DoubleEndedQueue': 'double_ended_queue',
+    'DoublyLinkedList': 'doubly_linked_list',
+    'LRUCache': 'lru_cache',
+    'RedBlackTree': 'red_black_tree',
+    'SingleEndedQueue': 'single_ended_queue',
+    'SkipList': 'skip_list',
+    'SinglyLinkedList': 'singly_linked_list',
+}
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name):
+    '''Imports a data structure when it is first accessed.'''
+    if name not in MODULES:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    module = importlib.import_module('{}.{}'.format(__name__, MODULES[name]))
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    '''Lists the data structures along with the module's own attributes.'''
+    return sorted(set(globals()) | set(__all__))
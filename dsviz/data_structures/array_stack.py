@@ -3,14 +3,15 @@
 
 from dsviz.bases import DataStructure
 from dsviz.decorators import validate_types
-from dsviz.drawers import StackDrawer
 from dsviz.iterators import StackIter
 
+import dsviz.containers.typed_storage as storage
 import dsviz.util.file_utils as util
 
 
 class ArrayStack(DataStructure):
-    '''The stack data structure. The stack uses a Python list as a container.'''
+    '''The stack data structure. The stack uses a Python list as a container,
+    or a typed array for numeric data.'''
 
     @validate_types(allowed_types={bool, int, float, str})
     def __init__(self, name, data_type, max_size=16):
@@ -20,11 +21,11 @@ class ArrayStack(DataStructure):
             name: An identifier for the stack.
             data_type: The type of data that the stack will store.
             max_size: An optional argument to determine an upper limit for the
-                size of the stack.
+                size of the stack. If None, the stack is unbounded.
         '''
-        super().__init__(name, data_type, min(max_size, 16))
+        super().__init__(name, data_type, max_size, 16)
 
-        self.stack = []
+        self.stack = storage.new_storage(data_type)
 
     def push(self, item):
         '''Pushes an item to the stack.
@@ -37,12 +38,16 @@ class ArrayStack(DataStructure):
                 the stack.
             IndexError: If the max size limit has been reached.
         '''
-        if type(item) != self.data_type:
+        if not self.trusted and type(item) != self.data_type:
             raise TypeError('The item being pushed is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the queue has been reached.')
 
-        self.stack.append(item)
+        try:
+            self.stack.append(item)
+        except OverflowError:
+            self.stack = list(self.stack)
+            self.stack.append(item)
 
     def pop(self):
         '''Pops an item from the top of the stack.
@@ -72,12 +77,27 @@ class ArrayStack(DataStructure):
 
         return self.stack[-1]
 
+    def export(self):
+        '''Exports the contents of the stack from bottom to top without
+        copying them. The stack cannot be pushed to or popped from while the
+        returned view is held.
+
+        Returns:
+            A memoryview of the stack's typed array.
+
+        Raises:
+            TypeError: If the stack does not store numeric data.
+        '''
+        return storage.export(self.stack)
+
     def render(self, path=''):
         '''Renders the current state of the stack.
 
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import StackDrawer
+
         image = StackDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -2,120 +2,228 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import ArrayTree
 from dsviz.decorators import validate_types
-from dsviz.drawers import AVLTreeDrawer
 from dsviz.iterators import TreeIter
-from dsviz.nodes import BSTNode
+from dsviz.nodes import BSTNode, NodePool
 
 import dsviz.util.file_utils as util
+import dsviz.util.tree_utils as tree_utils
 
 
 class AVLTree(DataStructure):
     '''The AVL tree data structure.'''
 
     @validate_types(allowed_types={int, float, str})
-    def __init__(self, name, data_type, max_size=32):
+    def __init__(self, name, data_type, max_size=32, compact=False):
         '''Constructor for an AVL tree.
 
         Args:
             name: An identifier for the tree.
             data_type: The type of data that the tree will store.
-            max_size: The upper limit for the size of the tree.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            compact: A boolean that if true will store the tree in parallel
+                arrays instead of nodes.
         '''
-        super().__init__(name, data_type, min(max_size, 32))
+        super().__init__(name, data_type, max_size, 32)
 
         self.root = None
         self.size = 0
+        self._pool = NodePool(BSTNode)
+        self.compact = compact
+        self._engine = ArrayTree(data_type, True) if compact else None
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=32, compact=False):
+        '''Constructs a perfectly balanced AVL tree from the items of an
+        iterable. The items are sorted once, which takes linear time if they
+        are already sorted, and the tree is then built in linear time.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            values: An iterable of the items to be inserted to the tree.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            compact: A boolean that if true will store the tree in parallel
+                arrays instead of nodes.
+
+        Returns:
+            A tree containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the tree.
+            IndexError: If there are more items than the max size limit.
+        '''
+        tree = cls(name, data_type, max_size, compact)
+        tree._load(values)
+        return tree
+
+    def _load(self, values):
+        '''Helper method that replaces the contents of the tree with a
+        perfectly balanced tree of the given items.'''
+        values = list(values)
+        self._check_types(values)
+        if not self._has_room(len(values)):
+            raise IndexError('The max size limit of the tree has been reached.')
+        values.sort()
+
+        self.size = len(values)
+        if self.compact:
+            self._engine.load(values)
+            return None
+
+        root, left, right, heights, sizes = tree_utils.balanced_layout(len(values))
+        acquire = self._pool.acquire
+        nodes = [acquire(value) for value in values]
+        nodes.append(None)
+        for node, left_child, right_child, height, size in zip(nodes, left, right, heights, sizes):
+            node.left = nodes[left_child]
+            node.right = nodes[right_child]
+            node.height = height
+            node.size = size
+            if node.left is not None:
+                node.left.parent = node
+            if node.right is not None:
+                node.right.parent = node
+        self.root = nodes[root]
 
     def get_root(self):
-        '''Getter method for the root of the tree.'''
+        '''Getter method for the root of the tree. Compact trees return a view
+        of their root node.'''
+        if self.compact:
+            return self._engine.get_root()
         return self.root
 
     def _rotate_left(self, z):
         '''Helper method for rotating a subtree left.'''
-        y = z.get_right()
-        t2 = y.get_left()
+        y = z.right
+        t2 = y.left
 
         ## Rotate left
-        y.set_left(z)
-        z.set_right(t2)
-
-        ## Update heights
-        z.set_height(
-            1 + max(self._get_height(z.get_left()),
-                self._get_height(z.get_right()))
-        )
-        y.set_height(
-            1 + max(self._get_height(y.get_left()),
-                self._get_height(y.get_right()))
-        )
+        y.left = z
+        z.right = t2
+
+        ## Update parents
+        y.parent = z.parent
+        z.parent = y
+        if t2 is not None:
+            t2.parent = z
+
+        ## Update heights and sizes
+        self._update(z)
+        self._update(y)
 
         return y
 
     def _rotate_right(self, z):
         '''Helper method for rotating a subtree right.'''
-        y = z.get_left()
-        t3 = y.get_right()
+        y = z.left
+        t3 = y.right
 
         ## Rotate right
-        y.set_right(z)
-        z.set_left(t3)
-
-        ## Update heights
-        z.set_height(
-            1 + max(self._get_height(z.get_left()),
-                self._get_height(z.get_right()))
-        )
-        y.set_height(
-            1 + max(self._get_height(y.get_left()),
-                self._get_height(y.get_right()))
-        )
+        y.right = z
+        z.left = t3
+
+        ## Update parents
+        y.parent = z.parent
+        z.parent = y
+        if t3 is not None:
+            t3.parent = z
+
+        ## Update heights and sizes
+        self._update(z)
+        self._update(y)
 
         return y
 
     def _get_height(self, node):
         '''Helper method for returning the height of a node.'''
-        if node == None:
+        if node is None:
             return 0
 
-        return node.get_height()
+        return node.height
+
+    def _update(self, node):
+        '''Helper method that recomputes the height and size of a node from its
+        children.'''
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + tree_utils.node_size(node.left) + tree_utils.node_size(node.right)
 
     def _get_balance(self, node):
         '''Helper method for returning the difference between two subtree heights.'''
-        if node == None:
+        if node is None:
             return 0
 
-        return self._get_height(node.get_left()) - self._get_height(node.get_right())
+        return self._get_height(node.left) - self._get_height(node.right)
 
-    def _insert(self, node, value):
-        '''Helper method for insert operation.'''
-        if node == None:
-            self.size += 1
-            return BSTNode(value)
-        elif value < node.get_data():
-            node.set_left(self._insert(node.get_left(), value))
+    def _replace_child(self, parent, old, new):
+        '''Helper method that replaces a child of a node, or the root if the
+        node is None.'''
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            node.set_right(self._insert(node.get_right(), value))
+            parent.right = new
 
-        node.set_height(
-            1 + max(self._get_height(node.get_left()),
-                self._get_height(node.get_right()))
-        )
+    def _balance(self, node):
+        '''Helper method that restores the balance of a subtree.
 
+        Returns:
+            The new root of the subtree.
+        '''
         balance = self._get_balance(node)
-        if balance > 1 and value < node.get_left().get_data():
-            return self._rotate_right(node)
-        if balance < -1 and value > node.get_right().get_data():
-            return self._rotate_left(node)
-        if balance > 1 and value > node.get_left().get_data():
-            node.set_left(self._rotate_left(node.get_left()))
+        if balance > 1:
+            if self._get_balance(node.left) < 0:
+                node.left = self._rotate_left(node.left)
             return self._rotate_right(node)
-        if balance < -1 and value < node.get_right().get_data():
-            node.set_right(self._rotate_right(node.get_right()))
+        if balance < -1:
+            if self._get_balance(node.right) > 0:
+                node.right = self._rotate_right(node.right)
             return self._rotate_left(node)
 
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
         return node
 
+    def _rebalance(self, path):
+        '''Helper method that rebalances the nodes on a path from the root,
+        bottom-up. It stops once a subtree keeps both its root and height, as
+        the nodes above it are then unaffected.'''
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            new_root = self._balance(node)
+            if new_root is not node:
+                parent = path[depth - 1] if depth > 0 else None
+                self._replace_child(parent, node, new_root)
+            elif node.height == old_height:
+                break
+
+    def _insert(self, value):
+        '''Helper method for insert operation.'''
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node.size += 1
+            node = node.left if value < node.data else node.right
+
+        new_node = self._pool.acquire(value)
+        if not path:
+            self.root = new_node
+        else:
+            parent = path[-1]
+            new_node.parent = parent
+            if value < parent.data:
+                parent.left = new_node
+            else:
+                parent.right = new_node
+        self.size += 1
+
+        self._rebalance(path)
 
     def insert(self, value):
         '''Inserts an item to the tree.
@@ -127,62 +235,51 @@ class AVLTree(DataStructure):
             TypeError: If the type of the item being inserted is not supported
                 by the tree.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being inserted is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
-        self.root = self._insert(self.get_root(), value)
-
-    def _min_value_node(self, node):
-        '''Helper method that returns the minimum value node in a given subtree.'''
-        curr = node
-        while curr != None and curr.get_left() != None:
-            curr = curr.get_left()
+        if self.compact:
+            self._engine.insert(value)
+            self.size += 1
+            return None
 
-        return curr
+        self._insert(value)
 
-    def _delete(self, node, value):
+    def _delete(self, value):
         '''Helper method for delete operation.'''
-        if node == None:
-            return node
-        elif value < node.get_data():
-            node.set_left(self._delete(node.get_left(), value))
-        elif value > node.get_data():
-            node.set_right(self._delete(node.get_right(), value))
-        else:
-            self.size -= 1
-            if node.get_left() == None:
-                temp = node.get_right()
-                node = None
-                return temp
-            elif node.get_right() == None:
-                temp = node.get_left()
-                node = None
-                return temp
-            temp = self._min_value_node(node.get_right())
-            node.set_data(temp.get_data())
-            node.set_right(self._delete(node.get_right(), temp.get_data()))
-
-        node.set_height(
-            1 + max(self._get_height(node.get_left()),
-                self._get_height(node.get_right()))
-        )
-
-        balance = self._get_balance(node)
-        if balance > 1 and self._get_balance(node.get_left()) >= 0:
-            return self._rotate_right(node)
-        if balance < -1 and self._get_balance(node.get_right()) >= 0:
-            return self._rotate_left(node)
-        if balance > 1 and self._get_balance() < 0:
-            node.set_left(self._rotate_left(node.get_left()))
-            return self._rotate_right(node)
-        if balance < -1 and self._get_balance() < 0:
-            node.set_right(self._rotate_right(node.get_right()))
-            return self._rotate_left(node)
-
-        return node
-
+        path = []
+        node = self.root
+        while node is not None and node.data != value:
+            path.append(node)
+            node = node.left if value < node.data else node.right
+        if node is None:
+            return None
+
+        ## Replace the value of a node with two children by its successor's
+        ## value, then remove the successor instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+
+        for ancestor in path:
+            ancestor.size -= 1
+
+        child = node.left if node.left is not None else node.right
+        parent = path[-1] if path else None
+        self._replace_child(parent, node, child)
+        if child is not None:
+            child.parent = parent
+        self._pool.release(node)
+        self.size -= 1
+
+        self._rebalance(path)
 
     def delete(self, value):
         '''Deletes an item from the tree with the given value.
@@ -194,21 +291,25 @@ class AVLTree(DataStructure):
             TypeError: If the type of the item being deleted is not supported
                 by the tree.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being deleted is of invalid type.')
 
-        self.root = self._delete(self.get_root(), value)
+        if self.compact:
+            if self._engine.delete(value):
+                self.size -= 1
+            return None
 
-    def _search(self, node, value):
-        '''Helper method for search operation.'''
-        if node == None:
-            return False
-        if node.get_data() == value:
-            return True
+        self._delete(value)
 
-        if node.get_data() < value:
-            return self._search(node.get_right(), value)
-        return self._search(node.get_left(), value)
+    def _search(self, value):
+        '''Helper method for search operation.'''
+        node = self.root
+        while node is not None:
+            data = node.data
+            if data == value:
+                return True
+            node = node.left if value < data else node.right
+        return False
 
     def search(self, value):
         '''Searches for an item in the tree.
@@ -224,10 +325,123 @@ class AVLTree(DataStructure):
             TypeError: If the type of the item being searched is not supported
                 by the tree.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being searched is of invalid type.')
 
-        return self._search(self.get_root(), value)
+        if self.compact:
+            return self._engine.search(value)
+        return self._search(value)
+
+    def select(self, rank):
+        '''Returns the item with the given rank, the number of items before it
+        in sorted order.
+
+        Args:
+            rank: The rank of the item, between 0 and the size of the tree.
+
+        Raises:
+            IndexError: If the rank is out of range.
+        '''
+        if self.compact:
+            return self._engine.select(rank)
+        if not 0 <= rank < self.size:
+            raise IndexError('The rank is out of range.')
+        return tree_utils.select(self.root, rank)
+
+    def rank(self, value):
+        '''Returns the number of items in the tree that are less than a value.
+
+        Args:
+            value: The value being ranked. It does not need to be in the tree.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being ranked is of invalid type.')
+
+        if self.compact:
+            return self._engine.rank(value)
+        return tree_utils.rank(self.root, value)
+
+    def _check_bound(self, value):
+        '''Helper method that checks the type of a range bound.'''
+        if not self.trusted and value is not None and type(value) != self.data_type:
+            raise TypeError('The bound of the range is of invalid type.')
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        '''Returns a lazy iterator over the items of the tree between two
+        bounds, in sorted order. Each query costs O(log n + k) for k items.
+
+        Args:
+            minimum: The lower bound, or None for no lower bound.
+            maximum: The upper bound, or None for no upper bound.
+            inclusive: A pair of booleans that if true will include items equal
+                to the lower and upper bound respectively.
+            reverse: A boolean that if true will iterate in descending order.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        self._check_bound(minimum)
+        self._check_bound(maximum)
+
+        if self.compact:
+            return self._engine.irange(minimum, maximum, inclusive, reverse)
+        return tree_utils.irange(self.root, minimum, maximum, inclusive, reverse)
+
+    def range(self, start, stop):
+        '''Returns a lazy iterator over the items of the tree from start up to,
+        but not including, stop.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        return self.irange(start, stop, (True, False))
+
+    def floor(self, value):
+        '''Returns the greatest item in the tree that is less than or equal to
+        a value, or None if there is no such item.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        if self.compact:
+            return self._engine.floor(value)
+        return tree_utils.floor(self.root, value)
+
+    def ceiling(self, value):
+        '''Returns the least item in the tree that is greater than or equal to
+        a value, or None if there is no such item.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        if self.compact:
+            return self._engine.ceiling(value)
+        return tree_utils.ceiling(self.root, value)
+
+    def snapshot(self):
+        '''Returns a copy of the current state of a compact tree. Only the
+        arrays holding the tree are copied.
+
+        Raises:
+            TypeError: If the tree is not compact.
+        '''
+        if not self.compact:
+            raise TypeError('Only compact trees can be snapshot.')
+
+        tree = self.__class__.__new__(self.__class__)
+        tree.__dict__.update(self.__dict__)
+        tree._pool = NodePool(BSTNode)
+        tree._engine = self._engine.copy()
+        return tree
 
     def render(self, path=''):
         '''Renders the current state of the tree.
@@ -235,6 +449,8 @@ class AVLTree(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import AVLTreeDrawer
+
         image = AVLTreeDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -248,6 +464,25 @@ class AVLTree(DataStructure):
         '''Returns the size of the tree.'''
         return self.size
 
+    def __getitem__(self, index):
+        '''Returns the item at an index of the sorted order of the tree.
+        Negative indices count from the largest item.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        if index < 0:
+            index += self.size
+        return self.select(index)
+
     def __iter__(self):
         '''Returns an iterator for the tree.'''
+        if self.compact:
+            return iter(self._engine)
         return TreeIter(self)
+
+    def __reversed__(self):
+        '''Returns an iterator over the tree in descending order.'''
+        if self.compact:
+            return self._engine.irange(reverse=True)
+        return TreeIter(self, True)
@@ -3,44 +3,105 @@
 
 from dsviz.bases import DataStructure
 from dsviz.decorators import validate_types
-from dsviz.drawers import HeapDrawer
 from dsviz.iterators import HeapIter
 
+import dsviz.containers.typed_storage as storage
 import dsviz.util.file_utils as util
+import dsviz.util.heap_utils as heap_utils
+import dsviz.util.max_heap_utils as max_heap_utils
 
+from array import array
 import heapq
 
 
 class BinaryHeap(DataStructure):
-    '''Binary heap data structure.'''
-
-    class MaxHeapComparable(object):
-        '''Comparable object for max heap implementation.'''
-
-        def __init__(self, value):
-            self.value = value
-
-        def __lt__(self, other):
-            return self.value > other.value
-
-        def __eq__(self, other):
-            return self.value == other.value
-
+    '''Binary heap data structure. Numeric max heaps store their items negated
+    in a min heap, other max heaps are ordered by max_heap_utils.'''
 
     @validate_types(allowed_types={int, float, str})
-    def __init__(self, name, data_type, max_size=32, min_heap=True):
+    def __init__(self, name, data_type, max_size=32, min_heap=True, compact=False):
         '''Constructor for a binary heap.
 
         Args:
             name: An identifier for the heap.
             data_type: The type of data that the heap will store.
-            max_size: The upper limit for the size of the heap.
+            max_size: The upper limit for the size of the heap. If None, the
+                heap is unbounded.
             min_heap: A boolean that if true will store min values.
+            compact: A boolean that if true will store numeric data in a typed
+                array. This uses far less memory, but each operation is slower
+                since the heapq module only operates on lists.
         '''
-        super().__init__(name, data_type, min(max_size, 32))
+        super().__init__(name, data_type, max_size, 32)
 
-        self.heap = []
         self.min_heap = min_heap
+        self.compact = compact and storage.typecode_for(data_type) is not None
+        self._negate = not min_heap and data_type in {int, float}
+        if self.compact:
+            self.heap = storage.new_storage(data_type)
+            self._heapq = heap_utils
+        elif min_heap or self._negate:
+            self.heap = []
+            self._heapq = heapq
+        else:
+            self.heap = []
+            self._heapq = max_heap_utils
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=32, min_heap=True, compact=False):
+        '''Constructs a binary heap from the items of an iterable in linear
+        time.
+
+        Args:
+            name: An identifier for the heap.
+            data_type: The type of data that the heap will store.
+            values: An iterable of the items to be inserted to the heap.
+            max_size: The upper limit for the size of the heap. If None, the
+                heap is unbounded.
+            min_heap: A boolean that if true will store min values.
+            compact: A boolean that if true will store numeric data in a typed
+                array.
+
+        Returns:
+            A heap containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the heap.
+            IndexError: If there are more items than the max size limit.
+        '''
+        heap = cls(name, data_type, max_size, min_heap, compact)
+        heap.insert_many(values)
+        return heap
+
+    def _wrap(self, item):
+        '''Helper method that converts an item to the entry stored in the heap.'''
+        if self._negate:
+            return -item
+        return item
+
+    def _wrap_many(self, items):
+        '''Helper method that converts a list of items to heap entries.'''
+        if self._negate:
+            return [-item for item in items]
+        return items
+
+    def _unwrap(self, entry):
+        '''Helper method that converts an entry stored in the heap to an item.'''
+        if self._negate:
+            return -entry
+        return entry
+
+    def _use_list_storage(self):
+        '''Helper method that moves the heap to a list, for items that do not
+        fit in the typed array.'''
+        self.heap = list(self.heap)
+        self._heapq = heapq
+
+    def _check_item(self, item):
+        '''Helper method that checks the type of an item being inserted.'''
+        if not self.trusted and type(item) != self.data_type:
+            raise TypeError('The item being inserted is of invalid type.')
 
     def insert(self, item):
         '''Inserts an item to the heap.
@@ -52,15 +113,49 @@ class BinaryHeap(DataStructure):
             TypeError: If the type of the item being inserted is not supported
                 by the heap.
         '''
-        if type(item) != self.data_type:
-            raise TypeError('The item being inserted is of invalid type.')
-        if len(self) == self.max_size:
+        self._check_item(item)
+        if not self._has_room(1):
+            raise IndexError('The max size limit of the heap has been reached.')
+
+        entry = self._wrap(item)
+        try:
+            self._heapq.heappush(self.heap, entry)
+        except OverflowError:
+            self._use_list_storage()
+            self._heapq.heappush(self.heap, entry)
+
+    def insert_many(self, items):
+        '''Inserts a batch of items to the heap. The types of the items are
+        checked once for the whole batch. Batches at least as large as the heap
+        are appended and heapified in linear time.
+
+        Args:
+            items: An iterable of the items being inserted to the heap.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the heap.
+            IndexError: If the items do not fit in the heap.
+        '''
+        items = list(items)
+        self._check_types(items)
+        if not self._has_room(len(items)):
             raise IndexError('The max size limit of the heap has been reached.')
 
-        if self.min_heap:
-            heapq.heappush(self.heap, item)
+        entries = self._wrap_many(items)
+        if storage.is_compact(self.heap):
+            try:
+                entries = array(self.heap.typecode, entries)
+            except OverflowError:
+                self._use_list_storage()
+
+        if len(entries) >= len(self.heap):
+            self.heap.extend(entries)
+            self._heapq.heapify(self.heap)
         else:
-            heapq.heappush(self.heap, self.MaxHeapComparable(item))
+            heappush = self._heapq.heappush
+            for entry in entries:
+                heappush(self.heap, entry)
 
     def extract(self):
         '''Extracts an item at the top of the heap.
@@ -74,10 +169,78 @@ class BinaryHeap(DataStructure):
         if self.is_empty():
             raise IndexError('The heap has no values.')
 
-        if self.min_heap:
-            return heapq.heappop(self.heap)
-        else:
-            return heapq.heappop(self.heap).value
+        return self._unwrap(self._heapq.heappop(self.heap))
+
+    def extract_many(self, count):
+        '''Extracts a batch of items from the top of the heap.
+
+        Args:
+            count: The number of items to be extracted.
+
+        Returns:
+            A list of the extracted items, in the order they were extracted.
+
+        Raises:
+            IndexError: If the heap has fewer values than requested.
+        '''
+        if count > len(self):
+            raise IndexError('The heap has fewer values than requested.')
+
+        heap, heappop = self.heap, self._heapq.heappop
+        entries = [heappop(heap) for _ in range(count)]
+        if self._negate:
+            return [-entry for entry in entries]
+        return entries
+
+    def pushpop(self, item):
+        '''Inserts an item to the heap, then extracts the item at the top of
+        the heap. This is faster than an insert followed by an extract, and
+        works even if the heap is full.
+
+        Args:
+            item: The item being inserted to the heap.
+
+        Returns:
+            The item at the top of the heap after the insertion.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the heap.
+        '''
+        self._check_item(item)
+
+        entry = self._wrap(item)
+        try:
+            return self._unwrap(self._heapq.heappushpop(self.heap, entry))
+        except OverflowError:
+            self._use_list_storage()
+            return self._unwrap(self._heapq.heappushpop(self.heap, entry))
+
+    def replace(self, item):
+        '''Extracts the item at the top of the heap, then inserts an item to
+        the heap. Unlike pushpop, the extracted item is never the inserted one.
+
+        Args:
+            item: The item being inserted to the heap.
+
+        Returns:
+            The item at the top of the heap before the insertion.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the heap.
+            IndexError: If the heap has no values.
+        '''
+        self._check_item(item)
+        if self.is_empty():
+            raise IndexError('The heap has no values.')
+
+        entry = self._wrap(item)
+        try:
+            return self._unwrap(self._heapq.heapreplace(self.heap, entry))
+        except OverflowError:
+            self._use_list_storage()
+            return self._unwrap(self._heapq.heapreplace(self.heap, entry))
 
     def peek(self):
         '''Examines the item at the top of the heap.
@@ -91,9 +254,20 @@ class BinaryHeap(DataStructure):
         if self.is_empty():
             raise IndexError('The heap has no values.')
 
-        if self.min_heap:
-            return self.heap[0]
-        return self.heap[0].value
+        return self._unwrap(self.heap[0])
+
+    def export(self):
+        '''Exports the contents of the heap in heap order without copying them.
+        Max heaps export their items negated. The heap cannot be inserted to or
+        extracted from while the returned view is held.
+
+        Returns:
+            A memoryview of the heap's typed array.
+
+        Raises:
+            TypeError: If the heap does not use compact storage.
+        '''
+        return storage.export(self.heap)
 
     def render(self, path=''):
         '''Renders the current state of the heap.
@@ -101,6 +275,8 @@ class BinaryHeap(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import HeapDrawer
+
         image = HeapDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -113,3 +289,7 @@ class BinaryHeap(DataStructure):
     def __len__(self):
         '''Returns the size of the heap.'''
         return len(self.heap)
+
+    def __iter__(self):
+        '''Returns an iterator for the heap.'''
+        return HeapIter(self)
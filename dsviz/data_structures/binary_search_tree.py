@@ -2,45 +2,119 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import ArrayTree
 from dsviz.decorators import validate_types
-from dsviz.drawers import BSTDrawer
 from dsviz.iterators import TreeIter
-from dsviz.nodes import BSTNode
+from dsviz.nodes import BSTNode, NodePool
 
 import dsviz.util.file_utils as util
+import dsviz.util.tree_utils as tree_utils
 
 
 class BinarySearchTree(DataStructure):
     '''The binary search tree data structure.'''
 
     @validate_types(allowed_types={int, float, str})
-    def __init__(self, name, data_type, max_size=32):
+    def __init__(self, name, data_type, max_size=32, compact=False):
         '''Constructor for a binary search tree.
 
         Args:
             name: An identifier for the tree.
             data_type: The type of data that the tree will store.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            compact: A boolean that if true will store the tree in parallel
+                arrays instead of nodes.
         '''
-        super().__init__(name, data_type, min(max_size, 32))
+        super().__init__(name, data_type, max_size, 32)
 
         self.root = None
         self.size = 0
+        self._pool = NodePool(BSTNode)
+        self.compact = compact
+        self._engine = ArrayTree(data_type, False) if compact else None
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=32, compact=False):
+        '''Constructs a perfectly balanced binary search tree from the items of an
+        iterable. The items are sorted once, which takes linear time if they
+        are already sorted, and the tree is then built in linear time.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            values: An iterable of the items to be inserted to the tree.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            compact: A boolean that if true will store the tree in parallel
+                arrays instead of nodes.
+
+        Returns:
+            A tree containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the tree.
+            IndexError: If there are more items than the max size limit.
+        '''
+        tree = cls(name, data_type, max_size, compact)
+        tree._load(values)
+        return tree
+
+    def _load(self, values):
+        '''Helper method that replaces the contents of the tree with a
+        perfectly balanced tree of the given items.'''
+        values = list(values)
+        self._check_types(values)
+        if not self._has_room(len(values)):
+            raise IndexError('The max size limit of the tree has been reached.')
+        values.sort()
+
+        self.size = len(values)
+        if self.compact:
+            self._engine.load(values)
+            return None
+
+        root, left, right, heights, sizes = tree_utils.balanced_layout(len(values))
+        acquire = self._pool.acquire
+        nodes = [acquire(value) for value in values]
+        nodes.append(None)
+        for node, left_child, right_child, height, size in zip(nodes, left, right, heights, sizes):
+            node.left = nodes[left_child]
+            node.right = nodes[right_child]
+            node.height = height
+            node.size = size
+            if node.left is not None:
+                node.left.parent = node
+            if node.right is not None:
+                node.right.parent = node
+        self.root = nodes[root]
 
     def get_root(self):
-        '''Getter method for the root of the tree.'''
+        '''Getter method for the root of the tree. Compact trees return a view
+        of their root node.'''
+        if self.compact:
+            return self._engine.get_root()
         return self.root
 
-    def _insert(self, node, value):
+    def _insert(self, value):
         '''Helper method for insert operation.'''
-        if node == None:
-            self.size += 1
-            return BSTNode(value)
-        elif value < node.get_data():
-            node.set_left(self._insert(node.get_left(), value))
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node.size += 1
+            node = node.left if value < node.data else node.right
+
+        new_node = self._pool.acquire(value)
+        new_node.parent = parent
+        if parent is None:
+            self.root = new_node
+        elif value < parent.data:
+            parent.left = new_node
         else:
-            node.set_right(self._insert(node.get_right(), value))
-
-        return node
+            parent.right = new_node
+        self.size += 1
 
     def insert(self, value):
         '''Inserts an item to the tree.
@@ -53,43 +127,54 @@ class BinarySearchTree(DataStructure):
                 by the tree.
             IndexError: If the max size limit has been reached.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being inserted is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
-        self.root = self._insert(self.get_root(), value)
-
-    def _min_value_node(self, node):
-        '''Helper method that returns the minimum value node in a given subtree.'''
-        curr = node
-        while curr.get_left() != None:
-            curr = curr.get_left()
+        if self.compact:
+            self._engine.insert(value)
+            self.size += 1
+            return None
 
-        return curr
+        self._insert(value)
 
-    def _delete(self, node, value):
+    def _delete(self, value):
         '''Helper method for delete operation.'''
-        if node == None:
-            return node
-        elif value < node.get_data():
-            node.set_left(self._delete(node.get_left(), value))
-        elif value > node.get_data():
-            node.set_right(self._delete(node.get_right(), value))
+        path = []
+        node = self.root
+        while node is not None and node.data != value:
+            path.append(node)
+            node = node.left if value < node.data else node.right
+        if node is None:
+            return None
+
+        ## Replace the value of a node with two children by its successor's
+        ## value, then remove the successor instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+
+        for ancestor in path:
+            ancestor.size -= 1
+
+        parent = path[-1] if path else None
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            if node.get_left() == None:
-                temp = node.get_right()
-                node = None
-                return temp
-            elif node.get_right() == None:
-                temp = node.get_left()
-                node = None
-                return temp
-            temp = self._min_value_node(node.get_right())
-            node.set_data(temp.get_data())
-            node.set_right(self._delete(node.get_right(), temp.get_data()))
-
-        return node
+            parent.right = child
+        if child is not None:
+            child.parent = parent
+        self._pool.release(node)
+        self.size -= 1
 
     def delete(self, value):
         '''Deletes an item from the tree with the given value.
@@ -101,23 +186,25 @@ class BinarySearchTree(DataStructure):
             TypeError: If the type of the item being deleted is not supported
                 by the tree.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being deleted is of invalid type.')
 
-        if self.search(value):
-            self.size -= 1
-        self.root = self._delete(self.get_root(), value)
+        if self.compact:
+            if self._engine.delete(value):
+                self.size -= 1
+            return None
 
-    def _search(self, node, value):
-        '''Helper method for search operation.'''
-        if node == None:
-            return False
-        if node.get_data() == value:
-            return True
+        self._delete(value)
 
-        if node.get_data() < value:
-            return self._search(node.get_right(), value)
-        return self._search(node.get_left(), value)
+    def _search(self, value):
+        '''Helper method for search operation.'''
+        node = self.root
+        while node is not None:
+            data = node.data
+            if data == value:
+                return True
+            node = node.left if value < data else node.right
+        return False
 
     def search(self, value):
         '''Searches for an item in the tree.
@@ -133,10 +220,123 @@ class BinarySearchTree(DataStructure):
             TypeError: If the type of the item being searched is not supported
                 by the tree.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being searched is of invalid type.')
 
-        return self._search(self.get_root(), value)
+        if self.compact:
+            return self._engine.search(value)
+        return self._search(value)
+
+    def select(self, rank):
+        '''Returns the item with the given rank, the number of items before it
+        in sorted order.
+
+        Args:
+            rank: The rank of the item, between 0 and the size of the tree.
+
+        Raises:
+            IndexError: If the rank is out of range.
+        '''
+        if self.compact:
+            return self._engine.select(rank)
+        if not 0 <= rank < self.size:
+            raise IndexError('The rank is out of range.')
+        return tree_utils.select(self.root, rank)
+
+    def rank(self, value):
+        '''Returns the number of items in the tree that are less than a value.
+
+        Args:
+            value: The value being ranked. It does not need to be in the tree.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being ranked is of invalid type.')
+
+        if self.compact:
+            return self._engine.rank(value)
+        return tree_utils.rank(self.root, value)
+
+    def _check_bound(self, value):
+        '''Helper method that checks the type of a range bound.'''
+        if not self.trusted and value is not None and type(value) != self.data_type:
+            raise TypeError('The bound of the range is of invalid type.')
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        '''Returns a lazy iterator over the items of the tree between two
+        bounds, in sorted order. Each query costs O(log n + k) for k items.
+
+        Args:
+            minimum: The lower bound, or None for no lower bound.
+            maximum: The upper bound, or None for no upper bound.
+            inclusive: A pair of booleans that if true will include items equal
+                to the lower and upper bound respectively.
+            reverse: A boolean that if true will iterate in descending order.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        self._check_bound(minimum)
+        self._check_bound(maximum)
+
+        if self.compact:
+            return self._engine.irange(minimum, maximum, inclusive, reverse)
+        return tree_utils.irange(self.root, minimum, maximum, inclusive, reverse)
+
+    def range(self, start, stop):
+        '''Returns a lazy iterator over the items of the tree from start up to,
+        but not including, stop.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        return self.irange(start, stop, (True, False))
+
+    def floor(self, value):
+        '''Returns the greatest item in the tree that is less than or equal to
+        a value, or None if there is no such item.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        if self.compact:
+            return self._engine.floor(value)
+        return tree_utils.floor(self.root, value)
+
+    def ceiling(self, value):
+        '''Returns the least item in the tree that is greater than or equal to
+        a value, or None if there is no such item.
+
+        Raises:
+            TypeError: If the type of the value is not supported by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        if self.compact:
+            return self._engine.ceiling(value)
+        return tree_utils.ceiling(self.root, value)
+
+    def snapshot(self):
+        '''Returns a copy of the current state of a compact tree. Only the
+        arrays holding the tree are copied.
+
+        Raises:
+            TypeError: If the tree is not compact.
+        '''
+        if not self.compact:
+            raise TypeError('Only compact trees can be snapshot.')
+
+        tree = self.__class__.__new__(self.__class__)
+        tree.__dict__.update(self.__dict__)
+        tree._pool = NodePool(BSTNode)
+        tree._engine = self._engine.copy()
+        return tree
 
     def render(self, path=''):
         '''Renders the current state of the tree.
@@ -144,6 +344,8 @@ class BinarySearchTree(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import BSTDrawer
+
         image = BSTDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -157,6 +359,25 @@ class BinarySearchTree(DataStructure):
         '''Returns the size of the tree.'''
         return self.size
 
+    def __getitem__(self, index):
+        '''Returns the item at an index of the sorted order of the tree.
+        Negative indices count from the largest item.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        if index < 0:
+            index += self.size
+        return self.select(index)
+
     def __iter__(self):
         '''Returns an iterator for the tree.'''
+        if self.compact:
+            return iter(self._engine)
         return TreeIter(self)
+
+    def __reversed__(self):
+        '''Returns an iterator over the tree in descending order.'''
+        if self.compact:
+            return self._engine.irange(reverse=True)
+        return TreeIter(self, True)
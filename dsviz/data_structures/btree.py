@@ -0,0 +1,362 @@
+'''B-tree data structure.'''
+
+
+from bisect import bisect_left, bisect_right
+
+from dsviz.bases import DataStructure
+from dsviz.decorators import validate_types
+from dsviz.nodes import BTreeNode
+
+import dsviz.util.file_utils as util
+
+
+def _split_evenly(items, capacity):
+    '''Helper function that splits a list into the fewest runs of at most
+    capacity items, with run lengths differing by at most one.'''
+    count = -(-len(items) // capacity)
+    size, extra = divmod(len(items), count)
+    start = 0
+    for index in range(count):
+        stop = start + size + (1 if index < extra else 0)
+        yield items[start:stop]
+        start = stop
+
+
+class BTree(DataStructure):
+    '''The B-tree data structure, in its B+ tree form. The keys are stored in
+    sorted leaves that are linked left to right, and internal nodes hold
+    separator keys that route searches. Every node holds many keys, so the tree
+    is shallow and has far fewer nodes than a binary tree of the same keys.
+    Keys are unique, so the tree behaves as an ordered set.'''
+
+    @validate_types(allowed_types={int, float, str})
+    def __init__(self, name, data_type, max_size=32, order=4):
+        '''Constructor for a B-tree.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            order: The maximum number of children of a node. Nodes hold at
+                most order - 1 keys.
+
+        Raises:
+            ValueError: If the order is less than 3.
+        '''
+        super().__init__(name, data_type, max_size, 32)
+        if order < 3:
+            raise ValueError('The order of the tree must be at least 3.')
+
+        self.order = order
+        self.max_keys = order - 1
+        self.min_keys = (order - 1) // 2
+        self.root = BTreeNode()
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=32, order=4):
+        '''Constructs a B-tree from the items of an iterable. The items are
+        sorted once, and the tree is then built bottom-up in linear time with
+        full, evenly filled nodes.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            values: An iterable of the items to be inserted to the tree.
+                Duplicate items are stored once.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+            order: The maximum number of children of a node.
+
+        Returns:
+            A tree containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the tree.
+            IndexError: If there are more items than the max size limit.
+        '''
+        tree = cls(name, data_type, max_size, order)
+        values = list(values)
+        tree._check_types(values)
+        values = sorted(set(values))
+        if not tree._has_room(len(values)):
+            raise IndexError('The max size limit of the tree has been reached.')
+        if not values:
+            return tree
+
+        ## Build the leaves, then each level of internal nodes above them,
+        ## tracking the least key under every node
+        nodes = [BTreeNode(keys) for keys in _split_evenly(values, tree.max_keys)]
+        for leaf, _next in zip(nodes, nodes[1:]):
+            leaf.set_next(_next)
+        firsts = [leaf.keys[0] for leaf in nodes]
+        while len(nodes) > 1:
+            parents, parent_firsts = [], []
+            start = 0
+            for children in _split_evenly(nodes, tree.order):
+                stop = start + len(children)
+                parents.append(BTreeNode(firsts[start + 1:stop], children))
+                parent_firsts.append(firsts[start])
+                start = stop
+            nodes, firsts = parents, parent_firsts
+
+        tree.root = nodes[0]
+        tree.size = len(values)
+        return tree
+
+    def get_root(self):
+        '''Getter method for the root of the tree.'''
+        return self.root
+
+    def get_height(self):
+        '''Returns the number of levels of the tree.'''
+        height = 1
+        node = self.root
+        while node.children is not None:
+            node = node.children[0]
+            height += 1
+        return height
+
+    def _find_leaf(self, value, path=None):
+        '''Helper method that returns the leaf where a value belongs. The
+        internal nodes visited and the child taken at each are appended to the
+        path, if one is given.'''
+        node = self.root
+        while node.children is not None:
+            index = bisect_right(node.keys, value)
+            if path is not None:
+                path.append((node, index))
+            node = node.children[index]
+        return node
+
+    def _split(self, node):
+        '''Helper method that splits an overfull node in two.
+
+        Returns:
+            A 2-tuple of the separator key and the new right node.
+        '''
+        middle = len(node.keys) // 2
+        if node.children is None:
+            right = BTreeNode(node.keys[middle:], None, node.get_next())
+            del node.keys[middle:]
+            node.set_next(right)
+            return right.keys[0], right
+
+        separator = node.keys[middle]
+        right = BTreeNode(node.keys[middle + 1:], node.children[middle + 1:])
+        del node.keys[middle:]
+        del node.children[middle + 1:]
+        return separator, right
+
+    def insert(self, value):
+        '''Inserts an item to the tree. Items already in the tree are not
+        inserted again.
+
+        Args:
+            value: The value of the item to be inserted to the tree.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the tree.
+            IndexError: If the max size limit has been reached.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being inserted is of invalid type.')
+
+        path = []
+        node = self._find_leaf(value, path)
+        index = bisect_left(node.keys, value)
+        if index < len(node.keys) and node.keys[index] == value:
+            return None
+        if not self._has_room(1):
+            raise IndexError('The max size limit of the tree has been reached.')
+        node.keys.insert(index, value)
+        self.size += 1
+
+        ## Split overfull nodes bottom-up, growing a new root if needed
+        while len(node.keys) > self.max_keys:
+            separator, right = self._split(node)
+            if not path:
+                self.root = BTreeNode([separator], [node, right])
+                break
+            node, index = path.pop()
+            node.keys.insert(index, separator)
+            node.children.insert(index + 1, right)
+
+    def _fix_underflow(self, parent, index):
+        '''Helper method that refills the child of a node that has too few
+        keys, by borrowing a key from a sibling or merging with it.'''
+        node = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+        leaf = node.children is None
+
+        if left is not None and len(left.keys) > self.min_keys:
+            if leaf:
+                node.keys.insert(0, left.keys.pop())
+                parent.keys[index - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[index - 1])
+                parent.keys[index - 1] = left.keys.pop()
+                node.children.insert(0, left.children.pop())
+        elif right is not None and len(right.keys) > self.min_keys:
+            if leaf:
+                node.keys.append(right.keys.pop(0))
+                parent.keys[index] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[index])
+                parent.keys[index] = right.keys.pop(0)
+                node.children.append(right.children.pop(0))
+        else:
+            ## Merge the node into its left sibling, or its right sibling into
+            ## the node
+            if left is not None:
+                index -= 1
+                node, right = left, node
+            if leaf:
+                node.keys.extend(right.keys)
+                node.set_next(right.get_next())
+            else:
+                node.keys.append(parent.keys[index])
+                node.keys.extend(right.keys)
+                node.children.extend(right.children)
+            del parent.keys[index]
+            del parent.children[index + 1]
+
+    def delete(self, value):
+        '''Deletes an item from the tree with the given value.
+
+        Args:
+            value: The value of the item to be deleted from the tree.
+
+        Raises:
+            TypeError: If the type of the item being deleted is not supported
+                by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being deleted is of invalid type.')
+
+        path = []
+        node = self._find_leaf(value, path)
+        index = bisect_left(node.keys, value)
+        if index == len(node.keys) or node.keys[index] != value:
+            return None
+        del node.keys[index]
+        self.size -= 1
+
+        while path and len(node.keys) < self.min_keys:
+            parent, index = path.pop()
+            self._fix_underflow(parent, index)
+            node = parent
+        if self.root.children is not None and not self.root.keys:
+            self.root = self.root.children[0]
+
+    def search(self, value):
+        '''Searches for an item in the tree.
+
+        Args:
+            value: The value of the item being searched for in the tree.
+
+        Returns:
+            A boolean representing whether or not the value was found in the
+                tree.
+
+        Raises:
+            TypeError: If the type of the item being searched is not supported
+                by the tree.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        keys = self._find_leaf(value).keys
+        index = bisect_left(keys, value)
+        return index < len(keys) and keys[index] == value
+
+    def _irange(self, minimum, maximum, inclusive):
+        '''Helper generator for the range queries.'''
+        low_inclusive, high_inclusive = inclusive
+        if minimum is None:
+            node = self.root
+            while node.children is not None:
+                node = node.children[0]
+            index = 0
+        else:
+            node = self._find_leaf(minimum)
+            search = bisect_left if low_inclusive else bisect_right
+            index = search(node.keys, minimum)
+
+        if maximum is None:
+            while node is not None:
+                yield from node.keys[index:]
+                node = node.get_next()
+                index = 0
+            return
+
+        search = bisect_right if high_inclusive else bisect_left
+        while node is not None:
+            stop = search(node.keys, maximum)
+            yield from node.keys[index:stop]
+            if stop < len(node.keys):
+                return
+            node = node.get_next()
+            index = 0
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        '''Returns a lazy iterator over the items of the tree between two
+        bounds, in sorted order. It descends to the leaf of the lower bound
+        once and then scans the linked leaves.
+
+        Args:
+            minimum: The lower bound, or None for no lower bound.
+            maximum: The upper bound, or None for no upper bound.
+            inclusive: A pair of booleans that if true will include items equal
+                to the lower and upper bound respectively.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        for bound in (minimum, maximum):
+            if not self.trusted and bound is not None and type(bound) != self.data_type:
+                raise TypeError('The bound of the range is of invalid type.')
+
+        return self._irange(minimum, maximum, inclusive)
+
+    def range(self, start, stop):
+        '''Returns a lazy iterator over the items of the tree from start up to,
+        but not including, stop.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the tree.
+        '''
+        return self.irange(start, stop, (True, False))
+
+    def render(self, path=''):
+        '''Renders the current state of the tree.
+
+        Args:
+            path: The path where the rendered image will be saved.
+        '''
+        from dsviz.drawers import BTreeDrawer
+
+        image = BTreeDrawer.draw(self)
+        if path:
+            util.save_file(image, path, self.name)
+        return image
+
+    def is_empty(self):
+        '''Returns true if the tree is empty.'''
+        return len(self) == 0
+
+    def __contains__(self, value):
+        '''Returns true if an item with the given value is in the tree.'''
+        return type(value) == self.data_type and self.search(value)
+
+    def __len__(self):
+        '''Returns the size of the tree.'''
+        return self.size
+
+    def __iter__(self):
+        '''Returns an iterator over the items of the tree in sorted order.'''
+        return self._irange(None, None, (True, True))
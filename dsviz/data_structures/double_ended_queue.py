@@ -2,15 +2,16 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import RingBuffer
 from dsviz.decorators import validate_types
-from dsviz.drawers import DequeDrawer
 from dsviz.iterators import QueueIter
 
 import dsviz.util.file_utils as util
 
 
 class DoubleEndedQueue(DataStructure):
-    '''The double ended queue data structure.'''
+    '''The double ended queue data structure. The queue uses a ring buffer as
+    a container.'''
 
     @validate_types(allowed_types={bool, int, float, str})
     def __init__(self, name, data_type, max_size=16):
@@ -20,11 +21,11 @@ class DoubleEndedQueue(DataStructure):
             name: An identifier for the queue.
             data_type: The type of data that the queue will store.
             max_size: An optional argument to determine an upper limit for the
-                size of the queue.
+                size of the queue. If None, the queue is unbounded.
         '''
-        super().__init__(name, data_type, min(max_size, 16))
+        super().__init__(name, data_type, max_size, 16)
 
-        self.queue = []
+        self.queue = RingBuffer(None, data_type)
 
     def enqueue_front(self, item):
         '''Enqueues an item to the front of the queue.
@@ -37,12 +38,12 @@ class DoubleEndedQueue(DataStructure):
                 by the queue.
             IndexError: If the max size limit has been reached.
         '''
-        if type(item) != self.data_type:
+        if not self.trusted and type(item) != self.data_type:
             raise TypeError('The item being enqueued is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the queue has been reached.')
 
-        self.queue.insert(0, item)
+        self.queue.push_front(item)
 
     def enqueue_back(self, item):
         '''Enqueues an item to the back of the queue.
@@ -55,12 +56,12 @@ class DoubleEndedQueue(DataStructure):
                 by the queue.
             IndexError: If the max size limit has been reached.
         '''
-        if type(item) != self.data_type:
+        if not self.trusted and type(item) != self.data_type:
             raise TypeError('The item being enqueued is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the queue has been reached.')
 
-        self.queue.append(item)
+        self.queue.push_back(item)
 
     def dequeue_front(self):
         '''Dequeues an item from the front of the queue.
@@ -74,7 +75,7 @@ class DoubleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue.pop(0)
+        return self.queue.pop_front()
 
     def dequeue_back(self):
         '''Dequeues an item from the back of the queue.
@@ -88,7 +89,7 @@ class DoubleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue.pop()
+        return self.queue.pop_back()
 
     def peek_front(self):
         '''Examines the item in the front of the queue without removing it.
@@ -102,7 +103,7 @@ class DoubleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue[0]
+        return self.queue.peek_front()
 
     def peek_back(self):
         '''Examines the item in the back of the queue without removing it.
@@ -116,7 +117,19 @@ class DoubleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue[-1]
+        return self.queue.peek_back()
+
+    def export(self):
+        '''Exports the contents of the queue from front to back. The contents
+        are only copied if they wrap around the end of the ring buffer.
+
+        Returns:
+            A memoryview of the queue's typed array.
+
+        Raises:
+            TypeError: If the queue does not store numeric data.
+        '''
+        return self.queue.export()
 
     def render(self, path=''):
         '''Renders the current state of the queue.
@@ -124,10 +137,12 @@ class DoubleEndedQueue(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import DequeDrawer
+
         image = DequeDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
-        image
+        return image
 
     def is_empty(self):
         '''Returns true if the queue is empty.'''
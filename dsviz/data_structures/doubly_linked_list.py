@@ -2,8 +2,8 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import NodeIndex
 from dsviz.decorators import validate_types
-from dsviz.drawers import DLLDrawer
 from dsviz.iterators import LLIter
 from dsviz.nodes import DLLNode
 
@@ -14,51 +14,101 @@ class DoublyLinkedList(DataStructure):
     '''The doubly linked list data structure.'''
 
     @validate_types(allowed_types={bool, int, float, str})
-    def __init__(self, name, data_type, max_size=16):
+    def __init__(self, name, data_type, max_size=16, indexed=False):
         '''Constructor for a doubly linked list.
 
         Args:
             name: An identifier for the linked list.
             data_type: The type of data that the linked list will store.
             max_size: An optional argument to determine an upper limit for
-                the size of the linked list.
+                the size of the linked list. If None, the linked list is
+                unbounded.
+            indexed: A boolean that if true will keep a hash index from values
+                to nodes, for O(1) membership checks.
         '''
-        super().__init__(name, data_type, min(max_size, 16))
+        super().__init__(name, data_type, max_size, 16)
 
         self.head = None
+        self.tail = None
         self.size = 0
+        self._index = NodeIndex() if indexed else None
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=16, indexed=False):
+        '''Constructs a doubly linked list from the items of an iterable.
+
+        Args:
+            name: An identifier for the linked list.
+            data_type: The type of data that the linked list will store.
+            values: An iterable of the items to be appended to the linked list.
+            max_size: An optional argument to determine an upper limit for
+                the size of the linked list.
+            indexed: A boolean that if true will keep a hash index from values
+                to nodes.
+
+        Returns:
+            A linked list containing the given items in order.
+        '''
+        linked_list = cls(name, data_type, max_size, indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    def _acquire(self, value):
+        '''Helper method that returns a new node holding a value, owned by
+        the linked list, and adds it to the index.'''
+        node = DLLNode(value, owner=self)
+        if self._index is not None:
+            self._index.add(node)
+        return node
+
+    def _release(self, node):
+        '''Helper method that removes an unlinked node from the index and
+        clears its owner. Nodes are not recycled through a node pool, since
+        any node may still be held as a handle, and a recycled node would make
+        a stale handle refer to an unrelated item.'''
+        if self._index is not None:
+            self._index.remove(node)
+        node.owner = None
 
     def get_head(self):
         '''Getter method for the head of the linked list.'''
         return self.head
 
+    def get_tail(self):
+        '''Getter method for the tail of the linked list.'''
+        return self.tail
+
     def prepend(self, value):
         '''Prepends an item to the start of the linked list.
 
         Args:
             value: The value of the item to be prepended to the linked list.
 
+        Returns:
+            The node holding the item, which can be used as a handle.
+
         Raises:
             TypeError: If the type of the item being prepended is not supported
                 by the linked list.
             IndexError: If the max size limit has been reached.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being prepended is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
         if self.get_head() == None:
-            self.head = DLLNode(value)
+            self.head = self.tail = self._acquire(value)
             self.size += 1
-            return None
+            return self.head
 
-        new_node = DLLNode(value)
+        new_node = self._acquire(value)
         self.head.set_prev(new_node)
         new_node.set_next(self.head)
         self.head = new_node
 
         self.size += 1
+        return new_node
 
     def append(self, value):
         '''Appends an item to the end of the linked list.
@@ -66,29 +116,62 @@ class DoublyLinkedList(DataStructure):
         Args:
             value: The value of the item to be appended to the linked list.
 
+        Returns:
+            The node holding the item, which can be used as a handle.
+
         Raises:
             TypeError: If the type of the item being appended is not supported
                 by the linked list.
             IndexError: If the max size limit has been reached.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being appended is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
         if self.get_head() == None:
-            self.head = DLLNode(value)
+            self.head = self.tail = self._acquire(value)
             self.size += 1
-            return None
+            return self.tail
 
-        new_node = DLLNode(value)
-        curr = self.get_head()
-        while curr.get_next() != None:
-            curr = curr.get_next()
-        curr.set_next(new_node)
-        new_node.set_prev(curr)
+        new_node = self._acquire(value)
+        self.tail.set_next(new_node)
+        new_node.set_prev(self.tail)
+        self.tail = new_node
 
         self.size += 1
+        return new_node
+
+    def extend(self, values):
+        '''Appends the items of an iterable to the end of the linked list. The
+        items are checked once for the whole batch, and nothing is appended if
+        any of them is rejected.
+
+        Args:
+            values: An iterable of the items to be appended to the linked list.
+
+        Raises:
+            TypeError: If the type of an item being appended is not supported
+                by the linked list.
+            IndexError: If the items do not fit in the linked list.
+        '''
+        values = list(values)
+        self._check_types(values, 'appended')
+        if not self._has_room(len(values)):
+            raise IndexError('The max size limit of the linked list has been reached.')
+
+        acquire = self._acquire
+        tail = self.tail
+        for value in values:
+            node = acquire(value)
+            if tail is None:
+                self.head = node
+            else:
+                tail.set_next(node)
+                node.set_prev(tail)
+            tail = node
+        self.tail = tail
+        self.size += len(values)
 
     def insert(self, position, value):
         '''Inserts an item to the linked list at a given position.
@@ -97,28 +180,30 @@ class DoublyLinkedList(DataStructure):
             position: The index where the item is to be inserted.
             value: The value of the item to be inserted to the linked list.
 
+        Returns:
+            The node holding the item, which can be used as a handle.
+
         Raises:
             TypeError: If the type of the item being inserted is not supported
                 by the linked list.
             IndexError: If the max size limit has been reached or the given
                 position is out of bounds.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being inserted is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
         if position < 0 or position >= self.size:
             raise IndexError('Index is out of bounds.')
 
         if position == 0:
-            self.prepend(value)
-            return None
+            return self.prepend(value)
 
         curr = self.get_head()
         for _ in range(position - 1):
             curr = curr.get_next()
 
-        new_node = DLLNode(value)
+        new_node = self._acquire(value)
         new_node.set_next(curr.get_next())
         curr.set_next(new_node)
         new_node.set_prev(curr)
@@ -126,6 +211,140 @@ class DoublyLinkedList(DataStructure):
             new_node.get_next().set_prev(new_node)
 
         self.size += 1
+        return new_node
+
+    def _check_handle(self, node):
+        '''Helper method that rejects a node that is not in this linked list,
+        such as a node of another list or the handle of a removed item.
+
+        Raises:
+            ValueError: If the node is not in the linked list.
+        '''
+        if getattr(node, 'owner', None) is not self:
+            raise ValueError('The node is not in the linked list.')
+
+    def _check_insert(self, value):
+        '''Helper method that checks an item being inserted next to a node.'''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being inserted is of invalid type.')
+        if not self._has_room(1):
+            raise IndexError('The max size limit of the linked list has been reached.')
+
+    def insert_after(self, node, value):
+        '''Inserts an item right after a node of the linked list in O(1).
+
+        Args:
+            node: A node handle returned by a previous insertion.
+            value: The value of the item to be inserted to the linked list.
+
+        Returns:
+            The node holding the item, which can be used as a handle.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the linked list.
+            IndexError: If the max size limit has been reached.
+            ValueError: If the node is not in the linked list.
+        '''
+        self._check_insert(value)
+        self._check_handle(node)
+
+        new_node = self._acquire(value)
+        _next = node.get_next()
+        new_node.set_prev(node)
+        new_node.set_next(_next)
+        node.set_next(new_node)
+        if _next == None:
+            self.tail = new_node
+        else:
+            _next.set_prev(new_node)
+        self.size += 1
+        return new_node
+
+    def insert_before(self, node, value):
+        '''Inserts an item right before a node of the linked list in O(1).
+
+        Args:
+            node: A node handle returned by a previous insertion.
+            value: The value of the item to be inserted to the linked list.
+
+        Returns:
+            The node holding the item, which can be used as a handle.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the linked list.
+            IndexError: If the max size limit has been reached.
+            ValueError: If the node is not in the linked list.
+        '''
+        self._check_insert(value)
+        self._check_handle(node)
+
+        new_node = self._acquire(value)
+        prev = node.get_prev()
+        new_node.set_next(node)
+        new_node.set_prev(prev)
+        node.set_prev(new_node)
+        if prev == None:
+            self.head = new_node
+        else:
+            prev.set_next(new_node)
+        self.size += 1
+        return new_node
+
+    def remove(self, node):
+        '''Removes a node from the linked list in O(1). The node is no longer
+        a valid handle afterwards.
+
+        Args:
+            node: A node handle returned by a previous insertion.
+
+        Returns:
+            The value of the removed item.
+
+        Raises:
+            ValueError: If the node is not in the linked list.
+        '''
+        self._check_handle(node)
+
+        value = node.get_data()
+        self._unlink(node)
+        self._release(node)
+        return value
+
+    def move_to_front(self, node):
+        '''Moves a node to the start of the linked list in O(1).
+
+        Args:
+            node: A node handle returned by a previous insertion.
+
+        Raises:
+            ValueError: If the node is not in the linked list.
+        '''
+        self._check_handle(node)
+        if node is self.head:
+            return None
+
+        self._unlink(node)
+        node.set_next(self.head)
+        self.head.set_prev(node)
+        self.head = node
+        self.size += 1
+
+    def _unlink(self, node):
+        '''Helper method that removes a node from the linked list.'''
+        prev, _next = node.get_prev(), node.get_next()
+        if prev == None:
+            self.head = _next
+        else:
+            prev.set_next(_next)
+        if _next == None:
+            self.tail = prev
+        else:
+            _next.set_prev(prev)
+        node.set_next(None)
+        node.set_prev(None)
+        self.size -= 1
 
     def delete(self, value):
         '''Deletes an item from the linked list with the given value.
@@ -137,45 +356,60 @@ class DoublyLinkedList(DataStructure):
             TypeError: If the type of the item being deleted is not supported
                 by the linked list.
         '''
-        print('deleting:', value)
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being deleted is of invalid type.')
 
-        if self.get_head() == None:
-            return None
+        if self._index is not None:
+            nodes = self._index.get(value)
+            if not nodes:
+                return None
+            ## A value held by a single node is unlinked in O(1), otherwise
+            ## the first occurrence is found by walking the list
+            if len(nodes) == 1:
+                node = next(iter(nodes))
+                self._unlink(node)
+                self._release(node)
+                return None
 
         curr = self.get_head()
-        deleted_node = False
+        while curr != None:
+            if curr.get_data() == value:
+                self._unlink(curr)
+                self._release(curr)
+                break
+            curr = curr.get_next()
 
-        ## If the head is to be deleted
-        if curr.get_data() == value:
-            deleted_node = True
-            if not curr.get_next():
-                self.head = None
-            else:
-                curr.get_next().set_prev(None)
-                self.head = curr.get_next()
-                curr.set_next(None)
-        else:
-            while curr.get_next() != None:
-                ## If the node being deleted is in the middle of the list
-                if curr.get_data() == value:
-                    deleted_node = True
-                    curr.get_prev().set_next(curr.get_next())
-                    curr.get_next().set_prev(curr.get_prev())
-                    curr.set_next(None)
-                    curr.set_prev(None)
-                    deleted_node = True
-                    break
-                curr = curr.get_next()
-            ## If the node being deleted is at the end of the list
-            if not deleted_node and curr.get_data() == value:
-                deleted_node = True
-                curr.get_prev().set_next(None)
-                curr.set_prev(None)
-
-        self.size -= 1 if deleted_node else 0
+    def pop_back(self):
+        '''Removes the item at the end of the linked list.
 
+        Returns:
+            The value of the item at the end of the linked list.
+
+        Raises:
+            IndexError: If the linked list is empty.
+        '''
+        if self.is_empty():
+            raise IndexError('The linked list is empty.')
+
+        node = self.tail
+        value = node.get_data()
+        self._unlink(node)
+        self._release(node)
+        return value
+
+    def peek_back(self):
+        '''Examines the item at the end of the linked list without removing it.
+
+        Returns:
+            The value of the item at the end of the linked list.
+
+        Raises:
+            IndexError: If the linked list is empty.
+        '''
+        if self.is_empty():
+            raise IndexError('The linked list is empty.')
+
+        return self.tail.get_data()
 
     def search(self, value):
         '''Searches for an item in the linked list with the given value.
@@ -188,8 +422,10 @@ class DoublyLinkedList(DataStructure):
             TypeError: If the type of the item being searched is not supported
                 by the linked list.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being searched is of invalid type.')
+        if self._index is not None and value not in self._index:
+            return -1
 
         position = 0
         curr = self.head
@@ -206,9 +442,12 @@ class DoublyLinkedList(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import DLLDrawer
+
         image = DLLDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
+        return image
 
     def is_empty(self):
         '''Returns true if the linked list is empty.'''
@@ -218,6 +457,13 @@ class DoublyLinkedList(DataStructure):
         '''Returns the size of the linked list.'''
         return self.size
 
+    def __contains__(self, value):
+        '''Returns true if an item with the given value is in the linked list.
+        It takes O(1) on average if the linked list is indexed.'''
+        if self._index is not None:
+            return value in self._index
+        return any(data == value for data in self)
+
     def __iter__(self):
         '''Returns an iterator for the linked list.'''
         return LLIter(self)
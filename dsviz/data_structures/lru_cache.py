@@ -0,0 +1,159 @@
+'''Least recently used cache data structure.'''
+
+
+from dsviz.bases import DataStructure
+from dsviz.data_structures.doubly_linked_list import DoublyLinkedList
+from dsviz.decorators import validate_types
+
+import dsviz.util.file_utils as util
+
+
+class LRUCache(DataStructure):
+    '''The least recently used cache data structure. The keys are kept in a
+    doubly linked list from the most to the least recently used, and a hash
+    map finds the node of a key, so that every operation takes O(1).'''
+
+    @validate_types(allowed_types={bool, int, float, str})
+    def __init__(self, name, data_type, capacity=16):
+        '''Constructor for an LRU cache.
+
+        Args:
+            name: An identifier for the cache.
+            data_type: The type of the keys that the cache will store. Values
+                may be of any type.
+            capacity: The number of entries the cache holds before it evicts
+                the least recently used one. If None, the cache never evicts.
+        '''
+        super().__init__(name, data_type, capacity)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._values = {}
+        self._nodes = {}
+        ## The cache checks its keys, so the list of keys skips its own checks
+        self._order = DoublyLinkedList(name, data_type, None)
+        self._order.trusted = True
+
+    def get(self, key, default=None):
+        '''Returns the value of a key and marks the key as the most recently
+        used. Counts a hit if the key is in the cache and a miss otherwise.
+
+        Args:
+            key: The key being looked up.
+            default: The value returned if the key is not in the cache.
+
+        Raises:
+            TypeError: If the type of the key is not supported by the cache.
+        '''
+        if not self.trusted and type(key) != self.data_type:
+            raise TypeError('The key being looked up is of invalid type.')
+
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return self._values[key]
+
+    def put(self, key, value):
+        '''Stores the value of a key and marks the key as the most recently
+        used. Evicts the least recently used entry if the cache is full.
+
+        Args:
+            key: The key being stored.
+            value: The value of the key.
+
+        Raises:
+            TypeError: If the type of the key is not supported by the cache.
+        '''
+        if not self.trusted and type(key) != self.data_type:
+            raise TypeError('The key being stored is of invalid type.')
+
+        node = self._nodes.get(key)
+        if node is not None:
+            self._order.move_to_front(node)
+        else:
+            if len(self) == self.max_size:
+                self.evict()
+            self._nodes[key] = self._order.prepend(key)
+        self._values[key] = value
+
+    def evict(self):
+        '''Removes the least recently used entry from the cache.
+
+        Returns:
+            A 2-tuple of the key and value of the evicted entry.
+
+        Raises:
+            IndexError: If the cache is empty.
+        '''
+        if self.is_empty():
+            raise IndexError('The cache is empty.')
+
+        key = self._order.remove(self._order.get_tail())
+        del self._nodes[key]
+        self.evictions += 1
+        return key, self._values.pop(key)
+
+    def delete(self, key):
+        '''Removes a key from the cache, if it is present.
+
+        Args:
+            key: The key being removed.
+
+        Raises:
+            TypeError: If the type of the key is not supported by the cache.
+        '''
+        if not self.trusted and type(key) != self.data_type:
+            raise TypeError('The key being deleted is of invalid type.')
+
+        node = self._nodes.pop(key, None)
+        if node is not None:
+            self._order.remove(node)
+            del self._values[key]
+
+    def hit_rate(self):
+        '''Returns the fraction of lookups that were hits, or 0 if there were
+        no lookups.'''
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self):
+        '''Resets the hit, miss and eviction counters.'''
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, path=''):
+        '''Renders the keys of the cache from the most to the least recently
+        used.
+
+        Args:
+            path: The path where the rendered image will be saved.
+        '''
+        from dsviz.drawers import DLLDrawer
+
+        image = DLLDrawer.draw(self._order)
+        if path:
+            util.save_file(image, path, self.name)
+        return image
+
+    def is_empty(self):
+        '''Returns true if the cache is empty.'''
+        return len(self) == 0
+
+    def __contains__(self, key):
+        '''Returns true if the key is in the cache, without marking it as
+        used.'''
+        return key in self._nodes
+
+    def __len__(self):
+        '''Returns the number of entries in the cache.'''
+        return len(self._nodes)
+
+    def __iter__(self):
+        '''Returns an iterator over the keys of the cache from the most to the
+        least recently used.'''
+        return iter(self._order)
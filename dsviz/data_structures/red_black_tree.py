@@ -0,0 +1,249 @@
+'''Red-black tree data structure.'''
+
+
+from dsviz.data_structures.binary_search_tree import BinarySearchTree
+from dsviz.nodes.bst_node import BLACK, RED
+
+import dsviz.util.tree_utils as tree_utils
+
+
+def _is_red(node):
+    '''Helper function that returns true if a node is red. Missing nodes are
+    black.'''
+    return node is not None and node.color == RED
+
+
+class RedBlackTree(BinarySearchTree):
+    '''The red-black tree data structure. It keeps itself balanced by coloring
+    its nodes, and restores the coloring after an insert with at most two
+    rotations and after a delete with at most three. Searches, order
+    statistics, range queries and rendering are shared with the binary search
+    tree.'''
+
+    def __init__(self, name, data_type, max_size=32):
+        '''Constructor for a red-black tree.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+        '''
+        super().__init__(name, data_type, max_size)
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=32):
+        '''Constructs a balanced red-black tree from the items of an iterable.
+        The items are sorted once, and the tree is then built in linear time.
+
+        Args:
+            name: An identifier for the tree.
+            data_type: The type of data that the tree will store.
+            values: An iterable of the items to be inserted to the tree.
+            max_size: The upper limit for the size of the tree. If None, the
+                tree is unbounded.
+
+        Returns:
+            A tree containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the tree.
+            IndexError: If there are more items than the max size limit.
+        '''
+        tree = cls(name, data_type, max_size)
+        tree._load(values)
+        return tree
+
+    def _load(self, values):
+        '''Helper method that replaces the contents of the tree with a
+        perfectly balanced tree of the given items. The nodes on the deepest
+        level are colored red and all others black, which gives every path the
+        same number of black nodes.'''
+        super()._load(values)
+        if self.root is None:
+            return None
+
+        height = self.root.height
+        level = [self.root]
+        for depth in range(1, height + 1):
+            color = RED if depth == height and height > 1 else BLACK
+            below = []
+            for node in level:
+                node.color = color
+                if node.left is not None:
+                    below.append(node.left)
+                if node.right is not None:
+                    below.append(node.right)
+            level = below
+
+    def _replace_child(self, parent, old, new):
+        '''Helper method that replaces a child of a node, or the root if the
+        node is None.'''
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _rotate_left(self, x):
+        '''Helper method for rotating a subtree left.'''
+        y = x.right
+        x.right = y.left
+        if y.left is not None:
+            y.left.parent = x
+        y.parent = x.parent
+        self._replace_child(x.parent, x, y)
+        y.left = x
+        x.parent = y
+
+        ## Update sizes
+        y.size = x.size
+        x.size = 1 + tree_utils.node_size(x.left) + tree_utils.node_size(x.right)
+
+    def _rotate_right(self, x):
+        '''Helper method for rotating a subtree right.'''
+        y = x.left
+        x.left = y.right
+        if y.right is not None:
+            y.right.parent = x
+        y.parent = x.parent
+        self._replace_child(x.parent, x, y)
+        y.right = x
+        x.parent = y
+
+        ## Update sizes
+        y.size = x.size
+        x.size = 1 + tree_utils.node_size(x.left) + tree_utils.node_size(x.right)
+
+    def _insert(self, value):
+        '''Helper method for insert operation.'''
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node.size += 1
+            node = node.left if value < node.data else node.right
+
+        node = self._pool.acquire(value)
+        node.parent = parent
+        node.color = RED
+        if parent is None:
+            self.root = node
+        elif value < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+        self.size += 1
+
+        ## Recolor up the tree while the node and its parent are both red,
+        ## then finish with at most two rotations
+        while _is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if _is_red(uncle):
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    self._rotate_left(parent)
+                    node, parent = parent, node
+                parent.color = BLACK
+                grandparent.color = RED
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if _is_red(uncle):
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    self._rotate_right(parent)
+                    node, parent = parent, node
+                parent.color = BLACK
+                grandparent.color = RED
+                self._rotate_left(grandparent)
+        self.root.color = BLACK
+
+    def _delete(self, value):
+        '''Helper method for delete operation.'''
+        node = self.root
+        while node is not None and node.data != value:
+            node = node.left if value < node.data else node.right
+        if node is None:
+            return None
+
+        ## Replace the value of a node with two children by its successor's
+        ## value, then remove the successor instead
+        if node.left is not None and node.right is not None:
+            successor = tree_utils.leftmost(node.right)
+            node.data = successor.data
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+        self._replace_child(parent, node, child)
+        if child is not None:
+            child.parent = parent
+        if node.color == BLACK:
+            self._fix_delete(child, parent)
+        self._pool.release(node)
+        self.size -= 1
+
+    def _fix_delete(self, node, parent):
+        '''Helper method that restores the coloring after a black node was
+        removed above the given node, which may be missing. It recolors up the
+        tree and performs at most three rotations.'''
+        while node is not self.root and not _is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if _is_red(sibling):
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_left(parent)
+                    sibling = parent.right
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                    continue
+                if not _is_red(sibling.right):
+                    sibling.left.color = BLACK
+                    sibling.color = RED
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.right.color = BLACK
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+                if _is_red(sibling):
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self._rotate_right(parent)
+                    sibling = parent.left
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.color = RED
+                    node, parent = parent, parent.parent
+                    continue
+                if not _is_red(sibling.left):
+                    sibling.right.color = BLACK
+                    sibling.color = RED
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+                sibling.color = parent.color
+                parent.color = BLACK
+                sibling.left.color = BLACK
+                self._rotate_right(parent)
+            node = self.root
+        if node is not None:
+            node.color = BLACK
@@ -2,15 +2,16 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import RingBuffer
 from dsviz.decorators import validate_types
-from dsviz.drawers import QueueDrawer
 from dsviz.iterators import QueueIter
 
 import dsviz.util.file_utils as util
 
 
 class SingleEndedQueue(DataStructure):
-    '''The single ended queue data structure.'''
+    '''The single ended queue data structure. The queue uses a ring buffer as
+    a container.'''
 
     @validate_types(allowed_types={bool, int, float, str})
     def __init__(self, name, data_type, max_size=16):
@@ -20,11 +21,11 @@ class SingleEndedQueue(DataStructure):
             name: An identifier for the queue.
             data_type: The type of data that the queue will store.
             max_size: An optional argument to determine an upper limit for the
-                size of the queue.
+                size of the queue. If None, the queue is unbounded.
         '''
-        super().__init__(name, data_type, min(max_size, 16))
+        super().__init__(name, data_type, max_size, 16)
 
-        self.queue = []
+        self.queue = RingBuffer(None, data_type)
 
     def enqueue(self, item):
         '''Enqueues an item to the queue.
@@ -37,12 +38,12 @@ class SingleEndedQueue(DataStructure):
                 by the queue.
             IndexError: If the max size limit has been reached.
         '''
-        if type(item) != self.data_type:
+        if not self.trusted and type(item) != self.data_type:
             raise TypeError('Item being enqueued is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the queue has been reached.')
 
-        self.queue.append(item)
+        self.queue.push_back(item)
 
     def dequeue(self):
         '''Dequeues an item from the front of the queue.
@@ -56,7 +57,7 @@ class SingleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue.pop(0)
+        return self.queue.pop_front()
 
     def peek(self):
         '''Examines the item in the front of the queue without removing it.
@@ -70,7 +71,19 @@ class SingleEndedQueue(DataStructure):
         if self.is_empty():
             raise IndexError('The queue is empty.')
 
-        return self.queue[0]
+        return self.queue.peek_front()
+
+    def export(self):
+        '''Exports the contents of the queue from front to back. The contents
+        are only copied if they wrap around the end of the ring buffer.
+
+        Returns:
+            A memoryview of the queue's typed array.
+
+        Raises:
+            TypeError: If the queue does not store numeric data.
+        '''
+        return self.queue.export()
 
     def render(self, path=''):
         '''Renders the current state of the queue.
@@ -78,6 +91,8 @@ class SingleEndedQueue(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import QueueDrawer
+
         image = QueueDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -2,10 +2,10 @@
 
 
 from dsviz.bases import DataStructure
+from dsviz.containers import NodeIndex
 from dsviz.decorators import validate_types
-from dsviz.drawers import SLLDrawer
 from dsviz.iterators import LLIter
-from dsviz.nodes import SLLNode
+from dsviz.nodes import NodePool, SLLNode
 
 import dsviz.util.file_utils as util
 
@@ -14,24 +14,69 @@ class SinglyLinkedList(DataStructure):
     '''The singly linked list data structure.'''
 
     @validate_types(allowed_types={bool, int, float,str})
-    def __init__(self, name, data_type, max_size=16):
+    def __init__(self, name, data_type, max_size=16, indexed=False):
         '''Constructor for a singly linked list.
 
         Args:
             name: An identifier for the linked list.
             data_type: The type of data that the linked list will store.
             max_size: An optional argument to determine an upper limit for
-                the size of the linked list.
+                the size of the linked list. If None, the linked list is
+                unbounded.
+            indexed: A boolean that if true will keep a hash index from values
+                to nodes, for O(1) membership checks.
         '''
-        super().__init__(name, data_type, min(max_size, 16))
+        super().__init__(name, data_type, max_size, 16)
 
         self.head = None
+        self.tail = None
         self.size = 0
+        self._pool = NodePool(SLLNode)
+        self._index = NodeIndex() if indexed else None
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=16, indexed=False):
+        '''Constructs a singly linked list from the items of an iterable.
+
+        Args:
+            name: An identifier for the linked list.
+            data_type: The type of data that the linked list will store.
+            values: An iterable of the items to be appended to the linked list.
+            max_size: An optional argument to determine an upper limit for
+                the size of the linked list.
+            indexed: A boolean that if true will keep a hash index from values
+                to nodes.
+
+        Returns:
+            A linked list containing the given items in order.
+        '''
+        linked_list = cls(name, data_type, max_size, indexed)
+        linked_list.extend(values)
+        return linked_list
+
+    def _acquire(self, value):
+        '''Helper method that returns a new node holding a value, and adds it
+        to the index.'''
+        node = self._pool.acquire(value)
+        if self._index is not None:
+            self._index.add(node)
+        return node
+
+    def _release(self, node):
+        '''Helper method that removes an unlinked node from the index and
+        returns it to the node pool.'''
+        if self._index is not None:
+            self._index.remove(node)
+        self._pool.release(node)
 
     def get_head(self):
         '''Getter method for the head of the linked list.'''
         return self.head
 
+    def get_tail(self):
+        '''Getter method for the tail of the linked list.'''
+        return self.tail
+
     def prepend(self, value):
         '''Prepends an item to the start of the linked list.
 
@@ -43,14 +88,16 @@ class SinglyLinkedList(DataStructure):
                 by the linked list.
             IndexError: If the max size limit has been reached.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being prepended is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
         temp = self.get_head()
-        self.head = SLLNode(value)
+        self.head = self._acquire(value)
         self.head.set_next(temp)
+        if self.tail == None:
+            self.tail = self.head
         self.size += 1
 
     def append(self, value):
@@ -64,22 +111,49 @@ class SinglyLinkedList(DataStructure):
                 by the linked list.
             IndexError: If the max size limit has been reached.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being appended is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
 
+        new_node = self._acquire(value)
         if self.get_head() == None:
-            self.head = SLLNode(value)
-            self.size += 1
-            return None
-
-        curr = self.get_head()
-        while curr.get_next():
-            curr = curr.get_next()
-        curr.set_next(SLLNode(value))
+            self.head = new_node
+        else:
+            self.tail.set_next(new_node)
+        self.tail = new_node
         self.size += 1
 
+    def extend(self, values):
+        '''Appends the items of an iterable to the end of the linked list. The
+        items are checked once for the whole batch, and nothing is appended if
+        any of them is rejected.
+
+        Args:
+            values: An iterable of the items to be appended to the linked list.
+
+        Raises:
+            TypeError: If the type of an item being appended is not supported
+                by the linked list.
+            IndexError: If the items do not fit in the linked list.
+        '''
+        values = list(values)
+        self._check_types(values, 'appended')
+        if not self._has_room(len(values)):
+            raise IndexError('The max size limit of the linked list has been reached.')
+
+        acquire = self._acquire
+        tail = self.tail
+        for value in values:
+            node = acquire(value)
+            if tail is None:
+                self.head = node
+            else:
+                tail.set_next(node)
+            tail = node
+        self.tail = tail
+        self.size += len(values)
+
     def insert(self, position, value):
         '''Inserts an item to the linked list at a given position.
 
@@ -93,9 +167,9 @@ class SinglyLinkedList(DataStructure):
             IndexError: If the max size limit has been reached or the given
                 position is out of bounds.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being inserted is of invalid type.')
-        if len(self) == self.max_size:
+        if not self._has_room(1):
             raise IndexError('The max size limit of the linked list has been reached.')
         if position < 0 or position >= self.size:
             raise IndexError('Index is out of bounds.')
@@ -107,7 +181,7 @@ class SinglyLinkedList(DataStructure):
         for _ in range(position - 1):
             curr = curr.get_next()
         temp = curr.get_next()
-        curr.set_next(SLLNode(value))
+        curr.set_next(self._acquire(value))
         curr = curr.get_next()
         curr.set_next(temp)
         self.size += 1
@@ -122,27 +196,27 @@ class SinglyLinkedList(DataStructure):
             TypeError: If the type of the item being deleted is not supported by
                 the linked list.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being deleted is of invalid type.')
+        if self._index is not None and value not in self._index:
+            return None
 
+        prev = None
         curr = self.get_head()
-        deleted_node = False
+        while curr != None and curr.get_data() != value:
+            prev = curr
+            curr = curr.get_next()
+        if curr == None:
+            return None
 
-        ## If the head is to be deleted
-        if curr.get_data() == value:
-            self.head = self.head.get_next()
-            deleted_node = True
+        if prev == None:
+            self.head = curr.get_next()
         else:
-            while curr.get_next():
-                _next = curr.get_next()
-                if _next.get_data() == value:
-                    curr.set_next(_next.get_next())
-                    del _next
-                    deleted_node = True
-                    break
-                curr = curr.get_next()
-
-        self.size -= 1 if deleted_node else 0
+            prev.set_next(curr.get_next())
+        if curr is self.tail:
+            self.tail = prev
+        self._release(curr)
+        self.size -= 1
 
     def search(self, value):
         '''Searches for an item in the linked list with the given value.
@@ -158,8 +232,10 @@ class SinglyLinkedList(DataStructure):
             TypeError: If the type of the item being searched is not supported
                 by the linked list.
         '''
-        if type(value) != self.data_type:
+        if not self.trusted and type(value) != self.data_type:
             raise TypeError('The item being searched is of invalid type.')
+        if self._index is not None and value not in self._index:
+            return -1
 
         position = 0
         curr = self.get_head()
@@ -176,6 +252,8 @@ class SinglyLinkedList(DataStructure):
         Args:
             path: The path where the rendered image will be saved.
         '''
+        from dsviz.drawers import SLLDrawer
+
         image = SLLDrawer.draw(self)
         if path:
             util.save_file(image, path, self.name)
@@ -189,6 +267,13 @@ class SinglyLinkedList(DataStructure):
         '''Returns the size of the linked list.'''
         return self.size
 
+    def __contains__(self, value):
+        '''Returns true if an item with the given value is in the linked list.
+        It takes O(1) on average if the linked list is indexed.'''
+        if self._index is not None:
+            return value in self._index
+        return any(data == value for data in self)
+
     def __iter__(self):
         '''Returns an iterator for the linked list.'''
         return LLIter(self)
@@ -0,0 +1,275 @@
+'''Skip list data structure.'''
+
+
+import random
+
+from dsviz.bases import DataStructure
+from dsviz.decorators import validate_types
+from dsviz.iterators import LLIter
+from dsviz.nodes import NodePool, SkipListNode
+
+import dsviz.util.file_utils as util
+
+
+class SkipList(DataStructure):
+    '''The skip list data structure. Items are kept in sorted order on a
+    linked list, and each node is also linked on a random number of express
+    levels above it, so that searches, inserts and deletes take expected
+    O(log n).'''
+
+    MAX_LEVEL = 32
+
+    @validate_types(allowed_types={int, float, str})
+    def __init__(self, name, data_type, max_size=16, probability=0.5):
+        '''Constructor for a skip list.
+
+        Args:
+            name: An identifier for the skip list.
+            data_type: The type of data that the skip list will store.
+            max_size: An optional argument to determine an upper limit for
+                the size of the skip list. If None, the skip list is
+                unbounded.
+            probability: The probability that a node on a level also appears
+                on the level above it.
+
+        Raises:
+            ValueError: If the probability is not between 0 and 1.
+        '''
+        super().__init__(name, data_type, max_size, 16)
+        if not 0 < probability < 1:
+            raise ValueError('The probability must be between 0 and 1.')
+
+        self.probability = probability
+        self.header = SkipListNode(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self._pool = NodePool(SkipListNode)
+
+    @classmethod
+    def from_iterable(cls, name, data_type, values, max_size=16, probability=0.5):
+        '''Constructs a skip list from the items of an iterable. The items are
+        sorted once and then linked in a single pass.
+
+        Args:
+            name: An identifier for the skip list.
+            data_type: The type of data that the skip list will store.
+            values: An iterable of the items to be inserted to the skip list.
+            max_size: An optional argument to determine an upper limit for
+                the size of the skip list.
+            probability: The probability that a node on a level also appears
+                on the level above it.
+
+        Returns:
+            A skip list containing the given items.
+
+        Raises:
+            TypeError: If the type of an item being inserted is not supported
+                by the skip list.
+            IndexError: If there are more items than the max size limit.
+        '''
+        skip_list = cls(name, data_type, max_size, probability)
+        values = sorted(values)
+        skip_list._check_types(values)
+        if not skip_list._has_room(len(values)):
+            raise IndexError('The max size limit of the skip list has been reached.')
+
+        last = [skip_list.header] * cls.MAX_LEVEL
+        for value in values:
+            node = skip_list._new_node(value)
+            for level in range(len(node.forward)):
+                last[level].forward[level] = node
+                last[level] = node
+        skip_list.size = len(values)
+        return skip_list
+
+    def get_head(self):
+        '''Getter method for the first node of the skip list.'''
+        return self.header.forward[0]
+
+    def get_level(self):
+        '''Getter method for the number of levels in use.'''
+        return self.level
+
+    def _random_level(self):
+        '''Helper method that draws the number of levels of a new node.'''
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.probability:
+            level += 1
+        return level
+
+    def _new_node(self, value):
+        '''Helper method that returns a node with a random number of levels,
+        raising the levels in use if needed.'''
+        level = self._random_level()
+        if level > self.level:
+            self.level = level
+        node = self._pool.acquire(value)
+        node.forward = [None] * level
+        return node
+
+    def _predecessors(self, value):
+        '''Helper method that returns, for each level in use, the last node
+        whose data is less than the value.'''
+        update = [self.header] * self.MAX_LEVEL
+        node = self.header
+        for level in range(self.level - 1, -1, -1):
+            _next = node.forward[level]
+            while _next is not None and _next.data < value:
+                node = _next
+                _next = node.forward[level]
+            update[level] = node
+        return update
+
+    def insert(self, value):
+        '''Inserts an item to the skip list.
+
+        Args:
+            value: The value of the item to be inserted to the skip list.
+
+        Raises:
+            TypeError: If the type of the item being inserted is not supported
+                by the skip list.
+            IndexError: If the max size limit has been reached.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being inserted is of invalid type.')
+        if not self._has_room(1):
+            raise IndexError('The max size limit of the skip list has been reached.')
+
+        update = self._predecessors(value)
+        node = self._new_node(value)
+        for level in range(len(node.forward)):
+            node.forward[level] = update[level].forward[level]
+            update[level].forward[level] = node
+        self.size += 1
+
+    def delete(self, value):
+        '''Deletes an item from the skip list with the given value.
+
+        Args:
+            value: The value of the item to be deleted from the skip list.
+
+        Raises:
+            TypeError: If the type of the item being deleted is not supported
+                by the skip list.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being deleted is of invalid type.')
+
+        update = self._predecessors(value)
+        node = update[0].forward[0]
+        if node is None or node.data != value:
+            return None
+
+        for level in range(len(node.forward)):
+            update[level].forward[level] = node.forward[level]
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        self._pool.release(node)
+        self.size -= 1
+
+    def _search(self, value):
+        '''Helper method for search operation.'''
+        node = self._predecessors(value)[0].forward[0]
+        return node is not None and node.data == value
+
+    def search(self, value):
+        '''Searches for an item in the skip list.
+
+        Args:
+            value: The value of the item being searched for in the skip list.
+
+        Returns:
+            A boolean representing whether or not the value was found in the
+                skip list.
+
+        Raises:
+            TypeError: If the type of the item being searched is not supported
+                by the skip list.
+        '''
+        if not self.trusted and type(value) != self.data_type:
+            raise TypeError('The item being searched is of invalid type.')
+
+        return self._search(value)
+
+    def _irange(self, minimum, maximum, inclusive):
+        '''Helper generator for the range queries.'''
+        low_inclusive, high_inclusive = inclusive
+
+        ## Descend to the last node before the lower bound
+        node = self.header
+        if minimum is not None:
+            for level in range(self.level - 1, -1, -1):
+                _next = node.forward[level]
+                while _next is not None and (
+                        _next.data < minimum or (not low_inclusive and _next.data == minimum)):
+                    node = _next
+                    _next = node.forward[level]
+
+        node = node.forward[0]
+        while node is not None:
+            if maximum is not None and (
+                    maximum < node.data or (not high_inclusive and node.data == maximum)):
+                return
+            yield node.data
+            node = node.forward[0]
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        '''Returns a lazy iterator over the items of the skip list between two
+        bounds, in sorted order. Each query costs expected O(log n + k) for k
+        items.
+
+        Args:
+            minimum: The lower bound, or None for no lower bound.
+            maximum: The upper bound, or None for no upper bound.
+            inclusive: A pair of booleans that if true will include items equal
+                to the lower and upper bound respectively.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the skip
+                list.
+        '''
+        for bound in (minimum, maximum):
+            if not self.trusted and bound is not None and type(bound) != self.data_type:
+                raise TypeError('The bound of the range is of invalid type.')
+
+        return self._irange(minimum, maximum, inclusive)
+
+    def range(self, start, stop):
+        '''Returns a lazy iterator over the items of the skip list from start
+        up to, but not including, stop.
+
+        Raises:
+            TypeError: If the type of a bound is not supported by the skip
+                list.
+        '''
+        return self.irange(start, stop, (True, False))
+
+    def render(self, path=''):
+        '''Renders the current state of the skip list.
+
+        Args:
+            path: The path where the rendered image will be saved.
+        '''
+        from dsviz.drawers import SkipListDrawer
+
+        image = SkipListDrawer.draw(self)
+        if path:
+            util.save_file(image, path, self.name)
+        return image
+
+    def is_empty(self):
+        '''Returns true if the skip list is empty.'''
+        return len(self) == 0
+
+    def __contains__(self, value):
+        '''Returns true if an item with the given value is in the skip list.'''
+        return type(value) == self.data_type and self._search(value)
+
+    def __len__(self):
+        '''Returns the size of the skip list.'''
+        return self.size
+
+    def __iter__(self):
+        '''Returns an iterator for the skip list.'''
+        return LLIter(self)
@@ -1,9 +1,14 @@
 '''Validate types decorator.'''
 
 
+import functools
+import inspect
+
+
 def validate_types(allowed_types):
     '''A decorator for a data structure's constructor to validate the type of
-    data being stored.
+    data being stored. The decorated constructor keeps its name, docstring and
+    signature, and accepts its arguments by position or by keyword.
 
     Args:
         allowed_types: A set of allowed types for the data structure.
@@ -13,12 +18,20 @@ def validate_types(allowed_types):
             there are missing positional arguments.
     '''
     def decorator(func):
-        def check_types(*args):
-            if len(args) < 3:
-                raise TypeError('Missing positional arguments: \'name\' and \'data_type\'')
-            data_type = args[2]
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def check_types(*args, **kwargs):
+            ## Positional calls skip binding the arguments to the signature
+            if len(args) >= 3:
+                data_type = args[2]
+            else:
+                try:
+                    data_type = signature.bind(*args, **kwargs).arguments['data_type']
+                except (TypeError, KeyError):
+                    raise TypeError('Missing positional arguments: \'name\' and \'data_type\'')
             if data_type not in allowed_types:
                 raise TypeError('Data type is not supported by this data structure.')
-            return func(*args)
+            return func(*args, **kwargs)
         return check_types
     return decorator
@@ -1,8 +1,10 @@
 from dsviz.drawers.avl_tree_drawer import AVLTreeDrawer
 from dsviz.drawers.bst_drawer import BSTDrawer
+from dsviz.drawers.btree_drawer import BTreeDrawer
 from dsviz.drawers.deque_drawer import DequeDrawer
 from dsviz.drawers.dll_drawer import DLLDrawer
 from dsviz.drawers.heap_drawer import HeapDrawer
 from dsviz.drawers.queue_drawer import QueueDrawer
+from dsviz.drawers.skip_list_drawer import SkipListDrawer
 from dsviz.drawers.sll_drawer import SLLDrawer
 from dsviz.drawers.stack_drawer import StackDrawer
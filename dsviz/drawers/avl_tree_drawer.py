@@ -2,23 +2,30 @@
 
 
 from dsviz.bases import Drawer
+from dsviz.drawers.bst_drawer import BSTDrawer
 import dsviz.util.drawer_utils as util
 
-from PIL import Image, ImageDraw
-
 
 class AVLTreeDrawer(Drawer):
     '''Drawer for the AVLTree data structure using the PIL.'''
 
-    WIDTH = 512
-    HEIGHT = 512
-
-    BACKGROUND_COLOR = '#FFFFFF'
-
-    HEADER_HEIGHT = 32
+    @staticmethod
+    def draw_node(draw, node, xy):
+        '''Draws a node of an AVL tree with its height in the top right
+        corner.
 
-    NODE_WIDTH = 50
-    NODE_HEIGHT = 50
+        Args:
+            draw: The object to be drawn on.
+            node: The node being drawn.
+            xy: The four points to define the bounding box.
+        '''
+        BSTDrawer.draw_node(draw, node, xy)
+        util.draw_text(
+            draw,
+            str(node.get_height()),
+            (xy[2] - 6, xy[1] - 8),
+            color='#808080'
+        )
 
     @staticmethod
     def draw(tree):
@@ -30,27 +37,4 @@ class AVLTreeDrawer(Drawer):
         Returns:
             A PIL image representing the current state of the tree.
         '''
-        width, height = AVLTreeDrawer.WIDTH, AVLTreeDrawer.HEIGHT
-        bg_color = AVLTreeDrawer.BACKGROUND_COLOR
-        image = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(image)
-
-        header_height = AVLTreeDrawer.HEADER_HEIGHT
-
-        ## Draw header
-        util.draw_text_centered(
-            draw,
-            tree.name,
-            [0, width, 0, header_height],
-            color='#000000',
-            bold=True
-        )
-
-        if tree.is_empty():
-            return image
-
-        ## Draw nodes
-
-
-
-        return image
+        return BSTDrawer.draw_tree(tree, AVLTreeDrawer.draw_node)
@@ -3,6 +3,7 @@
 
 from dsviz.bases import Drawer
 import dsviz.util.drawer_utils as util
+import dsviz.util.tree_layout as tree_layout
 
 from PIL import Image, ImageDraw
 
@@ -10,59 +11,120 @@ from PIL import Image, ImageDraw
 class BSTDrawer(Drawer):
     '''Drawer for the BinarySearchTree data structure using the PIL.'''
 
+    NODE_WIDTH = 50
+    NODE_HEIGHT = 50
+    NODE_GAP = 10
+    LEVEL_GAP = 40
+
     @staticmethod
-    def calc_width(tree):
-        return 6
+    def calc_width(xs):
+        '''Returns the width in pixels of a tree layout.'''
+        if not xs:
+            return 0
+        return int(max(xs) * (BSTDrawer.NODE_WIDTH + BSTDrawer.NODE_GAP)) + BSTDrawer.NODE_WIDTH
 
     @staticmethod
-    def calc_height(tree):
-        return 5
+    def calc_height(depths):
+        '''Returns the height in pixels of a tree layout.'''
+        if not depths:
+            return 0
+        levels = max(depths) + 1
+        return (levels * BSTDrawer.NODE_HEIGHT) + ((levels - 1) * BSTDrawer.LEVEL_GAP)
 
     @staticmethod
-    def draw_node(draw, node, coords, level_height, depth):
-        pass
-        '''
-        util.draw_ellipsis(
+    def node_box(x, depth, origin):
+        '''Returns the bounding box of a node at a position of a tree layout.'''
+        left = origin[0] + int(x * (BSTDrawer.NODE_WIDTH + BSTDrawer.NODE_GAP))
+        top = origin[1] + depth * (BSTDrawer.NODE_HEIGHT + BSTDrawer.LEVEL_GAP)
+        return [left, top, left + BSTDrawer.NODE_WIDTH, top + BSTDrawer.NODE_HEIGHT]
+
+    @staticmethod
+    def draw_node(draw, node, xy):
+        '''Draws a node of a tree. Nodes that have a color, such as the nodes
+        of a red-black tree, are filled with it.
+
+        Args:
+            draw: The object to be drawn on.
+            node: The node being drawn.
+            xy: The four points to define the bounding box.
         '''
+        color = getattr(node, 'color', None)
+        util.draw_ellipsis_with_text(
+            draw,
+            str(node.get_data()),
+            xy,
+            fill_color=color or '#FFFFFF',
+            outline_color='#000000',
+            text_color='#FFFFFF' if color else '#000000'
+        )
 
     @staticmethod
-    def draw(tree):
-        '''Draws an image of a binary search tree.
+    def draw_tree(tree, draw_node):
+        '''Draws an image of a binary tree with the shared tree layout. Trees
+        with more nodes than their render limit only have their top levels
+        drawn.
 
         Args:
             tree: The tree to be drawn.
+            draw_node: The function that draws each node.
 
         Returns:
             A PIL image representing the current state of the tree.
         '''
         bg_color        = '#FFFFFF'
         fg_color1       = '#000000'
-        fg_color2       = '#000000'
         padding_x       = 25
         padding_y       = 25
         text_padding    = 20
-        tree_width      = BSTDrawer.calc_width(tree)
-        tree_height     = BSTDrawer.calc_height(tree)
-        node_width      = 60
-        node_height     = 60
-        level_height    = 120
-        width           = (padding_x * 2) + (tree_width * 100)
-        height          = (padding_y * 2) + (level_height * tree_height)
+        min_width       = 256
+
+        nodes, left, right = tree_layout.index_tree(tree.get_root(), tree.render_limit)
+        xs, depths = tree_layout.layout(left, right)
+        width           = max(min_width, (padding_x * 2) + BSTDrawer.calc_width(xs))
+        height          = (padding_y * 2) + text_padding + BSTDrawer.calc_height(depths)
 
         image = Image.new('RGB', (width, height), bg_color)
         draw = ImageDraw.Draw(image)
 
         ## Draw header
+        header = tree.name
+        if len(nodes) < len(tree):
+            header = '{} (top {} of {} nodes)'.format(tree.name, len(nodes), len(tree))
         util.draw_text_centered(
             draw,
-            tree.name,
+            header,
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
         )
 
-        ## Draw nodes
-        start_coords = (200, 100)
-        BSTDrawer.draw_node(draw, tree.get_root(), start_coords, level_height, 0)
+        ## Center the tree, then draw the edges below the nodes
+        origin = (
+            (width - BSTDrawer.calc_width(xs)) // 2,
+            padding_y + text_padding
+        )
+        boxes = [BSTDrawer.node_box(x, depth, origin) for x, depth in zip(xs, depths)]
+        for index, box in enumerate(boxes):
+            for child in (left[index], right[index]):
+                if child != tree_layout.NIL:
+                    draw.line(
+                        [((box[0] + box[2]) // 2, box[3]),
+                         ((boxes[child][0] + boxes[child][2]) // 2, boxes[child][1])],
+                        fill=fg_color1
+                    )
+        for node, box in zip(nodes, boxes):
+            draw_node(draw, node, box)
 
         return image
+
+    @staticmethod
+    def draw(tree):
+        '''Draws an image of a binary search tree.
+
+        Args:
+            tree: The tree to be drawn.
+
+        Returns:
+            A PIL image representing the current state of the tree.
+        '''
+        return BSTDrawer.draw_tree(tree, BSTDrawer.draw_node)
@@ -0,0 +1,119 @@
+'''B-Tree Drawer.'''
+
+
+from dsviz.bases import Drawer
+import dsviz.util.drawer_utils as util
+
+from PIL import Image, ImageDraw
+
+
+class BTreeDrawer(Drawer):
+    '''Drawer for the BTree data structure using the PIL.'''
+
+    MAX_LEVEL_NODES = 16
+
+    @staticmethod
+    def draw(tree):
+        '''Draws an image of a B-tree. Each node is drawn as a row of key
+        cells, and the leaves are linked left to right. Only the top levels
+        that have at most MAX_LEVEL_NODES nodes each are drawn.
+
+        Args:
+            tree: The tree to be drawn.
+
+        Returns:
+            A PIL image representing the current state of the tree.
+        '''
+        bg_color        = '#FFFFFF'
+        fg_color1       = '#000000'
+        fg_color2       = '#000000'
+        padding_x       = 25
+        padding_y       = 25
+        text_padding    = 20
+        cell_width      = 50
+        cell_height     = 30
+        node_gap        = 25
+        level_gap       = 50
+
+        ## Collect the levels that will be drawn
+        levels = [[tree.get_root()]]
+        while levels[-1][0].get_children() is not None:
+            below = [child for node in levels[-1] for child in node.get_children()]
+            if len(below) > BTreeDrawer.MAX_LEVEL_NODES:
+                break
+            levels.append(below)
+        truncated = levels[-1][0].get_children() is not None
+
+        ## Lay out the bottom level left to right, and center every node above
+        ## over its children
+        def node_width(node):
+            return max(1, len(node.get_keys())) * cell_width
+
+        lefts = {}
+        x = padding_x
+        for node in levels[-1]:
+            lefts[id(node)] = x
+            x += node_width(node) + node_gap
+        for level in reversed(levels[:-1]):
+            min_x = padding_x
+            for node in level:
+                children = node.get_children()
+                first = lefts[id(children[0])] + node_width(children[0]) / 2
+                last = lefts[id(children[-1])] + node_width(children[-1]) / 2
+                left = max(min_x, (first + last) / 2 - node_width(node) / 2)
+                lefts[id(node)] = left
+                min_x = left + node_width(node) + node_gap
+
+        width = int(max(lefts[id(node)] + node_width(node) for level in levels for node in level)) + padding_x
+        height = (padding_y * 2) + text_padding + (cell_height * len(levels)) + (level_gap * (len(levels) - 1))
+
+        image = Image.new('RGB', (width, height), bg_color)
+        draw = ImageDraw.Draw(image)
+
+        ## Draw header
+        header = tree.name
+        if truncated:
+            header = '{} (top {} of {} levels)'.format(tree.name, len(levels), tree.get_height())
+        util.draw_text_centered(
+            draw,
+            header,
+            [0, width, 0, padding_y + text_padding],
+            color=fg_color1,
+            bold=True
+        )
+
+        if tree.is_empty():
+            return image
+
+        ## Draw nodes and the edges to their children
+        for depth, level in enumerate(levels):
+            top = padding_y + text_padding + depth * (cell_height + level_gap)
+            for node in level:
+                left = lefts[id(node)]
+                for index, key in enumerate(node.get_keys()):
+                    util.draw_rectangle_with_text(
+                        draw,
+                        str(key),
+                        [left + index * cell_width, top, left + (index + 1) * cell_width, top + cell_height],
+                        fill_color=bg_color,
+                        outline_color=fg_color1,
+                        text_color=fg_color2
+                    )
+                if depth + 1 == len(levels) or node.get_children() is None:
+                    continue
+                for index, child in enumerate(node.get_children()):
+                    child_center = lefts[id(child)] + node_width(child) / 2
+                    draw.line(
+                        [(left + index * cell_width, top + cell_height),
+                         (child_center, top + cell_height + level_gap)],
+                        fill=fg_color1
+                    )
+
+        ## Draw the links between leaves
+        if not truncated:
+            top = padding_y + text_padding + (len(levels) - 1) * (cell_height + level_gap)
+            for node in levels[-1][:-1]:
+                tail = (lefts[id(node)] + node_width(node), top + cell_height // 2)
+                util.draw_arrow(draw, tail, node_gap, 'right', fg_color2)
+
+        return image
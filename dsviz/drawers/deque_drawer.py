@@ -26,7 +26,7 @@ class DequeDrawer(Drawer):
         padding_x       = 25
         padding_y       = 25
         text_padding    = 20
-        cell_count      = len(deque)
+        cell_count      = util.visible_count(deque)
         cell_width      = 70
         cell_height     = 60
         bottom_gap      = 50
@@ -39,7 +39,7 @@ class DequeDrawer(Drawer):
         ## Draw header
         util.draw_text_centered(
             draw,
-            deque.name,
+            util.header_text(deque),
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
@@ -55,9 +55,9 @@ class DequeDrawer(Drawer):
             padding_x + cell_width,
             padding_y + cell_height + text_padding
         ]
-        for value in deque:
-            util.draw_rectangle_with_text(
-                draw,
+        for value in util.visible_items(deque):
+            util.paste_rectangle_with_text(
+                image,
                 str(value),
                 xy
             )
@@ -66,14 +66,14 @@ class DequeDrawer(Drawer):
 
         ## Draw arrow pointing to front of queue
         tail = (padding_x + (cell_width // 2), height - padding_y - (text_padding // 2))
-        util.draw_arrow(draw, tail, 30, 'up')
-        util.draw_text(draw, 'FRONT', (tail[0] - 20, tail[1] + 5))
+        util.paste_arrow(image, tail, 30, 'up')
+        util.paste_text(image, 'FRONT', (tail[0] - 20, tail[1] + 5))
 
         ## Draw arrow pointing to rear of quuee
-        if len(deque) > 1:
+        if cell_count > 1 and not util.is_truncated(deque):
             tail = (width - (padding_x + (cell_width // 2)), height - padding_y - (text_padding // 2))
-            util.draw_arrow(draw, tail, 30, 'up')
-            util.draw_text(draw, 'REAR', (tail[0] - 20, tail[1] + 5))
+            util.paste_arrow(image, tail, 30, 'up')
+            util.paste_text(image, 'REAR', (tail[0] - 20, tail[1] + 5))
 
         return image
 
@@ -81,5 +81,5 @@ class DequeDrawer(Drawer):
         ## Draw arrow pointing to back
         tail = (width - (cell_offset_x + (cell_width/2)), height - cell_offset_y + 10)
         util.draw_arrow(draw, tail, 30, 'up', width=2)
-        util.draw_text(draw, 'Rear', (tail[0]-15, tail[1]+5))
+        util.paste_text(image, 'Rear', (tail[0]-15, tail[1]+5))
         '''
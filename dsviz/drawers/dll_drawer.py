@@ -26,7 +26,7 @@ class DLLDrawer(Drawer):
         padding_x       = 25
         padding_y       = 25
         text_padding    = 20
-        cell_count      = len(linked_list)
+        cell_count      = util.visible_count(linked_list)
         cell_width      = 130
         cell_height     = 50
         node_width      = 50
@@ -43,7 +43,7 @@ class DLLDrawer(Drawer):
         ## Draw header
         util.draw_text_centered(
             draw,
-            linked_list.name,
+            util.header_text(linked_list),
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
@@ -62,8 +62,8 @@ class DLLDrawer(Drawer):
         ]
 
         ## First NULL CELL
-        util.draw_text_centered(
-            draw,
+        util.paste_text_centered(
+            image,
             'NULL',
             [xy[0], xy[2], xy[1], xy[3]],
             color=fg_color1
@@ -71,13 +71,15 @@ class DLLDrawer(Drawer):
         xy[0] += null_width + gap_width
         xy[2] += gap_width
 
-        for i, value in enumerate(linked_list):
+        for i, value in enumerate(util.visible_items(linked_list)):
             ## Draw prev box
             xy[2] += next_width
-            draw.rectangle(
+            util.paste_rectangle_with_text(
+                image,
+                '',
                 xy,
-                fill=bg_color,
-                outline=fg_color1
+                fill_color=bg_color,
+                outline_color=fg_color1
             )
             ## Draw prev arrow
             arrow_y = ((xy[1] + xy[3]) // 2) + (cell_height // 4)
@@ -85,8 +87,8 @@ class DLLDrawer(Drawer):
             if i == 0:
                 arrow_y -= (cell_height // 4)
             arrow_x = xy[0] + (next_width // 2)
-            util.draw_arrow(
-                draw,
+            util.paste_arrow(
+                image,
                 (arrow_x, arrow_y),
                 arrow_size,
                 'left',
@@ -95,8 +97,8 @@ class DLLDrawer(Drawer):
             ## Draw node with data
             xy[0] += next_width
             xy[2] += node_width
-            util.draw_rectangle_with_text(
-                draw,
+            util.paste_rectangle_with_text(
+                image,
                 str(value),
                 xy,
                 fill_color=bg_color,
@@ -106,19 +108,21 @@ class DLLDrawer(Drawer):
             ## Draw next box
             xy[0] += node_width
             xy[2] += next_width
-            draw.rectangle(
+            util.paste_rectangle_with_text(
+                image,
+                '',
                 xy,
-                fill=bg_color,
-                outline=fg_color1
+                fill_color=bg_color,
+                outline_color=fg_color1
             )
             ## Draw next arrow
             arrow_y = ((xy[1] + xy[3]) // 2) - (cell_height // 4)
             ## Make arrow centered if last next arrow
-            if i == len(linked_list) - 1:
+            if i == cell_count - 1:
                 arrow_y += (cell_height // 4)
             arrow_x = xy[0] + (next_width // 2)
-            util.draw_arrow(
-                draw,
+            util.paste_arrow(
+                image,
                 (arrow_x, arrow_y),
                 arrow_size,
                 'right',
@@ -128,11 +132,11 @@ class DLLDrawer(Drawer):
             xy[0] += gap_width
             xy[2] += gap_width
 
-        ## Last NULL cell
+        ## Last NULL cell, or an ellipsis if the drawing is truncated
         xy[2] += null_width
-        util.draw_text_centered(
-            draw,
-            'NULL',
+        util.paste_text_centered(
+            image,
+            '...' if util.is_truncated(linked_list) else 'NULL',
             [xy[0], xy[2], xy[1], xy[3]],
         )
 
@@ -2,24 +2,22 @@
 
 
 from dsviz.bases import Drawer
+from dsviz.drawers.bst_drawer import BSTDrawer
 import dsviz.util.drawer_utils as util
+import dsviz.util.tree_layout as tree_layout
 
 from PIL import Image, ImageDraw
 
+
 class HeapDrawer(Drawer):
     '''Drawer for the BinaryHeap data structure using the PIL.'''
 
-    WIDTH = 512
-    HEIGHT = 512
-
-    BACKGROUND_COLOR = '#FFFFFF'
-
-    HEADER_HEIGHT = 32
-
-
     @staticmethod
     def draw(heap):
-        '''Draws an image of a heap.
+        '''Draws an image of a heap. The array holding the heap is drawn as a
+        strip of cells, and below it the complete binary tree the array
+        represents. The position of every item is computed from its index, so
+        the heap is never traversed.
 
         Args:
             heap: The heap to be drawn.
@@ -27,28 +25,77 @@ class HeapDrawer(Drawer):
         Returns:
             A PIL image representing the current state of the heap.
         '''
-        width, height = HeapDrawer.WIDTH, HeapDrawer.HEIGHT
-        bg_color = HeapDrawer.BACKGROUND_COLOR
+        bg_color        = '#FFFFFF'
+        fg_color1       = '#000000'
+        fg_color2       = '#000000'
+        index_color     = '#808080'
+        padding_x       = 25
+        padding_y       = 25
+        text_padding    = 20
+        min_width       = 256
+        cell_width      = 50
+        cell_height     = 30
+        index_height    = 20
+        strip_gap       = 30
+
+        items = [str(item) for item in util.visible_items(heap)]
+        xs, depths = tree_layout.heap_layout(len(items))
+        strip_width     = cell_width * len(items)
+        tree_width      = BSTDrawer.calc_width(xs)
+        strip_height    = cell_height + index_height + strip_gap if items else 0
+        width           = max(min_width, (padding_x * 2) + max(strip_width, tree_width))
+        height          = (padding_y * 2) + text_padding + strip_height + BSTDrawer.calc_height(depths)
+
         image = Image.new('RGB', (width, height), bg_color)
         draw = ImageDraw.Draw(image)
 
-        header_height = HeapDrawer.HEADER_HEIGHT
-
-
-
         ## Draw header
         util.draw_text_centered(
             draw,
-            heap.name,
-            [0, width, 0, header_height],
-            color='#000000',
+            util.header_text(heap),
+            [0, width, 0, padding_y + text_padding],
+            color=fg_color1,
             bold=True
         )
 
-        if heap.is_empty():
-            pass
-
-        ## Draw nodes
-
+        ## Draw the array strip with the index of each cell below it
+        left = (width - strip_width) // 2
+        top = padding_y + text_padding
+        for index, text in enumerate(items):
+            x = left + index * cell_width
+            util.draw_rectangle_with_text(
+                draw,
+                text,
+                [x, top, x + cell_width, top + cell_height],
+                fill_color=bg_color,
+                outline_color=fg_color1,
+                text_color=fg_color2
+            )
+            util.draw_text_centered(
+                draw,
+                str(index),
+                [x, x + cell_width, top + cell_height, top + cell_height + index_height],
+                color=index_color
+            )
+
+        ## Draw the edges from each item to its parent, then the items
+        origin = ((width - tree_width) // 2, top + strip_height)
+        boxes = [BSTDrawer.node_box(x, depth, origin) for x, depth in zip(xs, depths)]
+        for index, box in enumerate(boxes[1:], 1):
+            parent = boxes[(index - 1) // 2]
+            draw.line(
+                [((parent[0] + parent[2]) // 2, parent[3]),
+                 ((box[0] + box[2]) // 2, box[1])],
+                fill=fg_color1
+            )
+        for text, box in zip(items, boxes):
+            util.draw_ellipsis_with_text(
+                draw,
+                text,
+                box,
+                fill_color=bg_color,
+                outline_color=fg_color1,
+                text_color=fg_color2
+            )
 
         return image
@@ -26,7 +26,7 @@ class QueueDrawer(Drawer):
         padding_x       = 25
         padding_y       = 25
         text_padding    = 20
-        cell_count      = len(queue)
+        cell_count      = util.visible_count(queue)
         cell_width      = 70
         cell_height     = 60
         bottom_gap      = 50
@@ -39,7 +39,7 @@ class QueueDrawer(Drawer):
         ## Draw header
         util.draw_text_centered(
             draw,
-            queue.name,
+            util.header_text(queue),
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
@@ -55,9 +55,9 @@ class QueueDrawer(Drawer):
             padding_x + cell_width,
             padding_y + cell_height + text_padding
         ]
-        for value in queue:
-            util.draw_rectangle_with_text(
-                draw,
+        for value in util.visible_items(queue):
+            util.paste_rectangle_with_text(
+                image,
                 str(value),
                 xy
             )
@@ -66,7 +66,7 @@ class QueueDrawer(Drawer):
 
         ## Draw arrow pointing to front of queue
         tail = (padding_x + (cell_width // 2), height - padding_y - (text_padding // 2))
-        util.draw_arrow(draw, tail, 30, 'up')
-        util.draw_text(draw, 'FRONT', (tail[0] - 20, tail[1]+5))
+        util.paste_arrow(image, tail, 30, 'up')
+        util.paste_text(image, 'FRONT', (tail[0] - 20, tail[1]+5))
 
         return image
@@ -0,0 +1,113 @@
+'''Skip List Drawer.'''
+
+
+from dsviz.bases import Drawer
+import dsviz.util.drawer_utils as util
+
+from PIL import Image, ImageDraw
+
+
+class SkipListDrawer(Drawer):
+    '''Drawer for the SkipList data structure using the PIL.'''
+
+    @staticmethod
+    def draw(skip_list):
+        '''Draws an image of a skip list. Each node is drawn as a tower with
+        one cell per level, and each level links a tower to the next tower
+        that is tall enough.
+
+        Args:
+            skip_list: The skip list to be drawn.
+
+        Returns:
+            A PIL image representing the current state of the skip list.
+        '''
+        bg_color        = '#FFFFFF'
+        fg_color1       = '#000000'
+        fg_color2       = '#000000'
+        padding_x       = 25
+        padding_y       = 25
+        text_padding    = 20
+        cell_count      = util.visible_count(skip_list)
+        cell_width      = 60
+        cell_height     = 30
+        gap_width       = 40
+        label_height    = 25
+        level_count     = skip_list.get_level()
+        width           = (padding_x * 2) + (cell_width * (cell_count + 2)) + (gap_width * (cell_count + 1))
+        height          = (padding_y * 2) + text_padding + (cell_height * level_count) + label_height
+
+        image = Image.new('RGB', (width, height), bg_color)
+        draw = ImageDraw.Draw(image)
+
+        ## Draw header
+        util.draw_text_centered(
+            draw,
+            util.header_text(skip_list),
+            [0, width, 0, padding_y + text_padding],
+            color=fg_color1,
+            bold=True
+        )
+
+        ## Collect the visible nodes, with the header sentinel as column 0
+        nodes = [skip_list.header]
+        node = skip_list.get_head()
+        while node is not None and len(nodes) <= cell_count:
+            nodes.append(node)
+            node = node.get_next()
+        columns = {id(node): column for column, node in enumerate(nodes)}
+        end_column = len(nodes)
+        bottom = padding_y + text_padding + (cell_height * level_count)
+
+        def column_x(column):
+            return padding_x + column * (cell_width + gap_width)
+
+        def level_y(level):
+            return bottom - (level + 1) * cell_height
+
+        ## Draw towers
+        for column, node in enumerate(nodes):
+            x = column_x(column)
+            tower_height = level_count if column == 0 else node.get_level()
+            for level in range(tower_height):
+                util.draw_rectangle_with_text(
+                    draw,
+                    '' if column == 0 else str(node.get_data()),
+                    [x, level_y(level), x + cell_width, level_y(level) + cell_height],
+                    fill_color=bg_color,
+                    outline_color=fg_color1,
+                    text_color=fg_color2
+                )
+        util.draw_text_centered(
+            draw,
+            'HEAD',
+            [column_x(0), column_x(0) + cell_width, bottom, bottom + label_height],
+            color=fg_color1
+        )
+
+        ## Draw the end of every level, or an ellipsis if the drawing is
+        ## truncated
+        x = column_x(end_column)
+        for level in range(level_count):
+            util.draw_text_centered(
+                draw,
+                '...' if util.is_truncated(skip_list) else 'NULL',
+                [x, x + cell_width, level_y(level), level_y(level) + cell_height],
+                color=fg_color1
+            )
+
+        ## Draw the links of every level
+        for column, node in enumerate(nodes):
+            for level in range(node.get_level() if column else level_count):
+                _next = node.get_next(level)
+                target = columns.get(id(_next), end_column)
+                tail = (column_x(column) + cell_width, level_y(level) + (cell_height // 2))
+                util.draw_arrow(
+                    draw,
+                    tail,
+                    column_x(target) - tail[0],
+                    'right',
+                    fg_color2
+                )
+
+        return image
@@ -26,7 +26,7 @@ class SLLDrawer(Drawer):
         padding_x    = 25
         padding_y    = 25
         text_padding = 20
-        cell_count   = len(linked_list)
+        cell_count   = util.visible_count(linked_list)
         cell_width   = 100
         cell_height  = 50
         node_width   = 50
@@ -42,7 +42,7 @@ class SLLDrawer(Drawer):
         ## Draw header
         util.draw_text_centered(
             draw,
-            linked_list.name,
+            util.header_text(linked_list),
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
@@ -59,11 +59,11 @@ class SLLDrawer(Drawer):
             padding_x,
             padding_y + text_padding + cell_height
         ]
-        for value in linked_list:
+        for value in util.visible_items(linked_list):
             ## Draw node with data
             xy[2] += node_width
-            util.draw_rectangle_with_text(
-                draw,
+            util.paste_rectangle_with_text(
+                image,
                 str(value),
                 xy,
                 fill_color=bg_color,
@@ -73,15 +73,17 @@ class SLLDrawer(Drawer):
             ## Draw next box with arrow
             xy[0] += node_width
             xy[2] += next_width
-            draw.rectangle(
+            util.paste_rectangle_with_text(
+                image,
+                '',
                 xy,
-                fill=bg_color,
-                outline=fg_color1
+                fill_color=bg_color,
+                outline_color=fg_color1
             )
             arrow_y = (xy[1] + xy[3]) // 2
             arrow_x = xy[0] + (next_width // 2)
-            util.draw_arrow(
-                draw,
+            util.paste_arrow(
+                image,
                 (arrow_x, arrow_y),
                 arrow_size,
                 'right',
@@ -93,12 +95,12 @@ class SLLDrawer(Drawer):
             xy[0] += cell_width - (node_width + next_width + gap_width)
             xy[2] += cell_width - (node_width + next_width + gap_width)
 
-        ## Draw NULL cell
+        ## Draw NULL cell, or an ellipsis if the drawing is truncated
         null_width = xy[0] + (gap_width // 2)
         null_height = (xy[1] + xy[3]) // 2 - 10
-        util.draw_text(
-            draw,
-            'NULL',
+        util.paste_text(
+            image,
+            '...' if util.is_truncated(linked_list) else 'NULL',
             (null_width, null_height),
             color=fg_color1
         )
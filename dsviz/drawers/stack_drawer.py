@@ -26,7 +26,7 @@ class StackDrawer(Drawer):
         padding_x       = 25
         padding_y       = 25
         text_padding    = 20
-        cell_count      = len(stack)
+        cell_count      = util.visible_count(stack)
         cell_width      = 100
         cell_height     = 60
         arrow_size      = 35
@@ -40,7 +40,7 @@ class StackDrawer(Drawer):
         ## Draw header
         util.draw_text_centered(
             draw,
-            stack.name,
+            util.header_text(stack),
             [0, width, 0, padding_y + text_padding],
             color=fg_color1,
             bold=True
@@ -56,9 +56,9 @@ class StackDrawer(Drawer):
             padding_x + cell_width,
             padding_y + cell_height + text_padding
         ]
-        for value in stack:
-            util.draw_rectangle_with_text(
-                draw,
+        for value in util.visible_items(stack):
+            util.paste_rectangle_with_text(
+                image,
                 str(value),
                 xy
             )
@@ -67,7 +67,7 @@ class StackDrawer(Drawer):
 
         ## Draw arrow pointing to top of stack
         tail = (width - padding_x - 40, padding_y + text_padding + (cell_height // 2))
-        util.draw_arrow(draw, tail, 50, 'left')
-        util.draw_text(draw, 'TOP', (tail[0]+10, tail[1]-9))
+        util.paste_arrow(image, tail, 50, 'left')
+        util.paste_text(image, 'TOP', (tail[0]+10, tail[1]-9))
 
         return image
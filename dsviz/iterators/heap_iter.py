@@ -5,23 +5,25 @@ class HeapIter(object):
     '''An iterator for the binary heap data structure.'''
 
     def __init__(self, iterable):
-        '''Constructor for a queue iterator.
+        '''Constructor for a heap iterator.
 
         Args:
-            itera
+            iterable: The heap to be iterated.
         '''
         self._iterable = iterable
         self._iterator = self._get_iter(iterable)
 
     @staticmethod
     def _get_iter(iterable):
-        '''A generator that yields elements of the heap.
+        '''A generator that yields elements of the heap in the order they are
+        stored.
 
         Args:
             iterable: The heap to be iterated.
         '''
-        for value in iterable.heap:
-            yield value
+        unwrap = iterable._unwrap
+        for entry in iterable.heap:
+            yield unwrap(entry)
 
     def __iter__(self):
         '''iter method overloader.'''
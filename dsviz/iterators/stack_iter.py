@@ -21,7 +21,7 @@ class StackIter(object):
         Args:
             iterable: The stack to be iterated.
         '''
-        for value in iterable.stack[::-1]:
+        for value in reversed(iterable.stack):
             yield value
 
     def __iter__(self):
@@ -1,36 +1,54 @@
 '''Iterator class for trees.'''
 
 
+from dsviz.nodes import BSTNode
+
+import dsviz.util.tree_utils as tree_utils
+
+
 class TreeIter(object):
     '''An iterator for tree data structures.'''
 
-    def __init__(self, iterable):
+    def __init__(self, iterable, reverse=False):
         '''Constructor for a tree iterator.
 
         Args:
             iterable: The tree to be iterated.
+            reverse: A boolean that if true will iterate the tree in reverse
+                order.
         '''
         self._iterable = iterable
-        self._iterator = self._get_iter(iterable)
+        self._iterator = self._get_iter(iterable, reverse)
 
     @staticmethod
-    def _get_iter(iterable):
-        '''A generator that yields elements of the tree in-order.
+    def _get_iter(iterable, reverse):
+        '''A generator that yields elements of the tree in-order. Trees of
+        nodes with parent pointers are walked by stepping from node to node in
+        constant memory, other trees with a stack.
 
         Args:
             iterable: The tree to be iterated.
+            reverse: A boolean that if true will yield the elements in reverse
+                order.
         '''
         node = iterable.get_root()
+        if isinstance(node, BSTNode):
+            node = tree_utils.rightmost(node) if reverse else tree_utils.leftmost(node)
+            step = tree_utils.predecessor if reverse else tree_utils.successor
+            while node is not None:
+                yield node.data
+                node = step(node)
+            return
+
         st = []
-        while len(st) > 0:
-            if node != None:
+        while st or node is not None:
+            if node is not None:
                 st.append(node)
-                node = node.get_left()
+                node = node.get_right() if reverse else node.get_left()
             else:
-                if len(st) > 0:
-                    node = st.pop()
-                    yield node.get_data()
-                    node = node.get_right()
+                node = st.pop()
+                yield node.get_data()
+                node = node.get_left() if reverse else node.get_right()
 
     def __iter__(self):
         '''iter method overloader.'''
@@ -1,3 +1,6 @@
 from dsviz.nodes.bst_node import BSTNode
+from dsviz.nodes.btree_node import BTreeNode
 from dsviz.nodes.dll_node import DLLNode
+from dsviz.nodes.node_pool import NodePool
+from dsviz.nodes.skip_list_node import SkipListNode
 from dsviz.nodes.sll_node import SLLNode
@@ -1,22 +1,34 @@
 '''Node used for binary search trees.'''
 
 
+RED = 'red'
+BLACK = 'black'
+
+
 class BSTNode(object):
     '''Binary search tree node.'''
 
-    def __init__(self, data=None, left=None, right=None, parent=None, height=1):
+    __slots__ = ('data', 'left', 'right', 'parent', 'height', 'size', 'color')
+
+    def __init__(self, data=None, left=None, right=None, parent=None, height=1, size=1, color=None):
         '''Constructor for a binary search tree node.
 
         Args:
             data: Data to be stored in the node.
             left: The left child of the node.
             right: The right child of the node.
+            parent: The parent of the node.
+            height: The height of the subtree rooted at the node.
+            size: The number of nodes in the subtree rooted at the node.
+            color: The color of the node in a red-black tree, RED or BLACK.
         '''
         self.data = data
         self.left = left
         self.right = right
         self.parent = parent
         self.height = height
+        self.size = size
+        self.color = color
 
     def set_data(self, data):
         '''Setter for the node's data.'''
@@ -38,6 +50,14 @@ class BSTNode(object):
         '''Setter for the node's height.'''
         self.height = height
 
+    def set_size(self, size):
+        '''Setter for the node's subtree size.'''
+        self.size = size
+
+    def set_color(self, color):
+        '''Setter for the node's color.'''
+        self.color = color
+
     def get_data(self):
         '''Getter for the node's data.'''
         return self.data
@@ -58,6 +78,14 @@ class BSTNode(object):
         '''Getter for the node's height.'''
         return self.height
 
+    def get_size(self):
+        '''Getter for the node's subtree size.'''
+        return self.size
+
+    def get_color(self):
+        '''Getter for the node's color.'''
+        return self.color
+
     def __str__(self):
         '''Returns a string representing the node's data.'''
         return str(self.data)
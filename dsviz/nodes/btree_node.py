@@ -0,0 +1,45 @@
+'''Node used for B-trees.'''
+
+
+class BTreeNode(object):
+    '''B-tree node. Internal nodes hold separator keys and one more child than
+    keys. Leaf nodes hold the keys of the tree and link to the next leaf.'''
+
+    __slots__ = ('keys', 'children', '_next')
+
+    def __init__(self, keys=None, children=None, _next=None):
+        '''Constructor for a B-tree node.
+
+        Args:
+            keys: A sorted list of the keys stored in the node.
+            children: A list of the children of an internal node, or None for
+                a leaf node.
+            _next: The next leaf node, for leaf nodes.
+        '''
+        self.keys = keys if keys is not None else []
+        self.children = children
+        self._next = _next
+
+    def set_next(self, _next):
+        '''Setter for the node's next leaf node.'''
+        self._next = _next
+
+    def get_keys(self):
+        '''Getter for the node's keys.'''
+        return self.keys
+
+    def get_children(self):
+        '''Getter for the node's children.'''
+        return self.children
+
+    def get_next(self):
+        '''Getter for the node's next leaf node.'''
+        return self._next
+
+    def is_leaf(self):
+        '''Returns true if the node is a leaf node.'''
+        return self.children is None
+
+    def __str__(self):
+        '''Returns a string representing the node's keys.'''
+        return ' | '.join(str(key) for key in self.keys)
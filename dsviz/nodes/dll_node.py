@@ -4,17 +4,22 @@
 class DLLNode(object):
     '''Doubly linked list node.'''
 
-    def __init__(self, data=None, _next=None, prev=None):
+    __slots__ = ('data', '_next', 'prev', 'owner')
+
+    def __init__(self, data=None, _next=None, prev=None, owner=None):
         '''Constructor for a doubly linked list node.
 
         Args:
             data: Data to be stored in the node.
             _next: The next node in the list.
             prev: The previous node in the list.
+            owner: The linked list holding the node, or None if the node is
+                not in a list.
         '''
         self.data = data
         self._next = _next
         self.prev = prev
+        self.owner = owner
 
     def set_data(self, data):
         '''Setter for the node's data.'''
@@ -40,6 +45,10 @@ class DLLNode(object):
         '''Getter for the node's previous node.'''
         return self.prev
 
+    def get_owner(self):
+        '''Getter for the linked list holding the node.'''
+        return self.owner
+
     def __str__(self):
         '''Returns a string representing the node's data.'''
         return str(self.data)
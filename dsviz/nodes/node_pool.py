@@ -0,0 +1,46 @@
+'''Free list of reusable nodes.'''
+
+
+class NodePool(object):
+    '''A bounded free list of nodes. Nodes that are released to the pool are
+    reset and handed out again, instead of being freed and reallocated.'''
+
+    def __init__(self, node_class, max_free=1024):
+        '''Constructor for a node pool.
+
+        Args:
+            node_class: The class of the nodes in the pool.
+            max_free: The upper limit for the number of released nodes kept by
+                the pool.
+        '''
+        self.node_class = node_class
+        self.max_free = max_free
+        self._free = []
+
+    def acquire(self, data):
+        '''Returns a node holding the given data. Released nodes are reused
+        before new nodes are allocated.
+
+        Args:
+            data: Data to be stored in the node.
+        '''
+        if self._free:
+            node = self._free.pop()
+            node.data = data
+            return node
+        return self.node_class(data)
+
+    def release(self, node):
+        '''Resets a node and returns it to the pool. The node must no longer be
+        referenced by any data structure.
+
+        Args:
+            node: The node being released.
+        '''
+        if len(self._free) < self.max_free:
+            node.__init__()
+            self._free.append(node)
+
+    def __len__(self):
+        '''Returns the number of released nodes held by the pool.'''
+        return len(self._free)
@@ -0,0 +1,42 @@
+'''Node used for skip lists.'''
+
+
+class SkipListNode(object):
+    '''Skip list node. The node links to the next node on each of its levels,
+    and level 0 links every node in order like a singly linked list.'''
+
+    __slots__ = ('data', 'forward')
+
+    def __init__(self, data=None, level=0):
+        '''Constructor for a skip list node.
+
+        Args:
+            data: Data to be stored in the node.
+            level: The number of levels the node appears on.
+        '''
+        self.data = data
+        self.forward = [None] * level
+
+    def set_data(self, data):
+        '''Setter for the node's data.'''
+        self.data = data
+
+    def set_next(self, _next, level=0):
+        '''Setter for the node's next node on a level.'''
+        self.forward[level] = _next
+
+    def get_data(self):
+        '''Getter for the node's data.'''
+        return self.data
+
+    def get_next(self, level=0):
+        '''Getter for the node's next node on a level.'''
+        return self.forward[level]
+
+    def get_level(self):
+        '''Getter for the number of levels the node appears on.'''
+        return len(self.forward)
+
+    def __str__(self):
+        '''Returns a string representing the node's data.'''
+        return str(self.data)
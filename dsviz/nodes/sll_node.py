@@ -4,6 +4,8 @@
 class SLLNode(object):
     '''Singly linked list node.'''
 
+    __slots__ = ('data', '_next')
+
     def __init__(self, data=None, _next=None):
         '''Constructor for a singly linked list node.
 
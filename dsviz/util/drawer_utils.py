@@ -1,33 +1,179 @@
 '''Utilities for data structure drawers.'''
 
+import collections
+import functools
+import itertools
 import os
 
 from dsviz import PROJECT_ROOT
-from PIL import ImageFont
+from dsviz.containers import SpriteCache
 
 
-ROBOTO_REGULAR_14 = ImageFont.truetype(
-        os.path.join(PROJECT_ROOT, 'fonts', 'ttf', 'Roboto-Regular.ttf'),
-        14)
-ROBOTO_BOLD_16 = ImageFont.truetype(
-        os.path.join(PROJECT_ROOT, 'fonts', 'ttf', 'Roboto-Bold.ttf'),
-        16)
-DEFAULT_FONT = ROBOTO_REGULAR_14
-BOLD_FONT = ROBOTO_BOLD_16
+## Fonts are loaded, and Pillow imported, the first time they are used
+FONTS = {
+    'ROBOTO_REGULAR_14': ('Roboto-Regular.ttf', 14),
+    'ROBOTO_BOLD_16': ('Roboto-Bold.ttf', 16),
+    'DEFAULT_FONT': ('Roboto-Regular.ttf', 14),
+    'BOLD_FONT': ('Roboto-Bold.ttf', 16),
+}
+ELLIPSIS = '...'
 
+## The number of measurements kept for each font
+TEXT_CACHE_SIZE = 4096
+_text_caches = collections.defaultdict(collections.OrderedDict)
 
-def get_textsize(draw, text, font=DEFAULT_FONT):
-    '''Returns the text height and width of the text.
+## Tiles pasted by the paste_* functions, shared by all drawers
+SPRITE_CACHE_SIZE = 1024
+SPRITES = SpriteCache(SPRITE_CACHE_SIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(file_name, size):
+    '''Returns a TrueType font bundled with dsviz. Each font is loaded once.
+
+    Args:
+        file_name: The file name of the font.
+        size: The size of the font in points.
+    '''
+    from PIL import ImageFont
+
+    return ImageFont.truetype(os.path.join(PROJECT_ROOT, 'fonts', 'ttf', file_name), size)
+
+
+def get_font(bold=False):
+    '''Returns the font used for text, or for bold text if bold is true.'''
+    return load_font(*FONTS['BOLD_FONT' if bold else 'DEFAULT_FONT'])
+
+
+def __getattr__(name):
+    '''Loads the font constants, such as DEFAULT_FONT, when first accessed.'''
+    if name in FONTS:
+        return load_font(*FONTS[name])
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def visible_count(data_structure):
+    '''Returns the number of items of a data structure that will be drawn.
+
+    Unbounded data structures only have their first render_limit items drawn.
+
+    Args:
+        data_structure: The data structure being drawn.
+    '''
+    limit = data_structure.render_limit
+    if limit is None:
+        return len(data_structure)
+    return min(len(data_structure), limit)
+
+
+def visible_items(data_structure):
+    '''Returns an iterator over the items of a data structure that will be
+    drawn.
+
+    Args:
+        data_structure: The data structure being drawn.
+    '''
+    return itertools.islice(data_structure, visible_count(data_structure))
+
+
+def is_truncated(data_structure):
+    '''Returns true if some items of the data structure will not be drawn.
+
+    Args:
+        data_structure: The data structure being drawn.
+    '''
+    return visible_count(data_structure) < len(data_structure)
+
+
+def header_text(data_structure):
+    '''Returns the header text for a data structure, noting how many items
+    were drawn if the drawing is truncated.
+
+    Args:
+        data_structure: The data structure being drawn.
+    '''
+    if not is_truncated(data_structure):
+        return data_structure.name
+    return '{} (first {} of {})'.format(
+            data_structure.name,
+            visible_count(data_structure),
+            len(data_structure))
+
+
+def _cached(font, key, compute):
+    '''Helper function that returns a memoized measurement for a font. Each
+    font keeps its TEXT_CACHE_SIZE most recently used measurements.'''
+    cache = _text_caches[font]
+    try:
+        cache.move_to_end(key)
+        return cache[key]
+    except KeyError:
+        value = cache[key] = compute()
+        if len(cache) > TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+
+def clear_text_cache():
+    '''Forgets every memoized text measurement.'''
+    _text_caches.clear()
+
+
+def get_textsize(draw, text, font=None):
+    '''Returns the text height and width of the text. Measurements are
+    memoized per font.
 
     Args:
         draw: The object to be drawn on.
         text: The text being evaluated.
-        font: The font of the text.
+        font: The font of the text, or None for the default font.
 
     Returns:
         A 2-tuple containing both the width and height of the text.
     '''
-    return draw.textsize(text, font=font)
+    if font is None:
+        font = get_font()
+    return _cached(font, text, lambda: draw.textsize(text, font=font))
+
+
+def _truncate_text(draw, text, width, font):
+    '''Helper function that finds the longest prefix of the text that fits
+    within the width once followed by an ellipsis, by binary search over the
+    prefix length.'''
+    best = ELLIPSIS, draw.textsize(ELLIPSIS, font=font)
+    low, high = 1, len(text) - 1
+    while low <= high:
+        middle = (low + high) // 2
+        candidate = text[:middle] + ELLIPSIS
+        size = draw.textsize(candidate, font=font)
+        if size[0] <= width:
+            best = candidate, size
+            low = middle + 1
+        else:
+            high = middle - 1
+    return best
+
+
+def fit_text(draw, text, width, font=None):
+    '''Returns the text, truncated with an ellipsis if it is wider than the
+    given width, and its size. Results are memoized per font.
+
+    Args:
+        draw: The object to be drawn on.
+        text: The text being evaluated.
+        width: The width available for the text.
+        font: The font of the text, or None for the default font.
+
+    Returns:
+        A 2-tuple of the text that fits and its size. If not even the
+            ellipsis fits, the ellipsis is returned.
+    '''
+    if font is None:
+        font = get_font()
+    size = get_textsize(draw, text, font)
+    if size[0] <= width:
+        return text, size
+    return _cached(font, (text, width), lambda: _truncate_text(draw, text, width, font))
 
 
 def draw_text(
@@ -45,9 +191,7 @@ def draw_text(
         color: The color to use for the text.
         bold: A boolean that if true will draw the text in bold.
     '''
-    font = DEFAULT_FONT
-    if bold:
-        font = BOLD_FONT
+    font = get_font(bold)
     draw.text(xy, text, font=font, fill=color)
 
 
@@ -66,20 +210,9 @@ def draw_text_centered(
         color: The color to use for the text.
         bold: A boolean that if true will draw the text in bold.
     '''
-    font = DEFAULT_FONT
-    if bold:
-        font = BOLD_FONT
-    text_width, text_height = get_textsize(draw, text, font)
+    font = get_font(bold)
     width, height = xy[1]-xy[0], xy[3]-xy[2]
-
-    if text_width > width:
-        text = text[:-3] + '...'
-        text_width, text_height = get_textsize(draw, text, font)
-
-    ## Delete characters from the right until text_width is less than width
-    while text_width > width:
-        text = text[:-4] + '...'
-        text_width, text_height = get_textsize(draw, text, font)
+    text, (text_width, text_height) = fit_text(draw, text, width, font)
 
     draw.text(
             (((width-text_width)/2)+xy[0], ((height-text_height)/2)+xy[2]),
@@ -127,7 +260,7 @@ def draw_ellipsis_with_text(
         outline_color: The color to use for the outline.
         text_color: The color to use for the text.
     '''
-    draw.ellipsis(xy, fill=fill_color, outline=outline_color)
+    draw.ellipse(xy, fill=fill_color, outline=outline_color)
     xy = [xy[0], xy[2], xy[1], xy[3]]
     draw_text_centered(draw, text, xy, color=text_color)
 
@@ -165,3 +298,144 @@ def draw_arrow(
         head = (tail[0]+size, tail[1])
         draw.line([tail, head], fill=color, width=width)
         draw.polygon([head, (head[0]-10, head[1]-6), (head[0]-10, head[1]+6)], fill=color)
+
+
+def _new_tile(size):
+    '''Helper function that returns a transparent tile and an object to draw
+    on it.'''
+    from PIL import Image, ImageDraw
+
+    tile = Image.new('RGBA', size, (0, 0, 0, 0))
+    return tile, ImageDraw.Draw(tile)
+
+
+def _paste(image, tile, position, opaque=False):
+    '''Helper function that pastes a tile onto an image through its
+    transparency, unless the tile is opaque.'''
+    image.paste(tile, (int(position[0]), int(position[1])), None if opaque else tile)
+
+
+def paste_text(
+        image,
+        text,
+        xy,
+        color='#000000',
+        bold=False):
+    '''Pastes text on an image starting at the given dimensions, like
+    draw_text, from the sprite cache.
+
+    Args:
+        image: The image to be drawn on.
+        text: The text being drawn.
+        xy: A pair of xy coordinates where the text will start.
+        color: The color to use for the text.
+        bold: A boolean that if true will draw the text in bold.
+    '''
+    def render():
+        tile, draw = _new_tile((1, 1))
+        width, height = get_textsize(draw, text, get_font(bold))
+        tile, draw = _new_tile((width + 4, height + 4))
+        draw_text(draw, text, (0, 0), color=color, bold=bold)
+        return tile
+
+    key = ('bold_text' if bold else 'text', None, (color,), text)
+    _paste(image, SPRITES.get(key, render), xy)
+
+
+def paste_text_centered(
+        image,
+        text,
+        xy,
+        color='#000000',
+        bold=False):
+    '''Pastes text on an image centered within the given dimensions, like
+    draw_text_centered, from the sprite cache.
+
+    Args:
+        image: The image to be drawn on.
+        text: The text being drawn.
+        xy: The four points to define the bounding box.
+        color: The color to use for the text.
+        bold: A boolean that if true will draw the text in bold.
+    '''
+    size = (xy[1] - xy[0], xy[3] - xy[2])
+
+    def render():
+        tile, draw = _new_tile((size[0] + 1, size[1] + 1))
+        draw_text_centered(draw, text, [0, size[0], 0, size[1]], color=color, bold=bold)
+        return tile
+
+    key = ('bold_text_centered' if bold else 'text_centered', size, (color,), text)
+    _paste(image, SPRITES.get(key, render), (xy[0], xy[2]))
+
+
+def paste_rectangle_with_text(
+        image,
+        text,
+        xy,
+        fill_color='#FFFFFF',
+        outline_color='#000000',
+        text_color='#000000'):
+    '''Pastes a rectangle on an image with text centered inside, like
+    draw_rectangle_with_text, from the sprite cache.
+
+    Args:
+        image: The image to be drawn on.
+        text: The text being drawn.
+        xy: The four points to define the bounding box.
+        fill_color: The color to use for the fill.
+        outline_color: The color to use for the outline.
+        text_color: The color to use for the text.
+    '''
+    size = (xy[2] - xy[0], xy[3] - xy[1])
+
+    def render():
+        tile, draw = _new_tile((size[0] + 1, size[1] + 1))
+        draw_rectangle_with_text(
+                draw,
+                text,
+                [0, 0, size[0], size[1]],
+                fill_color=fill_color,
+                outline_color=outline_color,
+                text_color=text_color)
+        return tile
+
+    key = ('rectangle', size, (fill_color, outline_color, text_color), text)
+    _paste(image, SPRITES.get(key, render), (xy[0], xy[1]), opaque=fill_color is not None)
+
+
+def paste_arrow(
+        image,
+        tail,
+        size,
+        direction,
+        color='#000000',
+        width=1):
+    '''Pastes an arrow on an image, like draw_arrow, from the sprite cache.
+
+    Args:
+        image: The image to be drawn on.
+        tail: A pair of coordinates where the tail of the arrow is.
+        size: The length of the arrow.
+        direction: A string representing the direction of the arrow (up, down, left, right).
+        color: The color to use for the arrow.
+        width: The width of the arrow.
+    '''
+    ## The tile leaves room for the arrowhead on every side of the arrow
+    margin = max(10, 6 + width)
+    local_tail = {
+        'up': (margin, margin + size),
+        'down': (margin, margin),
+        'left': (margin + size, margin),
+        'right': (margin, margin),
+    }[direction]
+
+    def render():
+        length, breadth = size + (margin * 2) + 1, (margin * 2) + 1
+        horizontal = direction in ('left', 'right')
+        tile, draw = _new_tile((length, breadth) if horizontal else (breadth, length))
+        draw_arrow(draw, local_tail, size, direction, color=color, width=width)
+        return tile
+
+    key = ('arrow_' + direction, (size, width), (color,), '')
+    _paste(image, SPRITES.get(key, render), (tail[0] - local_tail[0], tail[1] - local_tail[1]))
@@ -0,0 +1,123 @@
+'''Utilities for binary heaps stored in containers other than lists.
+
+The heapq module only operates on lists. These functions implement the same
+min-heap operations for any mutable sequence, such as a typed array.
+'''
+
+
+def _sift_up(heap, pos):
+    '''Moves the item at the given position up until its parent is no larger.
+
+    Args:
+        heap: The heap being updated.
+        pos: The position of the item being moved.
+    '''
+    item = heap[pos]
+    while pos > 0:
+        parent_pos = (pos - 1) >> 1
+        parent = heap[parent_pos]
+        if not item < parent:
+            break
+        heap[pos] = parent
+        pos = parent_pos
+    heap[pos] = item
+
+
+def _sift_down(heap, pos):
+    '''Moves the item at the given position down until its children are no
+    smaller.
+
+    Args:
+        heap: The heap being updated.
+        pos: The position of the item being moved.
+    '''
+    end_pos = len(heap)
+    item = heap[pos]
+    child_pos = 2 * pos + 1
+    while child_pos < end_pos:
+        right_pos = child_pos + 1
+        if right_pos < end_pos and heap[right_pos] < heap[child_pos]:
+            child_pos = right_pos
+        if not heap[child_pos] < item:
+            break
+        heap[pos] = heap[child_pos]
+        pos = child_pos
+        child_pos = 2 * pos + 1
+    heap[pos] = item
+
+
+def heappush(heap, item):
+    '''Pushes an item onto the heap.
+
+    Args:
+        heap: The heap being pushed to.
+        item: The item being pushed.
+    '''
+    heap.append(item)
+    _sift_up(heap, len(heap) - 1)
+
+
+def heappop(heap):
+    '''Pops the smallest item off the heap.
+
+    Args:
+        heap: The heap being popped from.
+
+    Returns:
+        The smallest item of the heap.
+
+    Raises:
+        IndexError: If the heap is empty.
+    '''
+    last = heap.pop()
+    if len(heap) == 0:
+        return last
+    item = heap[0]
+    heap[0] = last
+    _sift_down(heap, 0)
+    return item
+
+
+def heapify(heap):
+    '''Transforms a sequence into a heap in linear time.
+
+    Args:
+        heap: The sequence being transformed.
+    '''
+    for pos in range(len(heap) // 2 - 1, -1, -1):
+        _sift_down(heap, pos)
+
+
+def heappushpop(heap, item):
+    '''Pushes an item onto the heap, then pops the smallest item off it.
+
+    Args:
+        heap: The heap being updated.
+        item: The item being pushed.
+
+    Returns:
+        The smallest of the item and the items of the heap.
+    '''
+    if len(heap) > 0 and heap[0] < item:
+        item, heap[0] = heap[0], item
+        _sift_down(heap, 0)
+    return item
+
+
+def heapreplace(heap, item):
+    '''Pops the smallest item off the heap, then pushes an item onto it.
+
+    Args:
+        heap: The heap being updated.
+        item: The item being pushed.
+
+    Returns:
+        The smallest item of the heap before the item was pushed.
+
+    Raises:
+        IndexError: If the heap is empty.
+    '''
+    smallest = heap[0]
+    heap[0] = item
+    _sift_down(heap, 0)
+    return smallest
@@ -0,0 +1,125 @@
+'''Utilities for binary max heaps.
+
+These functions mirror the heapq module, but keep the largest item at the top
+of the heap. They let max heaps compare their items directly instead of
+wrapping every item in an object with a reversed comparison.
+'''
+
+
+def _sift_up(heap, pos):
+    '''Moves the item at the given position up until its parent is no
+    smaller.
+
+    Args:
+        heap: The heap being updated.
+        pos: The position of the item being moved.
+    '''
+    item = heap[pos]
+    while pos > 0:
+        parent_pos = (pos - 1) >> 1
+        parent = heap[parent_pos]
+        if not parent < item:
+            break
+        heap[pos] = parent
+        pos = parent_pos
+    heap[pos] = item
+
+
+def _sift_down(heap, pos):
+    '''Moves the item at the given position down until its children are no
+    larger.
+
+    Args:
+        heap: The heap being updated.
+        pos: The position of the item being moved.
+    '''
+    end_pos = len(heap)
+    item = heap[pos]
+    child_pos = 2 * pos + 1
+    while child_pos < end_pos:
+        right_pos = child_pos + 1
+        if right_pos < end_pos and heap[child_pos] < heap[right_pos]:
+            child_pos = right_pos
+        if not item < heap[child_pos]:
+            break
+        heap[pos] = heap[child_pos]
+        pos = child_pos
+        child_pos = 2 * pos + 1
+    heap[pos] = item
+
+
+def heappush(heap, item):
+    '''Pushes an item onto the heap.
+
+    Args:
+        heap: The heap being pushed to.
+        item: The item being pushed.
+    '''
+    heap.append(item)
+    _sift_up(heap, len(heap) - 1)
+
+
+def heappop(heap):
+    '''Pops the largest item off the heap.
+
+    Args:
+        heap: The heap being popped from.
+
+    Returns:
+        The largest item of the heap.
+
+    Raises:
+        IndexError: If the heap is empty.
+    '''
+    last = heap.pop()
+    if len(heap) == 0:
+        return last
+    item = heap[0]
+    heap[0] = last
+    _sift_down(heap, 0)
+    return item
+
+
+def heapify(heap):
+    '''Transforms a sequence into a max heap in linear time.
+
+    Args:
+        heap: The sequence being transformed.
+    '''
+    for pos in range(len(heap) // 2 - 1, -1, -1):
+        _sift_down(heap, pos)
+
+
+def heappushpop(heap, item):
+    '''Pushes an item onto the heap, then pops the largest item off it.
+
+    Args:
+        heap: The heap being updated.
+        item: The item being pushed.
+
+    Returns:
+        The largest of the item and the items of the heap.
+    '''
+    if len(heap) > 0 and item < heap[0]:
+        item, heap[0] = heap[0], item
+        _sift_down(heap, 0)
+    return item
+
+
+def heapreplace(heap, item):
+    '''Pops the largest item off the heap, then pushes an item onto it.
+
+    Args:
+        heap: The heap being updated.
+        item: The item being pushed.
+
+    Returns:
+        The largest item of the heap before the item was pushed.
+
+    Raises:
+        IndexError: If the heap is empty.
+    '''
+    largest = heap[0]
+    heap[0] = item
+    _sift_down(heap, 0)
+    return largest
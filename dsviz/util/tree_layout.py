@@ -0,0 +1,183 @@
+'''Utilities for laying out binary trees for drawing.
+
+The layout follows the Reingold-Tilford algorithm: every subtree is laid out on
+its own, and the right subtree of a node is then pushed as close to the left
+subtree as the contours facing each other allow. Contours are followed through
+threads set on the deepest nodes of shallower subtrees, so the whole layout
+takes O(n) time. Subtrees are drawn identically wherever they appear, parents
+are centered over their children, and no two nodes on a level overlap.
+
+Trees are given as index arrays so that node based trees, array trees and
+implicit heaps share a single layout. Node 0 is the root, missing children are
+NIL, and every child has a larger index than its parent.
+'''
+
+
+NIL = -1
+
+
+def index_tree(root, limit=None):
+    '''Numbers the nodes of a binary tree in level order.
+
+    Args:
+        root: The root node of the tree, or None for an empty tree. Nodes are
+            walked with get_left and get_right.
+        limit: An optional upper limit for the number of nodes. Only the top
+            levels of the tree that fit within the limit are numbered, and the
+            root is always numbered.
+
+    Returns:
+        A 3-tuple of the list of nodes, and the lists holding the index of
+            the left and right child of each node.
+    '''
+    if root is None:
+        return [], [], []
+
+    nodes, left, right = [root], [NIL], [NIL]
+    start = 0
+    while start < len(nodes):
+        stop = len(nodes)
+        below = []
+        for node in nodes[start:stop]:
+            below.append(node.get_left())
+            below.append(node.get_right())
+        if limit is not None and stop + len(below) - below.count(None) > limit:
+            break
+
+        for index, child in enumerate(below):
+            if child is None:
+                continue
+            children = right if index % 2 else left
+            children[start + index // 2] = len(nodes)
+            nodes.append(child)
+            left.append(NIL)
+            right.append(NIL)
+        start = stop
+    return nodes, left, right
+
+
+def heap_tree(count):
+    '''Returns the lists holding the index of the left and right child of
+    each node of an implicit heap with count items.'''
+    left = [2 * index + 1 if 2 * index + 1 < count else NIL for index in range(count)]
+    right = [2 * index + 2 if 2 * index + 2 < count else NIL for index in range(count)]
+    return left, right
+
+
+def heap_layout(count):
+    '''Computes the position of every item of an implicit heap with count
+    items directly from its index, in a single pass with no traversal.
+
+    Item i lies on level d = log2(i + 1), at position i + 1 - 2**d of that
+    level. Positions on the bottom level are one unit apart, and each level
+    above doubles the spacing, which centers every parent over its children.
+
+    Returns:
+        A 2-tuple of the lists holding the x coordinate and the depth of each
+            item. The leftmost item has an x coordinate of 0.
+    '''
+    bottom = count.bit_length() - 1
+    depths = [(index + 1).bit_length() - 1 for index in range(count)]
+    xs = [(index + 1.5 - (1 << depth)) * (1 << (bottom - depth)) - 0.5
+          for index, depth in enumerate(depths)]
+    return xs, depths
+
+
+def layout(left, right, separation=1.0):
+    '''Computes the position of every node of a binary tree.
+
+    Args:
+        left: A list holding the index of the left child of each node.
+        right: A list holding the index of the right child of each node.
+        separation: The minimum horizontal distance between two nodes on the
+            same level.
+
+    Returns:
+        A 2-tuple of the lists holding the x coordinate and the depth of each
+            node. The leftmost node has an x coordinate of 0.
+    '''
+    count = len(left)
+    if not count:
+        return [], []
+
+    offset = [0.0] * count      ## x relative to the parent
+    thread = [NIL] * count      ## next contour node of a subtree's deepest node
+    thread_offset = [0.0] * count
+    height = [0] * count
+    leftmost = list(range(count))       ## deepest node on the left contour
+    leftmost_x = [0.0] * count          ## its x relative to the subtree root
+    rightmost = list(range(count))
+    rightmost_x = [0.0] * count
+
+    def next_left(node):
+        '''Returns the next node on a left contour and its relative x.'''
+        if left[node] != NIL:
+            return left[node], offset[left[node]]
+        if right[node] != NIL:
+            return right[node], offset[right[node]]
+        return thread[node], thread_offset[node]
+
+    def next_right(node):
+        '''Returns the next node on a right contour and its relative x.'''
+        if right[node] != NIL:
+            return right[node], offset[right[node]]
+        if left[node] != NIL:
+            return left[node], offset[left[node]]
+        return thread[node], thread_offset[node]
+
+    ## Lay out the subtrees bottom-up
+    for node in range(count - 1, -1, -1):
+        l, r = left[node], right[node]
+        if l == NIL and r == NIL:
+            continue
+        if r == NIL or l == NIL:
+            child = l if r == NIL else r
+            offset[child] = separation / 2 if r == child else -separation / 2
+            height[node] = height[child] + 1
+            leftmost[node], rightmost[node] = leftmost[child], rightmost[child]
+            leftmost_x[node] = leftmost_x[child] + offset[child]
+            rightmost_x[node] = rightmost_x[child] + offset[child]
+            continue
+
+        ## Walk the right contour of the left subtree and the left contour of
+        ## the right subtree, level by level, for the distance between them
+        u, u_x, v, v_x = l, 0.0, r, 0.0
+        shift = separation
+        while True:
+            shift = max(shift, u_x - v_x + separation)
+            next_u, du = next_right(u)
+            next_v, dv = next_left(v)
+            if next_u == NIL or next_v == NIL:
+                break
+            u, u_x, v, v_x = next_u, u_x + du, next_v, v_x + dv
+
+        offset[l], offset[r] = -shift / 2, shift / 2
+        height[node] = max(height[l], height[r]) + 1
+
+        ## Thread the deepest node of the shallower subtree to the contour of
+        ## the deeper one
+        if height[l] < height[r]:
+            target = leftmost[l]
+            thread[target] = next_v
+            thread_offset[target] = (offset[r] + v_x + dv) - (offset[l] + leftmost_x[l])
+            leftmost[node], leftmost_x[node] = leftmost[r], leftmost_x[r] + offset[r]
+        else:
+            leftmost[node], leftmost_x[node] = leftmost[l], leftmost_x[l] + offset[l]
+        if height[r] < height[l]:
+            target = rightmost[r]
+            thread[target] = next_u
+            thread_offset[target] = (offset[l] + u_x + du) - (offset[r] + rightmost_x[r])
+            rightmost[node], rightmost_x[node] = rightmost[l], rightmost_x[l] + offset[l]
+        else:
+            rightmost[node], rightmost_x[node] = rightmost[r], rightmost_x[r] + offset[r]
+
+    ## Accumulate the relative positions top-down
+    xs = [0.0] * count
+    depths = [0] * count
+    for node in range(count):
+        for child in (left[node], right[node]):
+            if child != NIL:
+                xs[child] = xs[node] + offset[child]
+                depths[child] = depths[node] + 1
+    least = min(xs)
+    return [x - least for x in xs], depths
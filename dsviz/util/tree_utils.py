@@ -0,0 +1,220 @@
+'''Utilities for binary search trees.'''
+
+
+def balanced_layout(count):
+    '''Lays out a perfectly balanced binary search tree over sorted values.
+
+    The values are identified by their positions 0 to count-1 in sorted order.
+    Every subtree is rooted at the middle of its range of positions, so the
+    tree is built in a single O(n) pass without recursion.
+
+    Args:
+        count: The number of values in the tree.
+
+    Returns:
+        A 5-tuple of the root position, and lists holding the left child
+            position, right child position, height and subtree size of each
+            position. Missing children and the root of an empty tree are -1.
+    '''
+    left = [-1] * count
+    right = [-1] * count
+    heights = [0] * count
+    sizes = [0] * count
+    if count == 0:
+        return -1, left, right, heights, sizes
+
+    root = (count - 1) // 2
+    stack = [(0, count, root)]
+    while stack:
+        lo, hi, mid = stack.pop()
+        heights[mid] = (hi - lo).bit_length()
+        sizes[mid] = hi - lo
+        if lo < mid:
+            child = (lo + mid - 1) // 2
+            left[mid] = child
+            stack.append((lo, mid, child))
+        if mid + 1 < hi:
+            child = (mid + hi) // 2
+            right[mid] = child
+            stack.append((mid + 1, hi, child))
+    return root, left, right, heights, sizes
+
+
+def node_size(node):
+    '''Returns the number of nodes in the subtree rooted at a node, or 0 for a
+    missing node.'''
+    if node is None:
+        return 0
+    return node.size
+
+
+def select(root, rank):
+    '''Returns the value with the given rank in a size augmented tree.
+
+    Args:
+        root: The root node of the tree.
+        rank: The number of values before the wanted value in sorted order.
+            It must be between 0 and the size of the tree.
+    '''
+    node = root
+    while True:
+        left_size = node_size(node.left)
+        if rank < left_size:
+            node = node.left
+        elif rank == left_size:
+            return node.data
+        else:
+            rank -= left_size + 1
+            node = node.right
+
+
+def rank(root, value):
+    '''Returns the number of values less than a value in a size augmented
+    tree.
+
+    Args:
+        root: The root node of the tree.
+        value: The value being ranked. It does not need to be in the tree.
+    '''
+    count = 0
+    node = root
+    while node is not None:
+        if node.data < value:
+            count += node_size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def irange(root, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+    '''A generator that yields the values of a tree between two bounds in
+    order. The first value is found by a single descent and the rest by
+    stepping along parent pointers, so a query costs O(height + k) for k
+    yielded values and no extra memory.
+
+    Args:
+        root: The root node of the tree. The nodes must have parent pointers.
+        minimum: The lower bound, or None for no lower bound.
+        maximum: The upper bound, or None for no upper bound.
+        inclusive: A pair of booleans that if true will include values equal
+            to the lower and upper bound respectively.
+        reverse: A boolean that if true will yield the values in descending
+            order.
+    '''
+    low_inclusive, high_inclusive = inclusive
+
+    def above_minimum(value):
+        return minimum is None or minimum < value or (low_inclusive and minimum == value)
+
+    def below_maximum(value):
+        return maximum is None or value < maximum or (high_inclusive and value == maximum)
+
+    ## Find the node where iteration starts
+    start = None
+    node = root
+    while node is not None:
+        if reverse:
+            if below_maximum(node.data):
+                start = node
+                node = node.right
+            else:
+                node = node.left
+        elif above_minimum(node.data):
+            start = node
+            node = node.left
+        else:
+            node = node.right
+
+    before_stop = above_minimum if reverse else below_maximum
+    step = predecessor if reverse else successor
+    node = start
+    while node is not None and before_stop(node.data):
+        yield node.data
+        node = step(node)
+
+
+def floor(root, value):
+    '''Returns the greatest value of a tree that is less than or equal to a
+    value, or None if there is no such value.
+
+    Args:
+        root: The root node of the tree.
+        value: The value being looked up.
+    '''
+    result = None
+    node = root
+    while node is not None:
+        if node.data == value:
+            return node.data
+        if node.data < value:
+            result = node.data
+            node = node.right
+        else:
+            node = node.left
+    return result
+
+
+def ceiling(root, value):
+    '''Returns the least value of a tree that is greater than or equal to a
+    value, or None if there is no such value.
+
+    Args:
+        root: The root node of the tree.
+        value: The value being looked up.
+    '''
+    result = None
+    node = root
+    while node is not None:
+        if node.data == value:
+            return node.data
+        if value < node.data:
+            result = node.data
+            node = node.left
+        else:
+            node = node.right
+    return result
+
+
+def leftmost(node):
+    '''Returns the node with the least value in the subtree rooted at a node.'''
+    while node.left is not None:
+        node = node.left
+    return node
+
+
+def rightmost(node):
+    '''Returns the node with the greatest value in the subtree rooted at a
+    node.'''
+    while node.right is not None:
+        node = node.right
+    return node
+
+
+def successor(node):
+    '''Returns the node that follows a node in order, or None if it is the
+    last node. The nodes must have parent pointers. Stepping through a whole
+    tree this way takes amortized O(1) per step and no extra memory.
+
+    Args:
+        node: The node whose successor is returned.
+    '''
+    if node.right is not None:
+        return leftmost(node.right)
+    while node.parent is not None and node.parent.right is node:
+        node = node.parent
+    return node.parent
+
+
+def predecessor(node):
+    '''Returns the node that precedes a node in order, or None if it is the
+    first node. The nodes must have parent pointers.
+
+    Args:
+        node: The node whose predecessor is returned.
+    '''
+    if node.left is not None:
+        return rightmost(node.left)
+    while node.parent is not None and node.parent.left is node:
+        node = node.parent
+    return node.parent
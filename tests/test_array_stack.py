@@ -45,6 +45,15 @@ def test_constructor_with_excessive_size_limit():
     assert bool_stack.max_size == 16
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_stack = ArrayStack('my int stack', int, None)
+    assert int_stack.max_size is None
+    assert int_stack.is_unbounded()
+    for i in range(100):
+        int_stack.push(i)
+    assert len(int_stack) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         float_stack = ArrayStack('my float stack', float, -1)
@@ -102,6 +111,26 @@ def test_peek_with_empty_stack(empty_int_stack):
         empty_int_stack.peek()
 
 
+def test_export(full_int_stack):
+    view = full_int_stack.export()
+    assert view.format == 'q'
+    assert view.tolist() == [1, 2, 3, 4]
+    view.release()
+    assert full_int_stack.pop() == 4
+
+
+def test_export_with_str_stack(empty_str_stack):
+    with pytest.raises(TypeError):
+        empty_str_stack.export()
+
+
+def test_push_with_large_int(empty_int_stack):
+    empty_int_stack.push(1)
+    empty_int_stack.push(2 ** 80)
+    assert empty_int_stack.pop() == 2 ** 80
+    assert empty_int_stack.pop() == 1
+
+
 ## Render tests
 
 from dsviz import PROJECT_ROOT
@@ -153,3 +182,13 @@ def test_render_str_stack(random_str_stack, save_path):
 
 def test_render_float_stack(random_float_stack, save_path):
     random_float_stack.render(save_path)
+
+
+def test_render_unbounded_stack(save_path):
+    stack = ArrayStack('TEST Example Unbounded Stack', int, None)
+    full_stack = ArrayStack('', int)
+    for i in range(1000):
+        stack.push(i)
+    for i in range(16):
+        full_stack.push(i)
+    assert stack.render(save_path).size == full_stack.render().size
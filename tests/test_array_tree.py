@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+
+import pytest
+import pickle
+import random
+
+from dsviz.containers import ArrayTree
+from dsviz.containers.array_tree import NIL
+
+
+## Helpers
+
+def check_avl(tree, index):
+    '''Returns the height of a subtree after checking its AVL invariants.'''
+    if index == NIL:
+        return 0
+    left_height = check_avl(tree, tree.left[index])
+    right_height = check_avl(tree, tree.right[index])
+    assert abs(left_height - right_height) <= 1
+    assert tree.heights[index] == 1 + max(left_height, right_height)
+    assert tree.sizes[index] == 1 + tree._size(tree.left[index]) + tree._size(tree.right[index])
+    return tree.heights[index]
+
+
+## Fixtures
+
+@pytest.fixture
+def int_tree():
+    tree = ArrayTree(int)
+    for value in [50, 20, 70, 10, 30, 60, 80, 25]:
+        tree.insert(value)
+    return tree
+
+
+## Container tests
+
+def test_insert(int_tree):
+    assert len(int_tree) == 8
+    assert list(int_tree) == [10, 20, 25, 30, 50, 60, 70, 80]
+    assert int_tree.keys.typecode == 'q'
+    check_avl(int_tree, int_tree.root)
+
+
+def test_insert_sorted_keys():
+    tree = ArrayTree(int)
+    for value in range(1000):
+        tree.insert(value)
+    assert tree.heights[tree.root] <= 11
+    check_avl(tree, tree.root)
+
+
+def test_delete(int_tree):
+    assert int_tree.delete(20)
+    assert not int_tree.delete(20)
+    assert int_tree.delete(50)
+    assert len(int_tree) == 6
+    assert list(int_tree) == [10, 25, 30, 60, 70, 80]
+    check_avl(int_tree, int_tree.root)
+
+
+def test_delete_reuses_slots(int_tree):
+    int_tree.delete(10)
+    int_tree.delete(80)
+    int_tree.insert(5)
+    int_tree.insert(90)
+    assert len(int_tree.keys) == 8
+
+
+def test_random_operations():
+    tree = ArrayTree(int)
+    expected = []
+    for _ in range(2000):
+        value = random.randint(0, 200)
+        if random.random() < 0.6:
+            tree.insert(value)
+            expected.append(value)
+        else:
+            assert tree.delete(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+    assert list(tree) == sorted(expected)
+    check_avl(tree, tree.root)
+
+
+def test_select_and_rank():
+    tree = ArrayTree(int)
+    expected = []
+    for _ in range(1000):
+        value = random.randint(0, 100)
+        if random.random() < 0.6:
+            tree.insert(value)
+            expected.append(value)
+        elif tree.delete(value):
+            expected.remove(value)
+    expected.sort()
+    check_avl(tree, tree.root)
+    assert [tree.select(rank) for rank in range(len(tree))] == expected
+    for value in range(102):
+        assert tree.rank(value) == len([key for key in expected if key < value])
+    with pytest.raises(IndexError):
+        tree.select(len(tree))
+
+
+def test_irange(int_tree):
+    assert list(int_tree.irange(20, 60)) == [20, 25, 30, 50, 60]
+    assert list(int_tree.irange(20, 60, (False, False))) == [25, 30, 50]
+    assert list(int_tree.irange(reverse=True)) == [80, 70, 60, 50, 30, 25, 20, 10]
+    assert int_tree.floor(55) == 50
+    assert int_tree.ceiling(55) == 60
+    assert int_tree.ceiling(81) is None
+
+
+def test_irange_with_empty_range(int_tree):
+    assert list(int_tree.irange(90)) == []
+    assert list(int_tree.irange(maximum=5, reverse=True)) == []
+    assert list(int_tree.irange(80, inclusive=(False, True))) == []
+    assert list(int_tree.irange(maximum=10, inclusive=(True, False), reverse=True)) == []
+
+
+def test_search(int_tree):
+    assert int_tree.search(25)
+    assert not int_tree.search(26)
+
+
+def test_str_keys():
+    tree = ArrayTree(str, False)
+    for value in ['b', 'a', 'c']:
+        tree.insert(value)
+    assert tree.get_root().get_data() == 'b'
+    assert tree.get_root().get_left().get_data() == 'a'
+    assert tree.get_root().get_right().get_right() == None
+
+
+def test_copy(int_tree):
+    snapshot = int_tree.copy()
+    int_tree.delete(50)
+    assert snapshot.search(50)
+    assert list(snapshot) == [10, 20, 25, 30, 50, 60, 70, 80]
+
+
+def test_pickle(int_tree):
+    tree = pickle.loads(pickle.dumps(int_tree))
+    assert list(tree) == list(int_tree)
@@ -2,6 +2,7 @@
 
 
 import pytest
+import random
 
 
 from dsviz import AVLTree
@@ -48,6 +49,15 @@ def test_constructor_with_excessive_size_limit():
     assert float_avl.max_size == 32
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_avl = AVLTree('my int avl', int, None)
+    assert int_avl.max_size is None
+    assert int_avl.is_unbounded()
+    for i in range(100):
+        int_avl.insert(i)
+    assert len(int_avl) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         int_avl = AVLTree('my int avl', int, -1)
@@ -113,7 +123,217 @@ def test_iter(full_int_avl_tree):
     values = []
     for node_value in full_int_avl_tree:
         values.append(node_value)
-    assert values == sorted(values)
+    assert values == [10, 20, 25, 30, 40, 50]
+
+
+def test_reversed(full_int_avl_tree):
+    assert list(reversed(full_int_avl_tree)) == [50, 40, 30, 25, 20, 10]
+
+
+def test_irange(full_int_avl_tree):
+    assert list(full_int_avl_tree.irange(20, 40)) == [20, 25, 30, 40]
+    assert list(full_int_avl_tree.irange(20, 40, (False, False))) == [25, 30]
+    assert list(full_int_avl_tree.irange(maximum=25)) == [10, 20, 25]
+    assert list(full_int_avl_tree.irange(26, reverse=True)) == [50, 40, 30]
+    assert list(full_int_avl_tree.irange(41, 49)) == []
+
+
+def test_range(full_int_avl_tree):
+    assert list(full_int_avl_tree.range(20, 40)) == [20, 25, 30]
+
+
+def test_irange_with_invalid_type(full_int_avl_tree):
+    with pytest.raises(TypeError):
+        full_int_avl_tree.irange(1.5)
+
+
+def test_floor_and_ceiling(full_int_avl_tree):
+    assert full_int_avl_tree.floor(26) == 25
+    assert full_int_avl_tree.floor(30) == 30
+    assert full_int_avl_tree.floor(5) is None
+    assert full_int_avl_tree.ceiling(26) == 30
+    assert full_int_avl_tree.ceiling(10) == 10
+    assert full_int_avl_tree.ceiling(51) is None
+
+
+def check_avl(node):
+    '''Returns the height of a subtree after checking its AVL invariants and
+    subtree sizes.'''
+    if node is None:
+        return 0
+    left_height = check_avl(node.get_left())
+    right_height = check_avl(node.get_right())
+    assert abs(left_height - right_height) <= 1
+    assert node.get_height() == 1 + max(left_height, right_height)
+    for child in [node.get_left(), node.get_right()]:
+        if child is not None and hasattr(child, 'parent'):
+            assert child.get_parent() is node
+    left_size = node.get_left().get_size() if node.get_left() else 0
+    right_size = node.get_right().get_size() if node.get_right() else 0
+    assert node.get_size() == 1 + left_size + right_size
+    return node.get_height()
+
+
+def test_random_operations():
+    avl = AVLTree('', int, None)
+    expected = set()
+    for _ in range(2000):
+        value = random.randint(0, 300)
+        if value in expected:
+            avl.delete(value)
+            expected.remove(value)
+        else:
+            avl.insert(value)
+            expected.add(value)
+        assert len(avl) == len(expected)
+    check_avl(avl.get_root())
+    assert avl.get_root() is None or avl.get_root().get_parent() is None
+    ordered = sorted(expected)
+    for value in range(301):
+        assert avl.search(value) == (value in expected)
+        assert avl.rank(value) == len([item for item in ordered if item < value])
+    assert [avl[index] for index in range(len(avl))] == ordered
+    assert list(avl) == ordered
+    assert list(reversed(avl)) == ordered[::-1]
+    for low, high in [(0, 300), (50, 60), (100, 99)]:
+        assert list(avl.irange(low, high)) == [item for item in ordered if low <= item <= high]
+        assert list(avl.range(low, high)) == [item for item in ordered if low <= item < high]
+
+
+def test_delete_with_double_rotation():
+    avl = AVLTree('', int)
+    for value in [20, 10, 30, 25]:
+        avl.insert(value)
+    avl.delete(10)
+    assert avl.get_root().get_data() == 25
+    check_avl(avl.get_root())
+
+
+def test_from_iterable():
+    avl = AVLTree.from_iterable('', int, [5, 3, 9, 1, 7, 3], 32)
+    assert len(avl) == 6
+    assert avl.get_root().get_data() == 3
+    check_avl(avl.get_root())
+    for value in [1, 3, 5, 7, 9]:
+        assert avl.search(value)
+    avl.insert(4)
+    avl.delete(3)
+    check_avl(avl.get_root())
+
+
+def test_from_iterable_with_sorted_values():
+    avl = AVLTree.from_iterable('', int, range(1000), None)
+    assert len(avl) == 1000
+    assert avl.get_root().get_height() == 10
+    check_avl(avl.get_root())
+
+
+def test_from_iterable_with_invalid_type():
+    with pytest.raises(TypeError):
+        AVLTree.from_iterable('', int, [1, 2.5])
+
+
+def test_from_iterable_with_excessive_size():
+    with pytest.raises(IndexError):
+        AVLTree.from_iterable('', int, range(33))
+
+
+def test_from_iterable_with_compact_tree():
+    avl = AVLTree.from_iterable('', float, [2.5, 0.5, 1.5], 32, True)
+    assert list(avl) == [0.5, 1.5, 2.5]
+    assert avl.get_root().get_data() == 1.5
+    avl.insert(3.5)
+    avl.delete(0.5)
+    assert list(avl) == [1.5, 2.5, 3.5]
+
+
+def test_compact_avl_tree():
+    avl = AVLTree('', int, None, True)
+    for value in range(100):
+        avl.insert(value)
+    avl.delete(50)
+    avl.delete(500)
+    assert len(avl) == 99
+    assert avl.search(99)
+    assert not avl.search(50)
+    assert list(avl) == [value for value in range(100) if value != 50]
+    assert avl.get_root().get_height() == 7
+
+
+def test_select_and_rank(full_int_avl_tree):
+    values = [10, 20, 25, 30, 40, 50]
+    for index, value in enumerate(values):
+        assert full_int_avl_tree.select(index) == value
+        assert full_int_avl_tree.rank(value) == values.index(value)
+    assert full_int_avl_tree[-1] == values[-1]
+    assert full_int_avl_tree.rank(values[-1] + 1) == len(values)
+
+
+def test_select_out_of_range(full_int_avl_tree):
+    with pytest.raises(IndexError):
+        full_int_avl_tree.select(len(full_int_avl_tree))
+    with pytest.raises(IndexError):
+        full_int_avl_tree[-len(full_int_avl_tree) - 1]
+
+
+def test_rank_with_invalid_type(full_int_avl_tree):
+    with pytest.raises(TypeError):
+        full_int_avl_tree.rank('a')
+
+
+def test_select_and_rank_with_compact_tree():
+    avl = AVLTree.from_iterable('', int, range(0, 200, 2), None, True)
+    avl.delete(100)
+    avl.insert(101)
+    assert avl[50] == 101
+    assert avl.rank(101) == 50
+    assert avl.rank(1000) == 100
+    check_avl(avl.get_root())
+
+
+def test_irange_with_duplicates():
+    avl = AVLTree('', int, None)
+    for value in [5, 5, 5, 3, 7, 5]:
+        avl.insert(value)
+    assert list(avl.irange(5, 5)) == [5, 5, 5, 5]
+    assert list(avl.irange(5, 7, (False, True))) == [7]
+    assert list(avl.irange(3, 5, (True, False), True)) == [3]
+
+
+def test_irange_with_compact_tree():
+    avl = AVLTree.from_iterable('', int, range(1000), None, True)
+    assert list(avl.range(10, 15)) == [10, 11, 12, 13, 14]
+    assert list(avl.irange(995, reverse=True)) == [999, 998, 997, 996, 995]
+    assert list(reversed(avl))[:2] == [999, 998]
+    assert avl.floor(-1) is None
+    assert avl.ceiling(500) == 500
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_irange_with_empty_range(compact):
+    avl = AVLTree.from_iterable('', int, [1, 2, 3], 32, compact)
+    assert list(avl.irange(10)) == []
+    assert list(avl.irange(10, reverse=True)) == []
+    assert list(avl.irange(maximum=0)) == []
+    assert list(avl.irange(maximum=0, reverse=True)) == []
+    assert list(avl.irange(3, inclusive=(False, True))) == []
+    assert list(avl.irange(maximum=1, inclusive=(True, False), reverse=True)) == []
+    assert list(avl.irange(2, 2, (False, False))) == []
+    assert list(AVLTree('', int, 32, compact).irange()) == []
+
+
+def test_snapshot():
+    avl = AVLTree('', str, 32, True)
+    avl.insert('a')
+    snapshot = avl.snapshot()
+    avl.insert('b')
+    assert len(snapshot) == 1
+    assert list(snapshot) == ['a']
+
+
+def test_snapshot_with_node_tree(full_int_avl_tree):
+    with pytest.raises(TypeError):
+        full_int_avl_tree.snapshot()
 
 
 ## Render tests
@@ -167,3 +387,17 @@ def test_render_str_avl_tree(random_str_avl_tree, save_path):
 
 def test_render_float_avl_tree(random_float_avl_tree, save_path):
     random_float_avl_tree.render(save_path)
+
+
+def test_render_large_avl_tree():
+    avl = AVLTree.from_iterable('TEST Large AVL Tree', int, range(2000), None)
+    avl.render_limit = None
+    image = avl.render()
+    assert image.size[0] > 1000 * 50
+    assert image.size[1] < 12 * 100
+
+
+def test_render_unbounded_avl_tree_draws_top_levels():
+    avl = AVLTree.from_iterable('TEST Unbounded AVL Tree', int, range(100), None)
+    small = AVLTree.from_iterable('TEST Small AVL Tree', int, range(31))
+    assert avl.render().size == small.render().size
@@ -59,6 +59,15 @@ def test_constructor_with_excessive_size_limit():
     assert str_min_heap.max_size == 32
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_min_heap = BinaryHeap('my int min heap', int, None)
+    assert int_min_heap.max_size is None
+    assert int_min_heap.is_unbounded()
+    for i in range(100):
+        int_min_heap.insert(i)
+    assert len(int_min_heap) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         int_max_heap = BinaryHeap('my int max heap', int, -1, False)
@@ -126,6 +135,149 @@ def test_peek_with_empty_heap(empty_str_max_heap):
         empty_str_max_heap.peek()
 
 
+def test_str_max_heap(empty_str_max_heap):
+    values = ['abc', 'zzzzz', 'bar', 'foo', 'ba', 'cba']
+    empty_str_max_heap.insert_many(values[:2])
+    for value in values[2:]:
+        empty_str_max_heap.insert(value)
+    assert all(type(entry) == str for entry in empty_str_max_heap.heap)
+    assert empty_str_max_heap.pushpop('zzzzzz') == 'zzzzzz'
+    assert empty_str_max_heap.replace('a') == 'zzzzz'
+    assert empty_str_max_heap.extract_many(6) == ['foo', 'cba', 'bar', 'ba', 'abc', 'a']
+
+
+def test_float_max_heap():
+    heap = BinaryHeap('', float, 32, False)
+    for value in [0.5, -2.25, 3.0]:
+        heap.insert(value)
+    assert all(type(entry) == float for entry in heap.heap)
+    assert heap.peek() == 3.0
+    assert heap.extract_many(3) == [3.0, 0.5, -2.25]
+
+
+def test_iter(full_int_max_heap):
+    values = list(full_int_max_heap)
+    assert values[0] == 20
+    assert sorted(values) == [-500, 0, 5, 17, 18, 20]
+
+
+def test_from_iterable():
+    heap = BinaryHeap.from_iterable('', int, [5, -500, 20, 17, 18, 0], 32, False)
+    assert len(heap) == 6
+    assert heap.extract_many(6) == [20, 18, 17, 5, 0, -500]
+
+
+def test_from_iterable_with_invalid_type():
+    with pytest.raises(TypeError):
+        BinaryHeap.from_iterable('', int, [1, 'a'])
+
+
+def test_insert_with_trusted_heap():
+    heap = BinaryHeap(name='', data_type=int, compact=True)
+    with heap.unchecked():
+        heap.insert_many(range(10, 0, -1))
+        heap.insert(0)
+    assert heap.extract_many(3) == [0, 1, 2]
+
+
+def test_insert_with_overfilled_heap():
+    heap = BinaryHeap.from_iterable('', int, [3, 1, 2], 3)
+    with heap.unchecked():
+        heap.insert(0)
+    assert len(heap) == 4
+    with pytest.raises(IndexError):
+        heap.insert(4)
+    with pytest.raises(IndexError):
+        heap.insert_many([4])
+
+
+def test_insert_many(full_str_min_heap):
+    heap = BinaryHeap('', str, 32)
+    heap.insert_many(['abc', 'zzzzz', 'bar'])
+    heap.insert_many(['foo'])
+    heap.insert_many(['ba', 'cba'])
+    assert heap.extract_many(6) == sorted(['abc', 'zzzzz', 'bar', 'foo', 'ba', 'cba'])
+
+
+def test_insert_many_with_full_heap(full_str_min_heap):
+    with pytest.raises(IndexError):
+        full_str_min_heap.insert_many(['a'])
+    assert len(full_str_min_heap) == 6
+
+
+def test_extract_many_with_too_few_values(full_int_max_heap):
+    with pytest.raises(IndexError):
+        full_int_max_heap.extract_many(7)
+    assert len(full_int_max_heap) == 6
+
+
+def test_pushpop(full_int_max_heap):
+    assert full_int_max_heap.pushpop(100) == 100
+    assert full_int_max_heap.pushpop(1) == 20
+    assert len(full_int_max_heap) == 6
+    assert full_int_max_heap.peek() == 18
+
+
+def test_replace(full_str_min_heap):
+    assert full_str_min_heap.replace('a') == 'abc'
+    assert full_str_min_heap.peek() == 'a'
+    assert len(full_str_min_heap) == 6
+
+
+def test_replace_with_empty_heap(empty_int_min_heap):
+    with pytest.raises(IndexError):
+        empty_int_min_heap.replace(1)
+
+
+def test_compact_batch_operations():
+    heap = BinaryHeap.from_iterable('', int, [7, 3, 9, 1], None, False, True)
+    heap.insert_many([4, 8])
+    assert heap.pushpop(10) == 10
+    assert heap.replace(0) == 9
+    assert heap.extract_many(6) == [8, 7, 4, 3, 1, 0]
+    heap.insert_many([1, 2 ** 70])
+    assert heap.extract_many(2) == [2 ** 70, 1]
+
+
+def test_compact_min_heap():
+    heap = BinaryHeap('', float, 32, True, True)
+    for value in [3.5, -1.0, 7.25, 0.0]:
+        heap.insert(value)
+    assert heap.peek() == -1.0
+    assert [heap.extract() for _ in range(4)] == [-1.0, 0.0, 3.5, 7.25]
+
+
+def test_compact_max_heap():
+    heap = BinaryHeap('', int, 32, False, True)
+    for value in [5, -500, 20, 17, 18, 0]:
+        heap.insert(value)
+    assert heap.peek() == 20
+    assert [heap.extract() for _ in range(6)] == [20, 18, 17, 5, 0, -500]
+
+
+def test_compact_heap_with_large_int():
+    heap = BinaryHeap('', int, 32, True, True)
+    heap.insert(1)
+    heap.insert(-2 ** 80)
+    assert heap.extract() == -2 ** 80
+    assert heap.extract() == 1
+
+
+def test_export():
+    heap = BinaryHeap('', int, 32, True, True)
+    for value in [3, 1, 2]:
+        heap.insert(value)
+    view = heap.export()
+    assert view.format == 'q'
+    assert view[0] == 1
+    assert sorted(view.tolist()) == [1, 2, 3]
+
+
+def test_export_with_list_storage(full_int_max_heap):
+    with pytest.raises(TypeError):
+        full_int_max_heap.export()
+
+
 ## Render tests
 
 from dsviz import PROJECT_ROOT
@@ -177,3 +329,16 @@ def test_render_str_max_heap(random_str_max_heap, save_path):
 
 def test_render_float_min_heap(random_float_min_heap, save_path):
     random_float_min_heap.render(save_path)
+
+
+def test_render_size_grows_with_heap():
+    small = BinaryHeap.from_iterable('TEST Small Heap', int, range(3))
+    large = BinaryHeap.from_iterable('TEST Large Heap', int, range(32))
+    assert small.render().size < large.render().size
+
+
+def test_render_width_scales_with_heap():
+    heap = BinaryHeap.from_iterable('TEST Unbounded Heap', int, range(1000), None)
+    heap.render_limit = None
+    width, height = heap.render().size
+    assert 1000 * 50 <= width < 1000 * 70
@@ -6,6 +6,8 @@ import pytest
 
 from dsviz import BinarySearchTree
 
+import dsviz.util.tree_utils as tree_utils
+
 
 ## Fixtures
 
@@ -50,6 +52,15 @@ def test_constructor_with_excessive_size_limit():
     assert float_bst.max_size == 32
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_bst = BinarySearchTree('my int bst', int, None)
+    assert int_bst.max_size is None
+    assert int_bst.is_unbounded()
+    for i in range(100):
+        int_bst.insert(i)
+    assert len(int_bst) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         int_bst = BinarySearchTree('my int bst', int, -20)
@@ -112,7 +123,111 @@ def test_iter(full_int_bst):
     values = []
     for node_value in full_int_bst:
         values.append(node_value)
-    assert values == sorted(values)
+    assert values == [10, 20, 30, 40, 50, 70, 80, 100]
+
+
+def test_reversed(full_int_bst):
+    assert list(reversed(full_int_bst)) == [100, 80, 70, 50, 40, 30, 20, 10]
+
+
+def test_irange(full_int_bst):
+    assert list(full_int_bst.irange(30, 70)) == [30, 40, 50, 70]
+    assert list(full_int_bst.irange(30, 70, (False, False))) == [40, 50]
+    assert list(full_int_bst.irange(maximum=20)) == [10, 20]
+    assert list(full_int_bst.irange(60, reverse=True)) == [100, 80, 70]
+    assert list(full_int_bst.range(20, 50)) == [20, 30, 40]
+
+
+def test_floor_and_ceiling(full_int_bst):
+    assert full_int_bst.floor(65) == 50
+    assert full_int_bst.floor(9) is None
+    assert full_int_bst.ceiling(65) == 70
+    assert full_int_bst.ceiling(101) is None
+    with pytest.raises(TypeError):
+        full_int_bst.floor('a')
+
+
+def test_insert_sorted_values():
+    bst = BinarySearchTree('', int, None)
+    for value in range(5000):
+        bst.insert(value)
+    assert bst.search(4999)
+    bst.delete(0)
+    bst.delete(4999)
+    assert len(bst) == 4998
+    assert not bst.search(4999)
+    assert list(bst) == list(range(1, 4999))
+    assert next(reversed(bst)) == 4998
+
+
+def test_from_iterable():
+    bst = BinarySearchTree.from_iterable('', str, ['d', 'b', 'a', 'c', 'e'])
+    assert len(bst) == 5
+    assert bst.get_root().get_data() == 'c'
+    assert bst.get_root().get_left().get_data() == 'a'
+    assert bst.search('e')
+
+
+def test_from_iterable_with_invalid_type():
+    with pytest.raises(TypeError):
+        BinarySearchTree.from_iterable('', str, ['a', 1])
+
+
+def test_compact_bst():
+    bst = BinarySearchTree('', int, 32, True)
+    for value in [3, 1, 2, 5, 4]:
+        bst.insert(value)
+    bst.delete(3)
+    assert len(bst) == 4
+    assert list(bst) == [1, 2, 4, 5]
+    assert bst.get_root().get_data() == 4
+    assert not bst.search(3)
+
+
+def test_select_and_rank():
+    bst = BinarySearchTree('', int, None)
+    for value in [50, 20, 70, 10, 30, 60, 80, 25, 65]:
+        bst.insert(value)
+    bst.delete(20)
+    bst.delete(70)
+    values = [10, 25, 30, 50, 60, 65, 80]
+    assert [bst[index] for index in range(len(bst))] == values
+    assert [bst.rank(value) for value in values] == list(range(len(values)))
+    assert bst.rank(0) == 0
+    assert bst[-1] == 80
+    with pytest.raises(IndexError):
+        bst.select(7)
+
+
+def test_parent_pointers(full_int_bst):
+    full_int_bst.delete(20)
+    full_int_bst.delete(50)
+    nodes = [full_int_bst.get_root()]
+    assert nodes[0].get_parent() is None
+    for node in nodes:
+        for child in [node.get_left(), node.get_right()]:
+            if child is not None:
+                assert child.get_parent() is node
+                nodes.append(child)
+    assert len(nodes) == len(full_int_bst)
+
+
+def test_successor_and_predecessor(full_int_bst):
+    node = tree_utils.leftmost(full_int_bst.get_root())
+    values = []
+    while node is not None:
+        values.append(node.get_data())
+        node = tree_utils.successor(node)
+    assert values == [10, 20, 30, 40, 50, 70, 80, 100]
+    node = tree_utils.rightmost(full_int_bst.get_root())
+    assert tree_utils.predecessor(node).get_data() == 80
+
+
+def test_select_and_rank_with_compact_tree():
+    bst = BinarySearchTree.from_iterable('', str, 'dbca', 32, True)
+    bst.insert('e')
+    assert bst.select(4) == 'e'
+    assert bst.rank('c') == 2
 
 
 ## Render tests
@@ -166,3 +281,11 @@ def test_render_str_bst(random_str_bst, save_path):
 
 def test_render_float_bst(random_float_bst, save_path):
     random_float_bst.render(save_path)
+
+
+def test_render_degenerate_bst():
+    bst = BinarySearchTree('TEST Degenerate BST', int)
+    for value in range(32):
+        bst.insert(value)
+    width, height = bst.render().size
+    assert height > 32 * 50
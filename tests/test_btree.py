@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+
+import pytest
+import random
+
+
+from dsviz import BTree
+
+
+## Helpers
+
+def check_btree(tree):
+    '''Checks the ordering, fill and depth invariants of a B-tree and returns
+    its keys, read from the linked leaves.'''
+    leaves = []
+
+    def check(node, low, high, depth, is_root):
+        keys = node.get_keys()
+        assert keys == sorted(set(keys))
+        assert len(keys) <= tree.max_keys
+        if not is_root:
+            assert len(keys) >= tree.min_keys
+        assert all((low is None or low <= key) and (high is None or key < high) for key in keys)
+        if node.is_leaf():
+            leaves.append((node, depth))
+            return
+        children = node.get_children()
+        assert len(children) == len(keys) + 1
+        bounds = [low] + keys + [high]
+        for index, child in enumerate(children):
+            check(child, bounds[index], bounds[index + 1], depth + 1, False)
+
+    check(tree.get_root(), None, None, 1, True)
+    assert len(set(depth for _, depth in leaves)) == 1
+    for (leaf, _), (_next, _) in zip(leaves, leaves[1:]):
+        assert leaf.get_next() is _next
+    assert leaves[-1][0].get_next() is None
+    return [key for leaf, _ in leaves for key in leaf.get_keys()]
+
+
+## Fixtures
+
+@pytest.fixture
+def empty_int_btree():
+    return BTree('', int)
+
+
+@pytest.fixture
+def full_int_btree():
+    btree = BTree('', int, 8)
+    for value in [50, 20, 80, 10, 30, 70, 60, 40]:
+        btree.insert(value)
+    return btree
+
+
+## Data structures tests
+
+def test_constructor_with_default_size_limit():
+    int_btree = BTree('my int btree', int)
+    assert int_btree.max_size == 32
+    assert int_btree.order == 4
+
+
+def test_constructor_with_unbounded_size_limit():
+    int_btree = BTree('my int btree', int, None, 64)
+    assert int_btree.is_unbounded()
+    assert int_btree.max_keys == 63
+
+
+def test_constructor_with_invalid_order():
+    with pytest.raises(ValueError):
+        BTree('my int btree', int, 32, 2)
+
+
+def test_constructor_with_invalid_type():
+    with pytest.raises(TypeError):
+        BTree('my bool btree', bool)
+
+
+def test_insert(full_int_btree):
+    assert len(full_int_btree) == 8
+    assert list(full_int_btree) == [10, 20, 30, 40, 50, 60, 70, 80]
+    assert full_int_btree.get_height() == 2
+    check_btree(full_int_btree)
+
+
+def test_insert_existing_value(empty_int_btree):
+    empty_int_btree.insert(1)
+    empty_int_btree.insert(1)
+    assert len(empty_int_btree) == 1
+
+
+def test_insert_with_invalid_type(empty_int_btree):
+    with pytest.raises(TypeError):
+        empty_int_btree.insert('a')
+
+
+def test_insert_with_full_btree(full_int_btree):
+    with pytest.raises(IndexError):
+        full_int_btree.insert(90)
+
+
+def test_insert_existing_value_with_full_btree(full_int_btree):
+    full_int_btree.insert(50)
+    assert len(full_int_btree) == 8
+    check_btree(full_int_btree)
+
+
+def test_delete(full_int_btree):
+    for value in [10, 20, 35, 80]:
+        full_int_btree.delete(value)
+    assert list(full_int_btree) == [30, 40, 50, 60, 70]
+    assert len(full_int_btree) == 5
+    check_btree(full_int_btree)
+    for value in [30, 40, 50, 60, 70]:
+        full_int_btree.delete(value)
+    assert full_int_btree.is_empty()
+    assert full_int_btree.get_height() == 1
+
+
+def test_delete_with_invalid_type(full_int_btree):
+    with pytest.raises(TypeError):
+        full_int_btree.delete(1.5)
+
+
+def test_search(full_int_btree):
+    assert full_int_btree.search(60)
+    assert not full_int_btree.search(65)
+    assert 60 in full_int_btree
+    assert '60' not in full_int_btree
+
+
+@pytest.mark.parametrize('order', [3, 4, 5, 8])
+def test_random_operations(order):
+    btree = BTree('', int, None, order)
+    expected = set()
+    for _ in range(3000):
+        value = random.randint(0, 500)
+        if random.random() < 0.55:
+            btree.insert(value)
+            expected.add(value)
+        else:
+            btree.delete(value)
+            expected.discard(value)
+    assert check_btree(btree) == sorted(expected)
+    assert len(btree) == len(expected)
+
+
+def test_irange(full_int_btree):
+    assert list(full_int_btree.irange(20, 60)) == [20, 30, 40, 50, 60]
+    assert list(full_int_btree.irange(20, 60, (False, False))) == [30, 40, 50]
+    assert list(full_int_btree.irange(maximum=25)) == [10, 20]
+    assert list(full_int_btree.irange(65)) == [70, 80]
+    assert list(full_int_btree.range(30, 70)) == [30, 40, 50, 60]
+    assert list(full_int_btree.irange(81)) == []
+    with pytest.raises(TypeError):
+        full_int_btree.irange('a')
+
+
+def test_from_iterable():
+    btree = BTree.from_iterable('', int, [5, 3, 9, 1, 7, 3], 32, 3)
+    assert check_btree(btree) == [1, 3, 5, 7, 9]
+    btree.insert(4)
+    btree.delete(3)
+    assert check_btree(btree) == [1, 4, 5, 7, 9]
+
+
+@pytest.mark.parametrize('count', [0, 1, 7, 64, 1000])
+def test_from_iterable_with_sorted_values(count):
+    btree = BTree.from_iterable('', int, range(count), None, 8)
+    assert len(btree) == count
+    if count:
+        assert check_btree(btree) == list(range(count))
+    assert list(btree.range(count // 2, count // 2 + 3)) == list(range(count // 2, min(count, count // 2 + 3)))
+
+
+def test_from_iterable_with_excessive_size():
+    with pytest.raises(IndexError):
+        BTree.from_iterable('', int, range(33))
+
+
+def test_large_tree_is_shallow():
+    btree = BTree.from_iterable('', int, range(100000), None, 64)
+    assert btree.get_height() == 3
+    btree.delete(500)
+    assert not btree.search(500)
+    assert list(btree.irange(498, 502)) == [498, 499, 501, 502]
+
+
+## Render tests
+
+from dsviz import PROJECT_ROOT
+
+import os
+import string
+
+
+@pytest.fixture
+def random_int_btree():
+    btree = BTree('TEST Example Integer BTree', int)
+    for _ in range(random.randint(1, 32)):
+        btree.insert(random.randint(-999, 999))
+    return btree
+
+
+@pytest.fixture
+def random_str_btree():
+    btree = BTree('TEST Example String BTree', str, 32, 5)
+    for _ in range(random.randint(1, 32)):
+        random_string = ''.join(
+                random.choice(string.ascii_letters + string.digits)
+                for _ in range(random.randint(1, 5)))
+        btree.insert(random_string)
+    return btree
+
+
+@pytest.fixture
+def save_path():
+    return os.path.join(PROJECT_ROOT, os.pardir, 'images')
+
+
+def test_render_int_btree(random_int_btree, save_path):
+    random_int_btree.render(save_path)
+
+
+def test_render_str_btree(random_str_btree, save_path):
+    random_str_btree.render(save_path)
+
+
+def test_render_empty_btree(empty_int_btree, save_path):
+    empty_int_btree.render(save_path)
+
+
+def test_render_unbounded_btree(save_path):
+    btree = BTree.from_iterable('TEST Example Unbounded BTree', int, range(100000), None, 8)
+    image = btree.render(save_path)
+    assert image.size[0] < 2000
@@ -46,6 +46,15 @@ def test_constructor_with_excessive_size_limit():
     assert bool_deque.max_size == 16
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_deque = DoubleEndedQueue('my int deque', int, None)
+    assert int_deque.max_size is None
+    assert int_deque.is_unbounded()
+    for i in range(100):
+        int_deque.enqueue_back(i)
+    assert len(int_deque) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         float_deque = DoubleEndedQueue('my float deque', float, -1)
@@ -94,6 +103,17 @@ def test_enqueue_back_with_full_deque(full_int_deque):
         full_int_deque.enqueue_back(5)
 
 
+def test_enqueue_with_overfilled_deque(full_int_deque):
+    with full_int_deque.unchecked():
+        full_int_deque.enqueue_front(5)
+        full_int_deque.enqueue_back(0)
+    assert list(full_int_deque) == [5, 4, 3, 2, 1, 0]
+    with pytest.raises(IndexError, match='max size limit'):
+        full_int_deque.enqueue_front(6)
+    with pytest.raises(IndexError, match='max size limit'):
+        full_int_deque.enqueue_back(6)
+
+
 def test_dequeue_front(full_int_deque):
     assert len(full_int_deque) == 4
     val1 = full_int_deque.dequeue_front()
@@ -154,6 +174,19 @@ def test_peek_back_with_empty_deque(empty_int_deque):
         empty_int_deque.peek_back()
 
 
+def test_export(full_int_deque):
+    full_int_deque.dequeue_back()
+    full_int_deque.enqueue_front(0)
+    view = full_int_deque.export()
+    assert view.tolist() == list(full_int_deque)
+
+
+def test_enqueue_with_large_int(empty_int_deque):
+    empty_int_deque.enqueue_back(1)
+    empty_int_deque.enqueue_front(-2 ** 70)
+    assert list(empty_int_deque) == [-2 ** 70, 1]
+
+
 ## Render tests
 
 from dsviz import PROJECT_ROOT
@@ -55,6 +55,15 @@ def test_constructor_with_excessive_size_limit():
     assert float_dll.max_size == 16
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_dll = DoublyLinkedList('my int dll', int, None)
+    assert int_dll.max_size is None
+    assert int_dll.is_unbounded()
+    for i in range(100):
+        int_dll.append(i)
+    assert len(int_dll) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         float_dll = DoublyLinkedList('my float dll', float, -2)
@@ -150,6 +159,185 @@ def test_delete_with_invalid_type(int_dll):
         int_dll.delete('abc')
 
 
+def test_delete_tail(int_dll):
+    int_dll.delete(4)
+    int_dll.append(5)
+    assert list(int_dll) == [1, 2, 3, 5]
+    assert int_dll.get_tail().get_prev().get_data() == 3
+
+
+def test_pop_back(int_dll):
+    assert int_dll.pop_back() == 4
+    assert int_dll.pop_back() == 3
+    assert len(int_dll) == 2
+    assert list(int_dll) == [1, 2]
+    int_dll.pop_back()
+    int_dll.pop_back()
+    assert int_dll.is_empty()
+    assert int_dll.get_head() == None
+
+
+def test_pop_back_with_empty_dll(empty_int_dll):
+    with pytest.raises(IndexError):
+        empty_int_dll.pop_back()
+
+
+def test_peek_back(int_dll):
+    assert int_dll.peek_back() == 4
+    int_dll.prepend(0)
+    assert int_dll.peek_back() == 4
+    assert len(int_dll) == 5
+
+
+def test_peek_back_with_empty_dll(empty_int_dll):
+    with pytest.raises(IndexError):
+        empty_int_dll.peek_back()
+
+
+def test_from_iterable():
+    dll = DoublyLinkedList.from_iterable('', int, range(5))
+    assert list(dll) == [0, 1, 2, 3, 4]
+    assert dll.peek_back() == 4
+
+
+def test_from_iterable_with_invalid_type():
+    with pytest.raises(TypeError):
+        DoublyLinkedList.from_iterable('', int, ['a'])
+
+
+def test_extend(int_dll):
+    int_dll.extend([7, 8])
+    assert list(int_dll) == [1, 2, 3, 4, 7, 8]
+    assert int_dll.pop_back() == 8
+    assert int_dll.peek_back() == 7
+
+
+def test_extend_with_full_dll():
+    dll = DoublyLinkedList('', int, 4)
+    dll.append(1)
+    with pytest.raises(IndexError):
+        dll.extend([2, 3, 4, 5])
+    assert list(dll) == [1]
+
+
+def test_contains(int_dll):
+    assert 3 in int_dll
+    assert 5 not in int_dll
+
+
+def test_indexed_dll():
+    dll = DoublyLinkedList('', str, None, True)
+    dll.extend(['a', 'b', 'c', 'b'])
+    dll.prepend('b')
+    dll.insert(1, 'd')
+    assert 'd' in dll
+    assert dll.search('e') == -1
+    dll.delete('a')
+    assert 'a' not in dll
+    dll.delete('b')
+    assert list(dll) == ['d', 'b', 'c', 'b']
+    assert dll.pop_back() == 'b'
+    dll.delete('b')
+    assert 'b' not in dll
+    dll.delete('c')
+    dll.delete('d')
+    assert dll.is_empty()
+    assert dll.get_tail() is None
+
+
+def test_node_handles(empty_int_dll):
+    middle = empty_int_dll.append(2)
+    first = empty_int_dll.prepend(1)
+    last = empty_int_dll.insert_after(middle, 4)
+    empty_int_dll.insert_before(last, 3)
+    empty_int_dll.insert_before(first, 0)
+    empty_int_dll.insert_after(last, 5)
+    assert list(empty_int_dll) == [0, 1, 2, 3, 4, 5]
+    assert empty_int_dll.get_tail().get_data() == 5
+    assert empty_int_dll.insert(1, 9).get_data() == 9
+
+
+def test_remove(int_dll):
+    head = int_dll.get_head()
+    tail = int_dll.get_tail()
+    assert int_dll.remove(tail) == 4
+    assert int_dll.remove(head) == 1
+    assert list(int_dll) == [2, 3]
+    assert len(int_dll) == 2
+    assert int_dll.peek_back() == 3
+
+
+def test_remove_with_stale_handle(int_dll):
+    node = int_dll.get_head().get_next()
+    int_dll.remove(node)
+    with pytest.raises(ValueError):
+        int_dll.remove(node)
+    with pytest.raises(ValueError):
+        int_dll.insert_after(node, 5)
+
+
+def test_remove_with_foreign_handle(int_dll):
+    other = DoublyLinkedList('', int)
+    other.append(10)
+    other.append(20)
+    node = int_dll.get_head()
+    for action in [other.remove, other.move_to_front,
+                   lambda node: other.insert_after(node, 5),
+                   lambda node: other.insert_before(node, 5)]:
+        with pytest.raises(ValueError):
+            action(node)
+    assert list(int_dll) == [1, 2, 3, 4]
+    assert len(int_dll) == 4
+    assert list(other) == [10, 20]
+    assert len(other) == 2
+
+
+def test_remove_twice_after_reuse(int_dll):
+    node = int_dll.get_head()
+    int_dll.remove(node)
+    new_node = int_dll.append(5)
+    assert new_node is not node
+    with pytest.raises(ValueError):
+        int_dll.remove(node)
+    assert list(int_dll) == [2, 3, 4, 5]
+    assert len(int_dll) == 4
+
+
+def test_deleted_node_is_not_a_handle(int_dll):
+    node = int_dll.get_tail()
+    int_dll.delete(4)
+    int_dll.append(4)
+    with pytest.raises(ValueError):
+        int_dll.move_to_front(node)
+    with pytest.raises(ValueError):
+        int_dll.remove(object())
+    assert list(int_dll) == [1, 2, 3, 4]
+
+
+def test_move_to_front(int_dll):
+    int_dll.move_to_front(int_dll.get_tail())
+    assert list(int_dll) == [4, 1, 2, 3]
+    assert int_dll.peek_back() == 3
+    int_dll.move_to_front(int_dll.get_head().get_next())
+    int_dll.move_to_front(int_dll.get_head())
+    assert list(int_dll) == [1, 4, 2, 3]
+    node, values = int_dll.get_tail(), []
+    while node is not None:
+        values.append(node.get_data())
+        node = node.get_prev()
+    assert values == [3, 2, 4, 1]
+    assert len(int_dll) == 4
+
+
+def test_node_handles_with_full_dll():
+    dll = DoublyLinkedList('', int, 1)
+    node = dll.append(1)
+    with pytest.raises(IndexError):
+        dll.insert_after(node, 2)
+    with pytest.raises(TypeError):
+        dll.insert_before(node, 'a')
+
+
 def test_search(int_dll):
     assert int_dll.search(5) == -1
     assert int_dll.search(3) == 2
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+from PIL import Image, ImageDraw
+
+import dsviz.util.drawer_utils as util
+
+
+## Fixtures
+
+class CountingDraw(object):
+    '''A drawing context that counts how often text is measured.'''
+
+    def __init__(self):
+        self._draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+        self.measured = 0
+
+    def textsize(self, text, font=None):
+        self.measured += 1
+        return self._draw.textsize(text, font=font)
+
+
+@pytest.fixture
+def draw():
+    util.clear_text_cache()
+    yield CountingDraw()
+    util.clear_text_cache()
+
+
+## Text measurement tests
+
+def test_get_textsize_is_memoized(draw):
+    size = util.get_textsize(draw, 'memoized')
+    assert util.get_textsize(draw, 'memoized') == size
+    assert draw.measured == 1
+    util.get_textsize(draw, 'memoized', util.BOLD_FONT)
+    assert draw.measured == 2
+
+
+def test_text_cache_is_bounded(draw, monkeypatch):
+    monkeypatch.setattr(util, 'TEXT_CACHE_SIZE', 2)
+    for text in ['a', 'b', 'a', 'c']:
+        util.get_textsize(draw, text)
+    assert draw.measured == 3
+    util.get_textsize(draw, 'a')
+    assert draw.measured == 3
+    util.get_textsize(draw, 'b')
+    assert draw.measured == 4
+
+
+def test_fit_text_with_fitting_text(draw):
+    text, size = util.fit_text(draw, '123', 100)
+    assert text == '123'
+    assert size == util.get_textsize(draw, '123')
+
+
+@pytest.mark.parametrize('width', [30, 45, 60, 100, 200])
+def test_fit_text_finds_longest_prefix(draw, width):
+    long_text = 'abcdefghijklmnopqrstuvwxyz' * 2
+    text, size = util.fit_text(draw, long_text, width)
+    assert text.endswith(util.ELLIPSIS)
+    assert size[0] <= width
+    prefix = text[:-len(util.ELLIPSIS)]
+    longer = long_text[:len(prefix) + 1] + util.ELLIPSIS
+    assert draw.textsize(longer, font=util.DEFAULT_FONT)[0] > width
+
+
+def test_fit_text_measures_logarithmically(draw):
+    util.fit_text(draw, 'x' * 1000, 60)
+    assert draw.measured <= 2 + 10
+    measured = draw.measured
+    util.fit_text(draw, 'x' * 1000, 60)
+    assert draw.measured == measured
+
+
+def test_fit_text_with_no_room(draw):
+    text, size = util.fit_text(draw, 'abcdef', 1)
+    assert text == util.ELLIPSIS
+
+
+## Sprite tests
+
+from dsviz import SinglyLinkedList
+
+
+def blank_image():
+    return Image.new('RGB', (200, 100), '#FFFFFF')
+
+
+def assert_same_image(a, b):
+    assert list(a.getdata()) == list(b.getdata())
+
+
+@pytest.mark.parametrize('text', ['', '42', 'a long string value'])
+def test_paste_rectangle_with_text_matches_draw(text):
+    drawn, pasted = blank_image(), blank_image()
+    util.draw_rectangle_with_text(ImageDraw.Draw(drawn), text, [10, 20, 60, 70])
+    util.paste_rectangle_with_text(pasted, text, [10, 20, 60, 70])
+    assert_same_image(drawn, pasted)
+
+
+@pytest.mark.parametrize('direction', ['up', 'down', 'left', 'right'])
+def test_paste_arrow_matches_draw(direction):
+    drawn, pasted = blank_image(), blank_image()
+    for image, function in [(drawn, util.draw_arrow), (pasted, util.paste_arrow)]:
+        target = ImageDraw.Draw(image) if image is drawn else image
+        util.draw_rectangle_with_text(ImageDraw.Draw(image), '', [80, 30, 120, 70])
+        function(target, (100, 50), 35, direction, '#FF0000')
+    assert_same_image(drawn, pasted)
+
+
+def test_paste_text_matches_draw():
+    drawn, pasted = blank_image(), blank_image()
+    util.draw_text(ImageDraw.Draw(drawn), 'NULL', (30, 40), bold=True)
+    util.draw_text_centered(ImageDraw.Draw(drawn), 'TOP', [0, 200, 0, 20])
+    util.paste_text(pasted, 'NULL', (30, 40), bold=True)
+    util.paste_text_centered(pasted, 'TOP', [0, 200, 0, 20])
+    assert_same_image(drawn, pasted)
+
+
+def test_rendering_reuses_sprites():
+    sll = SinglyLinkedList('TEST Sprites', int)
+    for value in [1, 2, 1, 2, 1, 2]:
+        sll.append(value)
+    util.SPRITES.clear()
+    util.SPRITES.reset_stats()
+    sll.render()
+    ## Two data cells, the next box, the arrow and the NULL label
+    assert util.SPRITES.misses == 5
+    assert util.SPRITES.hits == 14
+    sll.render()
+    assert util.SPRITES.misses == 5
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+
+import os
+import pytest
+import subprocess
+import sys
+
+import dsviz
+
+
+## Helpers
+
+def imported_modules(code):
+    '''Runs code in a fresh interpreter and returns the modules it imported.'''
+    code += '\nimport sys\nprint(" ".join(sys.modules))'
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=os.path.join(dsviz.PROJECT_ROOT, os.pardir))
+    return set(output.decode().split())
+
+
+## Lazy import tests
+
+def test_import_does_not_load_data_structures_or_pillow():
+    modules = imported_modules('import dsviz')
+    assert 'PIL' not in modules
+    assert 'dsviz.drawers' not in modules
+    assert 'dsviz.data_structures.singly_linked_list' not in modules
+
+
+def test_data_structures_do_not_load_pillow_until_rendered():
+    code = 'import dsviz\nsll = dsviz.SinglyLinkedList("", int)\nsll.append(1)'
+    assert 'PIL' not in imported_modules(code)
+    assert 'PIL' in imported_modules(code + '\nsll.render()')
+
+
+def test_drawer_utils_loads_fonts_lazily():
+    modules = imported_modules('import dsviz.util.drawer_utils')
+    assert 'PIL' not in modules
+
+
+def test_lazy_attributes():
+    from dsviz import AVLTree
+    assert dsviz.AVLTree is AVLTree
+    assert 'SkipList' in dir(dsviz)
+    assert set(dsviz.data_structures.__all__) <= set(dsviz.__all__)
+    with pytest.raises(AttributeError):
+        dsviz.NotADataStructure
+    with pytest.raises(AttributeError):
+        dsviz.data_structures.NotADataStructure
+
+
+def test_font_constants():
+    import dsviz.util.drawer_utils as util
+    assert util.DEFAULT_FONT is util.get_font()
+    assert util.BOLD_FONT is util.get_font(bold=True)
+    assert util.ROBOTO_REGULAR_14 is util.DEFAULT_FONT
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+
+from dsviz import LRUCache
+
+
+## Fixtures
+
+@pytest.fixture
+def empty_int_cache():
+    return LRUCache('', int, 3)
+
+
+@pytest.fixture
+def full_str_cache():
+    cache = LRUCache('', str, 3)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    return cache
+
+
+## Data structures tests
+
+def test_constructor_with_default_capacity():
+    cache = LRUCache('my cache', str)
+    assert cache.max_size == 16
+    assert cache.is_empty()
+
+
+def test_constructor_with_large_capacity():
+    cache = LRUCache('my cache', int, 100000)
+    assert cache.max_size == 100000
+
+
+def test_constructor_with_invalid_capacity():
+    with pytest.raises(IndexError):
+        LRUCache('my cache', int, 0)
+
+
+def test_constructor_with_invalid_type():
+    with pytest.raises(TypeError):
+        LRUCache('my cache', list)
+
+
+def test_put_and_get(empty_int_cache):
+    empty_int_cache.put(1, 'one')
+    empty_int_cache.put(2, [2])
+    assert empty_int_cache.get(1) == 'one'
+    assert empty_int_cache.get(2) == [2]
+    assert empty_int_cache.get(3) is None
+    assert empty_int_cache.get(3, 'missing') == 'missing'
+    assert len(empty_int_cache) == 2
+
+
+def test_put_with_invalid_type(empty_int_cache):
+    with pytest.raises(TypeError):
+        empty_int_cache.put('a', 1)
+    with pytest.raises(TypeError):
+        empty_int_cache.get('a')
+
+
+def test_put_existing_key(full_str_cache):
+    full_str_cache.put('a', 10)
+    assert len(full_str_cache) == 3
+    assert list(full_str_cache) == ['a', 'c', 'b']
+    assert full_str_cache.get('a') == 10
+
+
+def test_eviction(full_str_cache):
+    full_str_cache.get('a')
+    full_str_cache.put('d', 4)
+    assert 'b' not in full_str_cache
+    assert list(full_str_cache) == ['d', 'a', 'c']
+    assert full_str_cache.evictions == 1
+    assert full_str_cache.evict() == ('c', 3)
+    assert full_str_cache.evictions == 2
+
+
+def test_evict_with_empty_cache(empty_int_cache):
+    with pytest.raises(IndexError):
+        empty_int_cache.evict()
+
+
+def test_delete(full_str_cache):
+    full_str_cache.delete('b')
+    full_str_cache.delete('z')
+    assert list(full_str_cache) == ['c', 'a']
+    full_str_cache.put('d', 4)
+    full_str_cache.put('e', 5)
+    assert list(full_str_cache) == ['e', 'd', 'c']
+
+
+def test_stats(full_str_cache):
+    assert full_str_cache.hit_rate() == 0.0
+    full_str_cache.get('a')
+    full_str_cache.get('a')
+    full_str_cache.get('z')
+    full_str_cache.get('b')
+    assert full_str_cache.hits == 3
+    assert full_str_cache.misses == 1
+    assert full_str_cache.hit_rate() == 0.75
+    full_str_cache.reset_stats()
+    assert full_str_cache.hits == full_str_cache.misses == 0
+
+
+def test_unbounded_cache():
+    cache = LRUCache('', int, None)
+    for key in range(1000):
+        cache.put(key, key * key)
+    assert len(cache) == 1000
+    assert cache.evictions == 0
+    assert cache.get(999) == 998001
+
+
+def test_many_lookups():
+    cache = LRUCache('', int, 64)
+    for key in range(10000):
+        if cache.get(key % 100) is None:
+            cache.put(key % 100, key)
+    assert len(cache) == 64
+    assert cache.hits + cache.misses == 10000
+    assert cache.misses - cache.evictions == 64
+
+
+## Render tests
+
+from dsviz import PROJECT_ROOT
+
+import os
+import random
+
+
+@pytest.fixture
+def random_int_cache():
+    cache = LRUCache('TEST Example Integer LRU Cache', int, 8)
+    for _ in range(random.randint(1, 32)):
+        key = random.randint(0, 20)
+        if cache.get(key) is None:
+            cache.put(key, key)
+    return cache
+
+
+@pytest.fixture
+def save_path():
+    return os.path.join(PROJECT_ROOT, os.pardir, 'images')
+
+
+def test_render_int_cache(random_int_cache, save_path):
+    random_int_cache.render(save_path)
+
+
+def test_render_large_cache(save_path):
+    cache = LRUCache('TEST Example Large LRU Cache', int, 1000)
+    for key in range(1000):
+        cache.put(key, key)
+    image = cache.render(save_path)
+    assert image.size[0] < 3000
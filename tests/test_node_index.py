@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+from dsviz.containers import NodeIndex
+from dsviz.nodes import DLLNode
+
+
+## Fixtures
+
+@pytest.fixture
+def node_index():
+    index = NodeIndex()
+    for value in [1, 2, 2, 3]:
+        index.add(DLLNode(value))
+    return index
+
+
+## Container tests
+
+def test_add(node_index):
+    assert len(node_index) == 3
+    assert 2 in node_index
+    assert 4 not in node_index
+    assert len(node_index.get(2)) == 2
+    assert node_index.get(4) == ()
+
+
+def test_remove(node_index):
+    first, second = node_index.get(2)
+    node_index.remove(first)
+    assert list(node_index.get(2)) == [second]
+    node_index.remove(second)
+    assert 2 not in node_index
+    assert len(node_index) == 2
+
+
+def test_clear(node_index):
+    node_index.clear()
+    assert len(node_index) == 0
+    assert 1 not in node_index
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+from dsviz.nodes import BSTNode, DLLNode, NodePool, SLLNode
+
+
+## Fixtures
+
+@pytest.fixture
+def bst_node_pool():
+    return NodePool(BSTNode, 2)
+
+
+## Node tests
+
+def test_nodes_are_slotted():
+    for node in [BSTNode(1), DLLNode(1), SLLNode(1)]:
+        assert not hasattr(node, '__dict__')
+        with pytest.raises(AttributeError):
+            node.foo = 1
+
+
+## Node pool tests
+
+def test_acquire(bst_node_pool):
+    node = bst_node_pool.acquire(5)
+    assert isinstance(node, BSTNode)
+    assert node.get_data() == 5
+    assert node.get_height() == 1
+
+
+def test_release(bst_node_pool):
+    node = bst_node_pool.acquire(5)
+    node.set_left(BSTNode(3))
+    node.set_height(2)
+    bst_node_pool.release(node)
+    assert len(bst_node_pool) == 1
+    reused = bst_node_pool.acquire(7)
+    assert reused is node
+    assert reused.get_data() == 7
+    assert reused.get_left() == None
+    assert reused.get_height() == 1
+    assert len(bst_node_pool) == 0
+
+
+def test_release_with_full_pool(bst_node_pool):
+    for _ in range(3):
+        bst_node_pool.release(BSTNode(1))
+    assert len(bst_node_pool) == 2
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+
+import pytest
+import random
+
+
+from dsviz import RedBlackTree
+from dsviz.nodes.bst_node import BLACK, RED
+
+
+## Helpers
+
+def check_red_black(node, parent=None):
+    '''Returns the black height of a subtree after checking its red-black
+    invariants, parent pointers and subtree sizes.'''
+    if node is None:
+        return 1
+    assert node.get_parent() is parent
+    assert node.get_color() in (RED, BLACK)
+    if parent is None:
+        assert node.get_color() == BLACK
+    if node.get_color() == RED:
+        for child in [node.get_left(), node.get_right()]:
+            assert child is None or child.get_color() == BLACK
+    left_height = check_red_black(node.get_left(), node)
+    right_height = check_red_black(node.get_right(), node)
+    assert left_height == right_height
+    left_size = node.get_left().get_size() if node.get_left() else 0
+    right_size = node.get_right().get_size() if node.get_right() else 0
+    assert node.get_size() == 1 + left_size + right_size
+    return left_height + (node.get_color() == BLACK)
+
+
+def count_rotations(tree):
+    '''Wraps the rotations of a tree so that they are counted.'''
+    counts = []
+    for name in ['_rotate_left', '_rotate_right']:
+        rotate = getattr(tree, name)
+        def counted(node, rotate=rotate):
+            counts.append(node)
+            rotate(node)
+        setattr(tree, name, counted)
+    return counts
+
+
+## Fixtures
+
+@pytest.fixture
+def empty_int_rb_tree():
+    return RedBlackTree('', int)
+
+
+@pytest.fixture
+def full_int_rb_tree():
+    rb_tree = RedBlackTree('', int, 6)
+    for value in [10, 20, 30, 40, 50, 25]:
+        rb_tree.insert(value)
+    return rb_tree
+
+
+## Data structures tests
+
+def test_constructor_with_default_size_limit():
+    int_rb_tree = RedBlackTree('my int rb tree', int)
+    assert int_rb_tree.max_size == 32
+
+
+def test_constructor_with_unbounded_size_limit():
+    int_rb_tree = RedBlackTree('my int rb tree', int, None)
+    assert int_rb_tree.is_unbounded()
+
+
+def test_constructor_with_invalid_type():
+    with pytest.raises(TypeError):
+        RedBlackTree('my bool rb tree', bool)
+
+
+def test_insert(full_int_rb_tree):
+    assert len(full_int_rb_tree) == 6
+    assert list(full_int_rb_tree) == [10, 20, 25, 30, 40, 50]
+    assert full_int_rb_tree.get_root().get_data() == 20
+    check_red_black(full_int_rb_tree.get_root())
+
+
+def test_insert_with_invalid_type(empty_int_rb_tree):
+    with pytest.raises(TypeError):
+        empty_int_rb_tree.insert('a')
+
+
+def test_insert_with_full_rb_tree(full_int_rb_tree):
+    with pytest.raises(IndexError):
+        full_int_rb_tree.insert(60)
+
+
+def test_delete(full_int_rb_tree):
+    for value in [20, 10, 35, 50]:
+        full_int_rb_tree.delete(value)
+    assert list(full_int_rb_tree) == [25, 30, 40]
+    check_red_black(full_int_rb_tree.get_root())
+    for value in [25, 30, 40]:
+        full_int_rb_tree.delete(value)
+    assert full_int_rb_tree.is_empty()
+    assert full_int_rb_tree.get_root() is None
+
+
+def test_search(full_int_rb_tree):
+    assert full_int_rb_tree.search(25)
+    assert not full_int_rb_tree.search(26)
+
+
+def test_shared_queries(full_int_rb_tree):
+    assert full_int_rb_tree[2] == 25
+    assert full_int_rb_tree.rank(40) == 4
+    assert list(full_int_rb_tree.irange(20, 40)) == [20, 25, 30, 40]
+    assert list(reversed(full_int_rb_tree)) == [50, 40, 30, 25, 20, 10]
+    assert full_int_rb_tree.floor(26) == 25
+
+
+def test_random_operations():
+    rb_tree = RedBlackTree('', int, None)
+    rotations = count_rotations(rb_tree)
+    expected = []
+    for _ in range(3000):
+        value = random.randint(0, 300)
+        del rotations[:]
+        if random.random() < 0.55:
+            rb_tree.insert(value)
+            expected.append(value)
+            assert len(rotations) <= 2
+        else:
+            rb_tree.delete(value)
+            if value in expected:
+                expected.remove(value)
+            assert len(rotations) <= 3
+    check_red_black(rb_tree.get_root())
+    assert list(rb_tree) == sorted(expected)
+    assert len(rb_tree) == len(expected)
+
+
+def test_sorted_inserts_stay_balanced():
+    rb_tree = RedBlackTree('', int, None)
+    for value in range(1024):
+        rb_tree.insert(value)
+    check_red_black(rb_tree.get_root())
+    depth, node = 0, rb_tree.get_root()
+    while node is not None:
+        depth, node = depth + 1, node.get_right()
+    assert depth <= 2 * 11
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 3, 10, 31, 32, 100])
+def test_from_iterable(count):
+    rb_tree = RedBlackTree.from_iterable('', int, range(count), None)
+    assert list(rb_tree) == list(range(count))
+    check_red_black(rb_tree.get_root())
+    rb_tree.insert(count // 2)
+    rb_tree.delete(0)
+    check_red_black(rb_tree.get_root())
+
+
+## Render tests
+
+from dsviz import PROJECT_ROOT
+
+import os
+
+
+@pytest.fixture
+def random_int_rb_tree():
+    rb_tree = RedBlackTree('TEST Example Integer Red Black Tree', int)
+    for _ in range(random.randint(1, 32)):
+        rb_tree.insert(random.randint(-999, 999))
+    return rb_tree
+
+
+@pytest.fixture
+def save_path():
+    return os.path.join(PROJECT_ROOT, os.pardir, 'images')
+
+
+def test_render_int_rb_tree(random_int_rb_tree, save_path):
+    random_int_rb_tree.render(save_path)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+from dsviz.containers import RingBuffer
+
+
+## Fixtures
+
+@pytest.fixture
+def empty_buffer():
+    return RingBuffer(4)
+
+
+@pytest.fixture
+def wrapped_buffer():
+    buf = RingBuffer(4)
+    buf.push_back(1)
+    buf.push_back(2)
+    buf.push_back(3)
+    buf.pop_front()
+    buf.pop_front()
+    buf.push_back(4)
+    buf.push_back(5)
+    return buf
+
+
+## Container tests
+
+def test_push_back(empty_buffer):
+    empty_buffer.push_back(1)
+    empty_buffer.push_back(2)
+    assert len(empty_buffer) == 2
+    assert list(empty_buffer) == [1, 2]
+
+
+def test_push_front(empty_buffer):
+    empty_buffer.push_front(1)
+    empty_buffer.push_front(2)
+    empty_buffer.push_back(3)
+    assert list(empty_buffer) == [2, 1, 3]
+    assert empty_buffer.peek_front() == 2
+    assert empty_buffer.peek_back() == 3
+
+
+def test_push_with_full_buffer(wrapped_buffer):
+    wrapped_buffer.push_front(2)
+    with pytest.raises(IndexError):
+        wrapped_buffer.push_back(6)
+    with pytest.raises(IndexError):
+        wrapped_buffer.push_front(6)
+
+
+def test_pop(wrapped_buffer):
+    assert list(wrapped_buffer) == [3, 4, 5]
+    assert wrapped_buffer.pop_back() == 5
+    assert wrapped_buffer.pop_front() == 3
+    assert wrapped_buffer.pop_front() == 4
+    assert len(wrapped_buffer) == 0
+
+
+def test_pop_with_empty_buffer(empty_buffer):
+    with pytest.raises(IndexError):
+        empty_buffer.pop_front()
+    with pytest.raises(IndexError):
+        empty_buffer.pop_back()
+    with pytest.raises(IndexError):
+        empty_buffer.peek_front()
+
+
+def test_getitem(wrapped_buffer):
+    assert wrapped_buffer[0] == 3
+    assert wrapped_buffer[2] == 5
+    assert wrapped_buffer[-1] == 5
+    with pytest.raises(IndexError):
+        wrapped_buffer[3]
+
+
+def test_growth():
+    buf = RingBuffer()
+    for i in range(100):
+        buf.push_front(i)
+    for i in range(100):
+        buf.push_back(i)
+    assert len(buf) == 200
+    assert list(buf) == list(range(99, -1, -1)) + list(range(100))
+
+
+def test_export():
+    buf = RingBuffer(4, int)
+    buf.push_back(1)
+    buf.push_back(2)
+    buf.push_front(0)
+    view = buf.export()
+    assert view.format == 'q'
+    assert view.tolist() == [0, 1, 2]
+    assert list(buf) == [0, 1, 2]
+
+
+def test_export_with_list_storage(wrapped_buffer):
+    with pytest.raises(TypeError):
+        wrapped_buffer.export()
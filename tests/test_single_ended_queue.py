@@ -45,6 +45,15 @@ def test_constructor_with_excessive_size_limit():
     assert bool_queue.max_size == 16
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_queue = SingleEndedQueue('my int queue', int, None)
+    assert int_queue.max_size is None
+    assert int_queue.is_unbounded()
+    for i in range(100):
+        int_queue.enqueue(i)
+    assert len(int_queue) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         float_queue = SingleEndedQueue('my float queue', float, -1)
@@ -72,6 +81,14 @@ def test_enqueue_with_full_queue(full_int_queue):
         full_int_queue.enqueue(3)
 
 
+def test_enqueue_with_overfilled_queue(full_int_queue):
+    with full_int_queue.unchecked():
+        full_int_queue.enqueue(5)
+    assert list(full_int_queue) == [1, 2, 3, 4, 5]
+    with pytest.raises(IndexError, match='max size limit'):
+        full_int_queue.enqueue(6)
+
+
 def test_dequeue(full_int_queue):
     assert len(full_int_queue) == 4
     val1 = full_int_queue.dequeue()
@@ -102,6 +119,18 @@ def test_peek_with_empty_queue(empty_int_queue):
         empty_int_queue.peek()
 
 
+def test_export(full_int_queue):
+    full_int_queue.dequeue()
+    full_int_queue.enqueue(5)
+    view = full_int_queue.export()
+    assert view.tolist() == [2, 3, 4, 5]
+
+
+def test_export_with_str_queue(empty_str_queue):
+    with pytest.raises(TypeError):
+        empty_str_queue.export()
+
+
 ## Render tests
 
 from dsviz import PROJECT_ROOT
@@ -55,6 +55,15 @@ def test_constructor_with_excessive_size_limit():
     assert float_sll.max_size == 16
 
 
+def test_constructor_with_unbounded_size_limit():
+    int_sll = SinglyLinkedList('my int sll', int, None)
+    assert int_sll.max_size is None
+    assert int_sll.is_unbounded()
+    for i in range(100):
+        int_sll.append(i)
+    assert len(int_sll) == 100
+
+
 def test_constructor_with_invalid_size_limit():
     with pytest.raises(IndexError):
         int_sll = SinglyLinkedList('my int sll', int, -1)
@@ -65,6 +74,20 @@ def test_constructor_with_invalid_type():
         set_sll = SinglyLinkedList('my set sll', set)
 
 
+def test_constructor_with_keyword_arguments():
+    sll = SinglyLinkedList(name='my sll', data_type=int, max_size=None)
+    assert sll.data_type == int
+    assert sll.is_unbounded()
+    assert SinglyLinkedList.__init__.__name__ == '__init__'
+
+
+def test_constructor_with_missing_arguments():
+    with pytest.raises(TypeError):
+        SinglyLinkedList(name='my sll')
+    with pytest.raises(TypeError):
+        SinglyLinkedList(name='my sll', data_type=set)
+
+
 def test_prepend(empty_int_sll):
     empty_int_sll.prepend(5)
     empty_int_sll.prepend(3)
@@ -149,6 +172,75 @@ def test_delete_with_invalid_type(int_sll):
         int_sll.delete('a')
 
 
+def test_delete_tail(int_sll):
+    int_sll.delete(4)
+    int_sll.append(5)
+    assert list(int_sll) == [1, 2, 3, 5]
+    assert int_sll.get_tail().get_data() == 5
+
+
+def test_from_iterable():
+    sll = SinglyLinkedList.from_iterable('', str, ['a', 'b', 'c'])
+    assert list(sll) == ['a', 'b', 'c']
+    assert sll.get_tail().get_data() == 'c'
+
+
+def test_from_iterable_with_full_sll():
+    with pytest.raises(IndexError):
+        SinglyLinkedList.from_iterable('', int, range(5), 4)
+
+
+def test_extend_with_invalid_type(int_sll):
+    with pytest.raises(TypeError):
+        int_sll.extend([6, 'a'])
+    assert list(int_sll) == [1, 2, 3, 4]
+
+
+def test_unchecked(empty_int_sll):
+    with empty_int_sll.unchecked() as sll:
+        assert sll.trusted
+        sll.append(1)
+        sll.extend([2, 3])
+    assert not empty_int_sll.trusted
+    assert list(empty_int_sll) == [1, 2, 3]
+    with pytest.raises(TypeError):
+        empty_int_sll.append('a')
+
+
+def test_unchecked_with_overfilled_sll():
+    sll = SinglyLinkedList.from_iterable('', int, range(4), 4)
+    with sll.unchecked():
+        sll.append(4)
+        sll.prepend(-1)
+    assert len(sll) == 6
+    with pytest.raises(IndexError):
+        sll.append(5)
+    with pytest.raises(IndexError):
+        sll.prepend(5)
+    with pytest.raises(IndexError):
+        sll.insert(1, 5)
+
+
+def test_delete_with_empty_sll(empty_int_sll):
+    empty_int_sll.delete(1)
+    assert len(empty_int_sll) == 0
+
+
+def test_indexed_sll():
+    sll = SinglyLinkedList.from_iterable('', int, [1, 2, 3, 2], 16, True)
+    sll.prepend(0)
+    sll.insert(2, 5)
+    assert 5 in sll
+    assert 4 not in sll
+    assert sll.search(4) == -1
+    sll.delete(2)
+    assert 2 in sll
+    sll.delete(2)
+    assert 2 not in sll
+    sll.delete(2)
+    assert list(sll) == [0, 1, 5, 3]
+
+
 def test_search(int_sll):
     assert int_sll.search(5) == -1
     assert int_sll.search(3) == 2
@@ -216,3 +308,13 @@ def test_render_str_sll(random_str_sll, save_path):
 
 def test_render_float_sll(random_float_sll, save_path):
     random_float_sll.render(save_path)
+
+
+def test_render_unbounded_sll(save_path):
+    sll = SinglyLinkedList('TEST Example Unbounded SLL', int, None)
+    full_sll = SinglyLinkedList('', int)
+    for i in range(1000):
+        sll.append(i)
+    for i in range(16):
+        full_sll.append(i)
+    assert sll.render(save_path).size == full_sll.render().size
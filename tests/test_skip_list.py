@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+
+import pytest
+import random
+
+
+from dsviz import SkipList
+
+
+## Fixtures
+
+@pytest.fixture
+def empty_int_skip_list():
+    return SkipList('', int)
+
+
+@pytest.fixture
+def full_int_skip_list():
+    skip_list = SkipList('', int, 6)
+    for value in [30, 10, 50, 20, 40, 25]:
+        skip_list.insert(value)
+    return skip_list
+
+
+## Data structures tests
+
+def test_constructor_with_default_size_limit():
+    int_skip_list = SkipList('my int skip list', int)
+    assert int_skip_list.max_size == 16
+
+
+def test_constructor_with_unbounded_size_limit():
+    int_skip_list = SkipList('my int skip list', int, None)
+    assert int_skip_list.is_unbounded()
+    for value in range(100):
+        int_skip_list.insert(value)
+    assert len(int_skip_list) == 100
+
+
+def test_constructor_with_invalid_type():
+    with pytest.raises(TypeError):
+        SkipList('my bool skip list', bool)
+
+
+def test_constructor_with_invalid_probability():
+    with pytest.raises(ValueError):
+        SkipList('my int skip list', int, 16, 1.0)
+
+
+def test_insert(empty_int_skip_list):
+    for value in [5, 1, 3, 3]:
+        empty_int_skip_list.insert(value)
+    assert list(empty_int_skip_list) == [1, 3, 3, 5]
+    assert len(empty_int_skip_list) == 4
+
+
+def test_insert_with_invalid_type(empty_int_skip_list):
+    with pytest.raises(TypeError):
+        empty_int_skip_list.insert('a')
+
+
+def test_insert_with_full_skip_list(full_int_skip_list):
+    with pytest.raises(IndexError):
+        full_int_skip_list.insert(60)
+
+
+def test_delete(full_int_skip_list):
+    full_int_skip_list.delete(25)
+    full_int_skip_list.delete(10)
+    full_int_skip_list.delete(35)
+    assert list(full_int_skip_list) == [20, 30, 40, 50]
+    assert len(full_int_skip_list) == 4
+
+
+def test_delete_with_invalid_type(full_int_skip_list):
+    with pytest.raises(TypeError):
+        full_int_skip_list.delete(1.5)
+
+
+def test_search(full_int_skip_list):
+    assert full_int_skip_list.search(40)
+    assert not full_int_skip_list.search(45)
+    assert 40 in full_int_skip_list
+    assert 'a' not in full_int_skip_list
+
+
+def test_irange(full_int_skip_list):
+    assert list(full_int_skip_list.irange(20, 40)) == [20, 25, 30, 40]
+    assert list(full_int_skip_list.irange(20, 40, (False, False))) == [25, 30]
+    assert list(full_int_skip_list.irange(maximum=20)) == [10, 20]
+    assert list(full_int_skip_list.irange(45)) == [50]
+    assert list(full_int_skip_list.range(10, 30)) == [10, 20, 25]
+    with pytest.raises(TypeError):
+        full_int_skip_list.irange('a')
+
+
+def test_random_operations():
+    skip_list = SkipList('', int, None)
+    expected = []
+    for _ in range(2000):
+        value = random.randint(0, 200)
+        if random.random() < 0.6:
+            skip_list.insert(value)
+            expected.append(value)
+        elif value in expected:
+            skip_list.delete(value)
+            expected.remove(value)
+    expected.sort()
+    assert list(skip_list) == expected
+    assert list(skip_list.irange(50, 150)) == [value for value in expected if 50 <= value <= 150]
+    for level in range(1, skip_list.get_level()):
+        node, values = skip_list.header.get_next(level), []
+        while node is not None:
+            values.append(node.get_data())
+            node = node.get_next(level)
+        assert values == sorted(values)
+
+
+def test_from_iterable():
+    skip_list = SkipList.from_iterable('', str, 'skiplist', 16, 0.25)
+    assert list(skip_list) == sorted('skiplist')
+    skip_list.insert('a')
+    skip_list.delete('s')
+    assert list(skip_list) == ['a', 'i', 'i', 'k', 'l', 'p', 's', 't']
+
+
+def test_from_iterable_with_excessive_size():
+    with pytest.raises(IndexError):
+        SkipList.from_iterable('', int, range(17))
+
+
+## Render tests
+
+from dsviz import PROJECT_ROOT
+
+import os
+import string
+
+
+@pytest.fixture
+def random_int_skip_list():
+    skip_list = SkipList('TEST Example Integer Skip List', int)
+    for _ in range(random.randint(1, 16)):
+        skip_list.insert(random.randint(-999, 999))
+    return skip_list
+
+
+@pytest.fixture
+def random_str_skip_list():
+    skip_list = SkipList('TEST Example String Skip List', str)
+    for _ in range(random.randint(1, 16)):
+        random_string = ''.join(
+                random.choice(string.ascii_letters + string.digits)
+                for _ in range(random.randint(1, 5)))
+        skip_list.insert(random_string)
+    return skip_list
+
+
+@pytest.fixture
+def save_path():
+    return os.path.join(PROJECT_ROOT, os.pardir, 'images')
+
+
+def test_render_int_skip_list(random_int_skip_list, save_path):
+    random_int_skip_list.render(save_path)
+
+
+def test_render_str_skip_list(random_str_skip_list, save_path):
+    random_str_skip_list.render(save_path)
+
+
+def test_render_empty_skip_list(empty_int_skip_list, save_path):
+    empty_int_skip_list.render(save_path)
+
+
+def test_render_unbounded_skip_list(save_path):
+    skip_list = SkipList.from_iterable('TEST Example Unbounded Skip List', int, range(1000), None)
+    image = skip_list.render(save_path)
+    assert image.size[0] < 2000
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+
+import pytest
+
+from dsviz.containers import SpriteCache
+
+
+## Fixtures
+
+@pytest.fixture
+def sprite_cache():
+    return SpriteCache(2)
+
+
+## Sprite cache tests
+
+def test_constructor_with_invalid_size():
+    with pytest.raises(ValueError):
+        SpriteCache(0)
+
+
+def test_get_renders_once(sprite_cache):
+    rendered = []
+    def render():
+        rendered.append(1)
+        return 'tile'
+    assert sprite_cache.get('a', render) == 'tile'
+    assert sprite_cache.get('a', render) == 'tile'
+    assert len(rendered) == 1
+    assert (sprite_cache.hits, sprite_cache.misses) == (1, 1)
+    assert sprite_cache.hit_rate() == 0.5
+
+
+def test_least_recently_used_tile_is_evicted(sprite_cache):
+    for key in ['a', 'b', 'a', 'c']:
+        sprite_cache.get(key, lambda: key)
+    assert 'a' in sprite_cache
+    assert 'b' not in sprite_cache
+    assert len(sprite_cache) == 2
+    assert sprite_cache.evictions == 1
+
+
+def test_reset_stats_and_clear(sprite_cache):
+    assert sprite_cache.hit_rate() == 0.0
+    sprite_cache.get('a', lambda: 'a')
+    sprite_cache.get('a', lambda: 'a')
+    sprite_cache.reset_stats()
+    assert (sprite_cache.hits, sprite_cache.misses, sprite_cache.evictions) == (0, 0, 0)
+    sprite_cache.clear()
+    assert len(sprite_cache) == 0
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+
+import pytest
+import random
+
+from dsviz import BinarySearchTree, RedBlackTree
+from dsviz.util.tree_layout import NIL, heap_layout, heap_tree, index_tree, layout
+
+
+## Helpers
+
+def check_layout(left, right, xs, depths):
+    '''Checks that no two nodes on a level are closer than one unit, that
+    each level is ordered left to right and that parents are centered over
+    their children.'''
+    levels = {}
+    for index, depth in enumerate(depths):
+        levels.setdefault(depth, []).append(xs[index])
+    for row in levels.values():
+        for a, b in zip(row, row[1:]):
+            assert b - a >= 1 - 1e-9
+    for index in range(len(left)):
+        l, r = left[index], right[index]
+        if l != NIL:
+            assert depths[l] == depths[index] + 1
+            assert xs[l] < xs[index]
+        if r != NIL:
+            assert xs[r] > xs[index]
+        if l != NIL and r != NIL:
+            assert xs[index] == pytest.approx((xs[l] + xs[r]) / 2)
+    assert min(xs) == 0
+
+
+## Layout tests
+
+def test_layout_of_empty_tree():
+    assert index_tree(None) == ([], [], [])
+    assert layout([], []) == ([], [])
+
+
+def test_layout_of_single_node():
+    assert layout([NIL], [NIL]) == ([0.0], [0])
+
+
+def test_index_tree():
+    tree = BinarySearchTree('', int)
+    for value in [20, 10, 30, 25]:
+        tree.insert(value)
+    nodes, left, right = index_tree(tree.get_root())
+    assert [node.get_data() for node in nodes] == [20, 10, 30, 25]
+    assert left == [1, NIL, 3, NIL]
+    assert right == [2, NIL, NIL, NIL]
+
+
+def test_index_tree_with_limit():
+    tree = RedBlackTree.from_iterable('', int, range(31), None)
+    nodes, left, right = index_tree(tree.get_root(), 10)
+    assert len(nodes) == 7
+    assert left[3:] == [NIL] * 4
+    assert len(index_tree(tree.get_root(), 0)[0]) == 1
+
+
+def test_heap_tree():
+    assert heap_tree(4) == ([1, 3, NIL, NIL], [2, NIL, NIL, NIL])
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_layout_of_random_trees(seed):
+    rng = random.Random(seed)
+    tree = BinarySearchTree('', int, None)
+    for _ in range(rng.randint(1, 300)):
+        tree.insert(rng.randint(0, 1000))
+    nodes, left, right = index_tree(tree.get_root())
+    check_layout(left, right, *layout(left, right))
+
+
+def test_layout_of_heap():
+    left, right = heap_tree(1000)
+    xs, depths = layout(left, right)
+    check_layout(left, right, xs, depths)
+    assert max(depths) == 9
+
+
+def test_layout_of_degenerate_tree():
+    tree = BinarySearchTree('', int, None)
+    for value in range(2000):
+        tree.insert(value)
+    nodes, left, right = index_tree(tree.get_root())
+    xs, depths = layout(left, right)
+    check_layout(left, right, xs, depths)
+    assert max(depths) == 1999
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 6, 7, 8, 100, 1023])
+def test_heap_layout(count):
+    left, right = heap_tree(count)
+    xs, depths = heap_layout(count)
+    check_layout(left, right, xs, depths)
+    assert depths[-1] == count.bit_length() - 1
+
+
+def test_heap_layout_of_full_heap_matches_layout():
+    assert heap_layout(15) == layout(*heap_tree(15))